@@ -0,0 +1,155 @@
+"""
+Import benchmark and block-length check for AudioImporter.
+
+Writes a synthetic source file (speech-like bursts of tone with short
+pauses, or a constant tone), imports it with the real AudioImporter and reports wall time,
+peak memory and the length of every created block. Exits with status 1
+if any block except the last falls outside
+[block_seconds - silence window, block_seconds].
+
+Usage:
+    python -m benchmarks.import_benchmark --seconds 1300
+    python -m benchmarks.import_benchmark --seconds 95 --block-seconds 30
+    python -m benchmarks.import_benchmark --seconds 95 --block-seconds 30 --signal tone
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import soundfile as sf
+
+from src.config import BLOCK_DURATION_MINUTES, IMPORT_SILENCE_WINDOW_SECONDS
+from src.importer import AudioImporter
+
+# Tolerance for block lengths; resampled blocks round to whole output samples
+_LENGTH_TOLERANCE = 0.01
+
+
+def write_source(path: str, seconds: float, sample_rate: int, channels: int, signal_type: str = "speech"):
+    """
+    Writes a test file in pieces, so long sources fit in memory: speech-like
+    bursts with pauses, or (`signal_type="tone"`) a constant sine without any.
+    """
+    rng = np.random.default_rng(0)
+    piece_frames = sample_rate * 10
+    total = int(seconds * sample_rate)
+    with sf.SoundFile(path, "w", sample_rate, channels, subtype="PCM_16") as out:
+        written = 0
+        while written < total:
+            frames = min(piece_frames, total - written)
+            t = (written + np.arange(frames)) / sample_rate
+            signal = 0.3 * np.sin(2 * np.pi * 220 * t)
+            if signal_type != "tone":
+                # 4 s of tone and noise, then 0.6 s of near silence
+                voiced = (t % 4.6) < 4.0
+                signal = signal + 0.05 * rng.standard_normal(frames)
+                signal = np.where(voiced, signal, 0.001 * rng.standard_normal(frames))
+            out.write(np.repeat(signal[:, None], channels, axis=1).astype(np.float32))
+            written += frames
+
+
+def block_lengths(paths: List[str]) -> List[float]:
+    """Returns the length of each block in seconds."""
+    lengths = []
+    for path in paths:
+        info = sf.info(path)
+        lengths.append(info.frames / info.samplerate)
+    return lengths
+
+
+def check_lengths(lengths: List[float], block_seconds: float, window: float) -> List[str]:
+    """Returns a message for every block (except the last) outside the allowed range."""
+    low, high = block_seconds - window - _LENGTH_TOLERANCE, block_seconds + _LENGTH_TOLERANCE
+    return [
+        f"block {i + 1}: {length:.2f}s not in [{block_seconds - window:.2f}, {block_seconds:.2f}]"
+        for i, length in enumerate(lengths[:-1])
+        if not low <= length <= high
+    ]
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Runs the benchmark and returns a report dictionary."""
+    window = min(IMPORT_SILENCE_WINDOW_SECONDS, args.block_seconds / 2) if args.split_on_silence else 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, f"source.{args.format}")
+        write_started = time.perf_counter()
+        write_source(source, args.seconds, args.sample_rate, args.channels, args.signal)
+        write_seconds = time.perf_counter() - write_started
+
+        importer = AudioImporter(
+            os.path.join(directory, "blocks"),
+            block_seconds=args.block_seconds,
+            split_on_silence=args.split_on_silence,
+            speech_profile=args.speech_profile,
+            workers=args.workers,
+        )
+        started = time.perf_counter()
+        paths = importer.import_file(source)
+        wall = time.perf_counter() - started
+        lengths = block_lengths(paths)
+
+    return {
+        "source_seconds": args.seconds,
+        "block_seconds": args.block_seconds,
+        "speech_profile": args.speech_profile,
+        "write_seconds": round(write_seconds, 3),
+        "wall_seconds": round(wall, 3),
+        "realtime_factor": round(args.seconds / wall, 1) if wall else 0.0,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "blocks": [round(length, 2) for length in lengths],
+        "total_seconds": round(sum(lengths), 2),
+        "length_errors": check_lengths(lengths, args.block_seconds, window),
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """Prints a human-readable report."""
+    print(f"Source:              {report['source_seconds']}s, blocks of {report['block_seconds']}s")
+    print(f"Speech profile:      {report['speech_profile']}")
+    print(f"Source write time:   {report['write_seconds']:.3f}s")
+    print(f"Import wall time:    {report['wall_seconds']:.3f}s ({report['realtime_factor']}x realtime)")
+    print(f"Peak RSS:            {report['peak_rss_mb']} MB")
+    print(f"Blocks ({len(report['blocks'])}):         {report['blocks']}")
+    print(f"Imported length:     {report['total_seconds']}s")
+    if report["length_errors"]:
+        print(f"Length errors ({len(report['length_errors'])}):")
+        for error in report["length_errors"]:
+            print(f"  {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audio import benchmark and block-length check")
+    parser.add_argument("--seconds", type=float, default=1300.0, help="Length of the synthetic source")
+    parser.add_argument("--block-seconds", type=float, default=BLOCK_DURATION_MINUTES * 60)
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--format", default="wav", help="Source container (wav, flac, ogg)")
+    parser.add_argument("--signal", choices=["speech", "tone"], default="speech",
+                        help="Speech-like bursts with pauses, or a constant tone")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--no-split-on-silence", dest="split_on_silence", action="store_false")
+    parser.add_argument("--speech-profile", action="store_true")
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this JSON file")
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if report["length_errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
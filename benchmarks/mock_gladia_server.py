@@ -0,0 +1,307 @@
+"""
+Local stand-in for the Gladia API endpoints used by GladiaService.
+
+Implements POST /v2/upload, POST /v2/transcription and
+GET /v2/transcription/<id> with configurable latency, processing speed
+and error injection, and counts every request it serves.
+
+Run standalone:
+    python -m benchmarks.mock_gladia_server --port 8765 --processing-ratio 0.05
+"""
+
+import argparse
+import json
+import random
+import re
+import struct
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class MockSettings:
+    """Behaviour knobs for the mock server."""
+
+    latency: float = 0.05              # Seconds added to every response
+    processing_ratio: float = 0.05     # Processing time per second of audio
+    error_rate: float = 0.0            # Probability of a 500 response
+    throttle_rate: float = 0.0         # Probability of a 429 response
+    retry_after: float = 1.0           # Retry-After sent with 429 responses
+    job_failure_rate: float = 0.0      # Probability a job ends with status "error"
+    utterance_seconds: float = 5.0     # Length of each synthetic utterance
+
+
+@dataclass
+class _Job:
+    audio_duration: float
+    ready_at: float
+    fails: bool
+
+
+def wav_duration(data: bytes) -> float:
+    """Returns the duration of the first RIFF/WAVE payload found in `data`."""
+    start = data.find(b"RIFF")
+    if start < 0 or data[start + 8:start + 12] != b"WAVE":
+        return 0.0
+
+    pos = start + 12
+    byte_rate = 0
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        chunk_size = struct.unpack("<I", data[pos + 4:pos + 8])[0]
+        if chunk_id == b"fmt ":
+            byte_rate = struct.unpack("<I", data[pos + 16:pos + 20])[0]
+        elif chunk_id == b"data":
+            return chunk_size / byte_rate if byte_rate else 0.0
+        pos += 8 + chunk_size + (chunk_size & 1)
+
+    return 0.0
+
+
+class MockGladiaServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding mock job state and request counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), settings: Optional[MockSettings] = None):
+        super().__init__(address, _Handler)
+        self.settings = settings or MockSettings()
+        self.request_counts: Counter = Counter()
+        self.uploads: Dict[str, float] = {}
+        self.jobs: Dict[str, _Job] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def upload_url(self) -> str:
+        return f"{self.base_url}/v2/upload"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/v2/transcription"
+
+    def start(self) -> "MockGladiaServer":
+        """Serves requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns request counters and peak concurrency."""
+        with self.lock:
+            return {
+                "requests": dict(self.request_counts),
+                "total_requests": sum(self.request_counts.values()),
+                "max_in_flight": self.max_in_flight,
+            }
+
+    def build_result(self, job: _Job) -> Dict[str, Any]:
+        """Builds a Gladia-shaped result payload for a finished job."""
+        utterances = []
+        start = 0.0
+        index = 0
+        while start < job.audio_duration:
+            end = min(start + self.settings.utterance_seconds, job.audio_duration)
+            utterances.append({
+                "start": start,
+                "end": end,
+                "text": f"Örnek konuşma cümlesi {index}.",
+                "speaker": index % 2,
+            })
+            start = end
+            index += 1
+
+        return {
+            "status": "done",
+            "result": {
+                "metadata": {"audio_duration": job.audio_duration},
+                "transcription": {
+                    "full_transcript": " ".join(u["text"] for u in utterances),
+                    "utterances": utterances,
+                    "language": "tr",
+                },
+            },
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: MockGladiaServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def _handle(self, endpoint: str, respond):
+        server = self.server
+        settings = server.settings
+        body = self._read_body()
+
+        with server.lock:
+            server.request_counts[endpoint] += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+        try:
+            time.sleep(settings.latency)
+
+            if random.random() < settings.throttle_rate:
+                with server.lock:
+                    server.request_counts[f"{endpoint}_429"] += 1
+                self._send_json(
+                    429,
+                    {"message": "Too many requests"},
+                    {"Retry-After": str(settings.retry_after)},
+                )
+                return
+
+            if random.random() < settings.error_rate:
+                with server.lock:
+                    server.request_counts[f"{endpoint}_500"] += 1
+                self._send_json(500, {"message": "Injected server error"})
+                return
+
+            respond(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def do_POST(self):
+        if self.path == "/v2/upload":
+            self._handle("upload", self._upload)
+        elif self.path == "/v2/transcription":
+            self._handle("start", self._start)
+        else:
+            self._send_json(404, {"message": "Not found"})
+
+    def do_GET(self):
+        match = re.fullmatch(r"/v2/transcription/([\w-]+)", self.path)
+        if match:
+            self._handle("poll", lambda body: self._poll(match.group(1)))
+        elif self.path == "/stats":
+            self._send_json(200, self.server.stats())
+        else:
+            self._send_json(404, {"message": "Not found"})
+
+    def _upload(self, body: bytes):
+        audio_id = uuid.uuid4().hex
+        duration = wav_duration(body)
+        with self.server.lock:
+            self.server.uploads[audio_id] = duration
+
+        self._send_json(200, {
+            "audio_url": f"{self.server.base_url}/audio/{audio_id}",
+            "audio_metadata": {"audio_duration": duration},
+        })
+
+    def _start(self, body: bytes):
+        payload = json.loads(body or b"{}")
+        audio_id = str(payload.get("audio_url", "")).rsplit("/", 1)[-1]
+        settings = self.server.settings
+
+        with self.server.lock:
+            duration = self.server.uploads.get(audio_id)
+            if duration is None:
+                self._send_json(400, {"message": "Unknown audio_url"})
+                return
+
+            job_id = str(uuid.uuid4())
+            self.server.jobs[job_id] = _Job(
+                audio_duration=duration,
+                ready_at=time.time() + duration * settings.processing_ratio,
+                fails=random.random() < settings.job_failure_rate,
+            )
+
+        self._send_json(201, {
+            "id": job_id,
+            "result_url": f"{self.server.api_url}/{job_id}",
+        })
+
+    def _poll(self, job_id: str):
+        with self.server.lock:
+            job = self.server.jobs.get(job_id)
+
+        if job is None:
+            self._send_json(404, {"message": "Unknown transcription"})
+            return
+
+        if time.time() < job.ready_at:
+            self._send_json(200, {"id": job_id, "status": "processing"})
+        elif job.fails:
+            self._send_json(200, {"id": job_id, "status": "error", "error_message": "Injected job failure"})
+        else:
+            self._send_json(200, {"id": job_id, **self.server.build_result(job)})
+
+
+def add_settings_arguments(parser: argparse.ArgumentParser):
+    """Adds MockSettings options to an argument parser."""
+    defaults = MockSettings()
+    parser.add_argument("--latency", type=float, default=defaults.latency)
+    parser.add_argument("--processing-ratio", type=float, default=defaults.processing_ratio)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--throttle-rate", type=float, default=defaults.throttle_rate)
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after)
+    parser.add_argument("--job-failure-rate", type=float, default=defaults.job_failure_rate)
+
+
+def settings_from_args(args: argparse.Namespace) -> MockSettings:
+    """Builds MockSettings from parsed arguments."""
+    return MockSettings(
+        latency=args.latency,
+        processing_ratio=args.processing_ratio,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        job_failure_rate=args.job_failure_rate,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Gladia API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockGladiaServer((args.host, args.port), settings_from_args(args))
+    print(f"Mock Gladia server listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+End-to-end transcription pipeline benchmark against the mock Gladia server.
+
+Runs N synthetic blocks through record-file -> upload -> poll -> parse
+using the real GladiaService and reports wall time, request counts and
+concurrency utilization.
+
+Usage:
+    python -m benchmarks.pipeline_benchmark --blocks 20 --concurrency 4
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+import soundfile as sf
+
+from src.config import SAMPLE_RATE
+from src.gladia_service import GladiaService
+from src.rate_limiter import RateLimiter
+
+from .mock_gladia_server import MockGladiaServer, add_settings_arguments, settings_from_args
+
+
+def write_blocks(directory: str, count: int, seconds: float, sample_rate: int) -> List[str]:
+    """Writes `count` synthetic speech-like blocks and returns their paths."""
+    paths = []
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / sample_rate
+    for i in range(count):
+        audio = 0.1 * np.sin(2 * np.pi * (200 + i) * t) * (np.sin(2 * np.pi * 0.5 * t) > 0)
+        path = os.path.join(directory, f"block_{i + 1:03d}_benchmark.wav")
+        sf.write(path, audio.astype(np.float32), sample_rate)
+        paths.append(path)
+    return paths
+
+
+class UtilizationSampler:
+    """Samples the limiter's in-flight count against its current limit."""
+
+    def __init__(self, limiter: RateLimiter, interval: float = 0.05):
+        self.limiter = limiter
+        self.interval = interval
+        self.samples: List[float] = []
+        self.limits: List[int] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        concurrency = self.limiter.concurrency
+        while not self._stop.wait(self.interval):
+            self.samples.append(concurrency.in_flight / concurrency.maximum)
+            self.limits.append(concurrency.limit)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Runs the benchmark and returns a report dictionary."""
+    server = MockGladiaServer((args.host, 0), settings_from_args(args)).start()
+    limiter = RateLimiter(max_concurrency=args.max_requests)
+    service = GladiaService(
+        api_key="benchmark",
+        rate_limiter=limiter,
+        api_url=server.api_url,
+        upload_url=server.upload_url,
+        poll_interval=args.poll_interval,
+    )
+
+    block_times: List[float] = []
+    failures: List[str] = []
+    utterance_count = 0
+    busy_lock = threading.Lock()
+
+    def transcribe(path: str):
+        nonlocal utterance_count
+        started = time.perf_counter()
+        try:
+            result = service.transcribe_file(path)
+            with busy_lock:
+                utterance_count += len(result["transcript"])
+        except Exception as e:
+            with busy_lock:
+                failures.append(f"{os.path.basename(path)}: {e}")
+        finally:
+            with busy_lock:
+                block_times.append(time.perf_counter() - started)
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            write_started = time.perf_counter()
+            paths = write_blocks(directory, args.blocks, args.block_seconds, SAMPLE_RATE)
+            write_seconds = time.perf_counter() - write_started
+
+            started = time.perf_counter()
+            with UtilizationSampler(limiter) as sampler:
+                with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                    list(pool.map(transcribe, paths))
+            wall = time.perf_counter() - started
+    finally:
+        server.stop()
+
+    stats = server.stats()
+    worker_busy = sum(block_times) / (wall * args.concurrency) if wall else 0.0
+    request_util = sum(sampler.samples) / len(sampler.samples) if sampler.samples else 0.0
+
+    return {
+        "blocks": args.blocks,
+        "block_seconds": args.block_seconds,
+        "concurrency": args.concurrency,
+        "write_seconds": round(write_seconds, 3),
+        "wall_seconds": round(wall, 3),
+        "blocks_per_second": round(args.blocks / wall, 3) if wall else 0.0,
+        "block_latency_mean": round(sum(block_times) / len(block_times), 3) if block_times else 0.0,
+        "block_latency_max": round(max(block_times), 3) if block_times else 0.0,
+        "utterances": utterance_count,
+        "failures": failures,
+        "requests": stats["requests"],
+        "total_requests": stats["total_requests"],
+        "server_max_in_flight": stats["max_in_flight"],
+        "worker_utilization": round(worker_busy, 3),
+        "request_slot_utilization": round(request_util, 3),
+        "min_concurrency_limit": min(sampler.limits) if sampler.limits else limiter.concurrency.limit,
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """Prints a human-readable report."""
+    print(f"Blocks:              {report['blocks']} x {report['block_seconds']}s")
+    print(f"Worker concurrency:  {report['concurrency']}")
+    print(f"Record-file time:    {report['write_seconds']:.3f}s")
+    print(f"Pipeline wall time:  {report['wall_seconds']:.3f}s")
+    print(f"Throughput:          {report['blocks_per_second']:.3f} blocks/s")
+    print(f"Block latency:       mean {report['block_latency_mean']:.3f}s, max {report['block_latency_max']:.3f}s")
+    print(f"Utterances parsed:   {report['utterances']}")
+    print(f"Requests:            {report['total_requests']} {report['requests']}")
+    print(f"Server max in-flight:{report['server_max_in_flight']:>3}")
+    print(f"Worker utilization:  {report['worker_utilization']:.1%}")
+    print(f"Request slot util.:  {report['request_slot_utilization']:.1%}")
+    print(f"Min limiter slots:   {report['min_concurrency_limit']}")
+    if report["failures"]:
+        print(f"Failures ({len(report['failures'])}):")
+        for failure in report["failures"]:
+            print(f"  {failure}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcription pipeline throughput benchmark")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--blocks", type=int, default=10)
+    parser.add_argument("--block-seconds", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=4, help="Blocks transcribed in parallel")
+    parser.add_argument("--max-requests", type=int, default=4, help="Limiter concurrency ceiling")
+    parser.add_argument("--poll-interval", type=float, default=0.2)
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this JSON file")
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
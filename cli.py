@@ -0,0 +1,77 @@
+"""
+Headless batch mode for Audio Transcriber.
+
+Transcribes audio files (or every audio file in the given directories) and
+writes transcripts, optional notes and a summary.json to an output directory.
+With --watch it keeps running and processes files as they are dropped into a
+directory. Does not need a display or an audio device.
+
+Usage:
+    python cli.py recordings/ -o output --concurrency 4 --notes
+    python cli.py --watch incoming/ -o output --notes
+"""
+
+import argparse
+import json
+import sys
+
+from src.config import RECORDINGS_DIR, TRANSCRIBE_CONCURRENCY
+from src.pipeline import BatchPipeline, WatchDaemon, collect_audio_files
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Transcribe audio files without the GUI")
+    parser.add_argument("inputs", nargs="*", help="Audio files or directories")
+    parser.add_argument(
+        "--watch", nargs="?", const=RECORDINGS_DIR, metavar="DIR",
+        help=f"Keep processing files dropped into DIR (default: {RECORDINGS_DIR})",
+    )
+    parser.add_argument("-o", "--output", default="output", help="Output directory")
+    parser.add_argument(
+        "-j", "--concurrency", type=int, default=TRANSCRIBE_CONCURRENCY,
+        help="Files transcribed in parallel",
+    )
+    parser.add_argument("--language", default="tr", help="Transcription language code")
+    parser.add_argument("--notes", action="store_true", help="Also generate notes with Gemini")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print the summary")
+    args = parser.parse_args()
+
+    def progress(message: str):
+        if not args.quiet:
+            print(message, file=sys.stderr, flush=True)
+
+    if bool(args.inputs) == bool(args.watch):
+        parser.error("give either audio files/directories or --watch")
+
+    try:
+        files = collect_audio_files(args.inputs)
+        pipeline = BatchPipeline(
+            args.output,
+            concurrency=args.concurrency,
+            language=args.language,
+            on_progress=progress,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.watch:
+        progress(f"Watching {args.watch} (Ctrl+C to stop)")
+        daemon = WatchDaemon(pipeline, args.watch, notes=args.notes)
+        daemon.run_forever()
+        print(json.dumps({"processed": daemon.processed, "failed": daemon.failed}))
+        return 1 if daemon.failed else 0
+
+    if not files:
+        print("Error: no audio files found", file=sys.stderr)
+        return 2
+
+    summary = pipeline.run(files, notes=args.notes)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+    notes_failed = args.notes and not summary.get("notes", {}).get("ok", False)
+    return 1 if summary["failed"] or notes_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,58 +1,108 @@
 import os
+import json
 import threading
 import tkinter as tk
+from collections import deque
 from tkinter import messagebox, filedialog
 from datetime import datetime
-from typing import Optional, List, Dict
-import sounddevice as sd
-import soundfile as sf
+from typing import Optional, List, Dict, Tuple
 import numpy as np
 
 import customtkinter as ctk
 
 from src.audio_recorder import AudioRecorder
-from src.gladia_service import GladiaService, format_transcript
+from src.gladia_service import GladiaService, TranscriptionFailed, format_transcript
 from src.gemini_service import GeminiService, save_notes_to_markdown
-from src.config import RECORDINGS_DIR
+from src.transcript import format_timestamp
+from src.search_index import TranscriptIndex, SearchHit
+from src.sidecar import SIDECAR_SUFFIX, TranscriptStore
+from src.exporters import export_transcripts
+from src.rolling_notes import RollingNotes
+from src.compaction import CompactionResult, compact_text, compact_transcript
+from src.block_list import BlockEntry, BlockListModel, block_sort_key
+from src.manifest import BlockInfo, BlockManifest, STATUS_TRANSCRIBED
+from src.playback import PlaybackEngine
+from src.waveform import WaveformLoader, WaveformPeaks
+from src.ui_dispatcher import UIDispatcher
+from src.rate_limiter import OperationCancelled
+from src.importer import AudioImporter, supported_extensions
+from src.job_queue import (
+    Job,
+    JobQueue,
+    JobStore,
+    JOB_NOTES,
+    JOB_TRANSCRIBE,
+    STATE_CANCELLED,
+    STATE_DONE,
+    STATE_ERROR,
+    STATE_QUEUED,
+    STATE_RETRY,
+)
+from src.config import (
+    RECORDINGS_DIR,
+    TRANSCRIPT_CHUNK_LINES,
+    NOTES_REFRESH_MS,
+    UI_STATS_INTERVAL_MS,
+)
 
 
 class BlockCard(ctk.CTkFrame):
     """
     A card widget representing a single audio block.
     Includes play/pause, selection, duration, and status.
+    Cards are reused by BlockListView: `bind_entry` points a card at another block.
+    Playback goes through the app's shared PlaybackEngine.
     """
 
     def __init__(
         self,
         parent,
-        filepath: str,
+        model: BlockListModel,
+        player: PlaybackEngine,
+        waveforms: WaveformLoader,
+        ui: UIDispatcher,
         on_selection_change: callable,
         on_delete: callable,
         **kwargs
     ):
         super().__init__(parent, **kwargs)
 
-        self.filepath = filepath
+        self.model = model
+        self.player = player
+        self.waveforms = waveforms
+        self.ui = ui
+        self.peaks: Optional[WaveformPeaks] = None
+        self.entry: Optional[BlockEntry] = None
+        self.filepath = ""
+        self.duration = 0.0
         self.on_selection_change = on_selection_change
         self.on_delete = on_delete
         self.is_selected = True
         self.is_playing = False
-        self.playback_thread = None
-        self.stop_playback_flag = False
-
-        # Get audio duration
-        self.duration = self._get_duration()
+        self._shown_progress = 0.0
 
         self._create_widgets()
         self._update_selection_style()
 
-    def _get_duration(self) -> float:
-        """Returns the duration of the audio file in seconds."""
-        try:
-            info = sf.info(self.filepath)
-            return info.duration
-        except:
-            return 0.0
+    def bind_entry(self, entry: BlockEntry):
+        """Shows the given block in this card."""
+        if entry.filepath != self.filepath:
+            self.filepath = entry.filepath
+            self.duration = self.model.duration(entry.filepath)
+
+            filename = os.path.basename(self.filepath)
+            self.name_label.configure(text=filename.replace(".wav", "").replace("block_", "Blok "))
+            self.duration_label.configure(text=f"⏱ {self._format_duration(self.duration)}")
+
+            self.peaks = self.waveforms.get(self.filepath)
+            self._draw_waveform()
+            if self.peaks is None:
+                self.waveforms.request(self.filepath, self._on_peaks_loaded)
+
+        self.entry = entry
+        self.set_selected(entry.selected)
+        self.set_status(entry.status)
+        self.update_playback()
 
     def _format_duration(self, seconds: float) -> str:
         """Formats seconds as MM:SS."""
@@ -86,12 +136,9 @@ class BlockCard(ctk.CTkFrame):
         info_frame.pack(side="left", fill="x", expand=True)
 
         # Filename
-        filename = os.path.basename(self.filepath)
-        display_name = filename.replace(".wav", "").replace("block_", "Blok ")
-
         self.name_label = ctk.CTkLabel(
             info_frame,
-            text=display_name,
+            text="",
             font=ctk.CTkFont(size=13, weight="bold"),
             anchor="w",
         )
@@ -103,7 +150,7 @@ class BlockCard(ctk.CTkFrame):
 
         self.duration_label = ctk.CTkLabel(
             status_frame,
-            text=f"⏱ {self._format_duration(self.duration)}",
+            text="",
             font=ctk.CTkFont(size=11),
             text_color="gray60",
         )
@@ -143,96 +190,108 @@ class BlockCard(ctk.CTkFrame):
         self.select_checkbox.pack(side="right")
         self.select_checkbox.select()
 
+        # Waveform strip
+        self.waveform_canvas = tk.Canvas(self, height=24, highlightthickness=0, bg="gray17")
+        self.waveform_canvas.pack(fill="x", padx=8, pady=(0, 2))
+        self.waveform_canvas.bind("<Configure>", lambda event: self._draw_waveform())
+
         # Progress bar for playback
         self.progress_bar = ctk.CTkProgressBar(self, height=3)
         self.progress_bar.pack(fill="x", padx=8, pady=(0, 4))
         self.progress_bar.set(0)
-
-    def _toggle_playback(self):
-        """Toggles audio playback."""
-        if self.is_playing:
-            self._stop_playback()
-        else:
-            self._start_playback()
-
-    def _start_playback(self):
-        """Starts audio playback."""
-        if self.is_playing:
+        self.progress_bar.bind("<Button-1>", self._on_progress_click)
+
+    def _on_peaks_loaded(self, filepath: str, peaks: Optional[WaveformPeaks]):
+        """Called on the loader thread when a block's peaks are available."""
+        def apply():
+            # The card may show another block by now
+            if filepath == self.filepath:
+                self.peaks = peaks
+                self._draw_waveform()
+
+        self.ui.post(("waveform", id(self)), apply)
+
+    def _draw_waveform(self):
+        """Draws the waveform strip from the cached peaks."""
+        canvas = self.waveform_canvas
+        canvas.delete("all")
+        if self.peaks is None:
             return
 
-        self.is_playing = True
-        self.stop_playback_flag = False
-        self.play_button.configure(text="⏸", fg_color="#e74c3c", hover_color="#c0392b")
-
-        self.playback_thread = threading.Thread(target=self._playback_worker, daemon=True)
-        self.playback_thread.start()
-
-    def _stop_playback(self):
-        """Stops audio playback."""
-        self.stop_playback_flag = True
-        sd.stop()
-        self.is_playing = False
-        self.play_button.configure(text="▶", fg_color="#1DB954", hover_color="#1ed760")
-        self.progress_bar.set(0)
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if width <= 1:
+            return
 
-    def _playback_worker(self):
-        """Background worker for audio playback."""
-        import time
+        middle = height / 2
+        for x, (low, high) in enumerate(self.peaks.strip(width)):
+            canvas.create_line(
+                x, middle - high * middle, x, middle - low * middle + 1,
+                fill="#3498db",
+            )
 
+    def _toggle_playback(self):
+        """Plays this block, or pauses/resumes it if it is already playing."""
         try:
-            data, samplerate = sf.read(self.filepath)
-
-            # Start playback
-            sd.play(data, samplerate)
-
-            # Track progress based on time
-            start_time = time.time()
-
-            while not self.stop_playback_flag:
-                elapsed = time.time() - start_time
-
-                # Check if playback finished
-                if elapsed >= self.duration:
-                    break
-
-                # Update progress bar
-                progress = min(elapsed / self.duration, 1.0) if self.duration > 0 else 0
-                self.after(0, lambda p=progress: self.progress_bar.set(p))
-
-                time.sleep(0.1)
+            if self.player.filepath == self.filepath:
+                self.player.toggle_pause()
+            else:
+                self.player.play(self.filepath)
+        except Exception as e:
+            print(f"Playback error: {e}")
+        self.update_playback()
 
-            # Playback finished naturally
-            if not self.stop_playback_flag:
-                self.after(0, lambda: self.progress_bar.set(1.0))
-                time.sleep(0.2)
-                self.after(0, self._on_playback_finished)
+    def _on_progress_click(self, event):
+        """Seeks to the clicked position of the progress bar."""
+        width = self.progress_bar.winfo_width()
+        if width <= 0:
+            return
 
+        fraction = event.x / width
+        try:
+            if self.player.filepath == self.filepath:
+                self.player.seek(fraction)
+            else:
+                self.player.play(self.filepath, start=fraction * self.duration)
         except Exception as e:
             print(f"Playback error: {e}")
-            self.after(0, self._on_playback_finished)
+        self.update_playback()
 
-    def _on_playback_finished(self):
-        """Called when playback finishes."""
-        self.is_playing = False
-        self.play_button.configure(text="▶", fg_color="#1DB954", hover_color="#1ed760")
-        self.progress_bar.set(0)
+    def update_playback(self):
+        """Syncs the play button and progress bar with the playback engine."""
+        active = self.player.filepath == self.filepath
+        playing = active and not self.player.paused
+        progress = self.player.progress if active else 0.0
+
+        if playing != self.is_playing:
+            self.is_playing = playing
+            if playing:
+                self.play_button.configure(text="⏸", fg_color="#e74c3c", hover_color="#c0392b")
+            else:
+                self.play_button.configure(text="▶", fg_color="#1DB954", hover_color="#1ed760")
+
+        if progress != self._shown_progress:
+            self._shown_progress = progress
+            self.progress_bar.set(progress)
 
     def _on_selection_toggle(self):
         """Handles selection toggle."""
-        self.is_selected = self.select_checkbox.get()
+        self.is_selected = bool(self.select_checkbox.get())
         self._update_selection_style()
+        self.model.set_selected(self.filepath, self.is_selected)
         self.on_selection_change()
 
     def _update_selection_style(self):
         """Updates card style based on selection state."""
         if self.is_selected:
             self.configure(border_color="#3498db", fg_color="gray17")
+            self.waveform_canvas.configure(bg="gray17")
         else:
             self.configure(border_color="gray30", fg_color="gray20")
+            self.waveform_canvas.configure(bg="gray20")
 
     def _on_delete_click(self):
         """Handles delete button click."""
-        self._stop_playback()
         self.on_delete(self.filepath)
 
     def set_selected(self, selected: bool):
@@ -248,10 +307,147 @@ class BlockCard(ctk.CTkFrame):
         """Sets the status text."""
         self.status_label.configure(text=status)
 
-    def destroy(self):
-        """Cleanup before destroying."""
-        self._stop_playback()
-        super().destroy()
+
+class BlockListView(ctk.CTkFrame):
+    """
+    Virtualized list of block cards.
+    Only as many cards as fit in the visible area are created; scrolling
+    rebinds them to other entries of the model, so opening a folder with
+    thousands of blocks costs the same as opening one with a handful.
+    """
+
+    ROW_HEIGHT = 102
+
+    def __init__(
+        self,
+        parent,
+        model: BlockListModel,
+        player: PlaybackEngine,
+        waveforms: WaveformLoader,
+        ui: UIDispatcher,
+        on_selection_change: callable,
+        on_delete: callable,
+        **kwargs
+    ):
+        super().__init__(parent, **kwargs)
+
+        self.model = model
+        self.player = player
+        self.waveforms = waveforms
+        self.ui = ui
+        self.on_selection_change = on_selection_change
+        self.on_delete = on_delete
+        self.cards: List[BlockCard] = []
+        self.first = 0
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.rows_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.rows_frame.pack(side="left", fill="both", expand=True)
+        self.rows_frame.bind("<Configure>", self._on_resize)
+
+        # Empty state label
+        self.empty_label = ctk.CTkLabel(
+            self.rows_frame,
+            text="Henüz kayıt yok.\nKayda başlayın veya\nmevcut dosyaları yükleyin.",
+            font=ctk.CTkFont(size=12),
+            text_color="gray50",
+            justify="center",
+        )
+        self.empty_label.pack(pady=30)
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_all(sequence, self._on_mouse_wheel, add="+")
+
+    def _on_resize(self, event):
+        """Creates enough cards to fill the visible height."""
+        needed = max(1, event.height // self.ROW_HEIGHT + 1)
+        while len(self.cards) < needed:
+            self.cards.append(BlockCard(
+                self.rows_frame,
+                self.model,
+                self.player,
+                self.waveforms,
+                self.ui,
+                on_selection_change=self.on_selection_change,
+                on_delete=self.on_delete,
+            ))
+        while len(self.cards) > needed:
+            self.cards.pop().destroy()
+        self.refresh()
+
+    def refresh(self):
+        """Rebinds the visible cards to the model."""
+        total = len(self.model)
+        visible = len(self.cards)
+        self.first = max(0, min(self.first, total - visible))
+
+        if total:
+            self.empty_label.pack_forget()
+        elif not self.empty_label.winfo_manager():
+            self.empty_label.pack(pady=30)
+
+        for i, card in enumerate(self.cards):
+            index = self.first + i
+            if index < total:
+                card.bind_entry(self.model[index])
+                if not card.winfo_manager():
+                    card.pack(fill="x", pady=4)
+            elif card.winfo_manager():
+                card.pack_forget()
+
+        if total > visible:
+            self.scrollbar.set(self.first / total, (self.first + visible) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def update_playback(self):
+        """Syncs the visible cards with the playback engine."""
+        for card in self.cards:
+            if card.winfo_manager():
+                card.update_playback()
+
+    def refresh_block(self, filepath: str):
+        """Updates the card showing `filepath`, if it is visible."""
+        entry = self.model.get(filepath)
+        if entry is None:
+            return
+        for card in self.cards:
+            if card.filepath == filepath and card.winfo_manager():
+                card.bind_entry(entry)
+
+    def scroll_to(self, filepath: str):
+        """Scrolls so that `filepath` is visible."""
+        index = self.model.index_of(filepath)
+        if index is None:
+            return
+        if not self.first <= index < self.first + len(self.cards) - 1:
+            self.first = index
+        self.refresh()
+
+    def _scroll(self, rows: int):
+        self.first += rows
+        self.refresh()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.first = int(float(args[1]) * len(self.model))
+            self.refresh()
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= max(1, len(self.cards) - 1)
+            self._scroll(step)
+
+    def _on_mouse_wheel(self, event):
+        # Wheel events are bound globally; only react inside this list
+        if not str(event.widget).startswith(str(self)):
+            return
+        if event.num == 4 or event.delta > 0:
+            self._scroll(-1)
+        elif event.num == 5 or event.delta < 0:
+            self._scroll(1)
 
 
 class AudioTranscriberApp(ctk.CTk):
@@ -271,10 +467,33 @@ class AudioTranscriberApp(ctk.CTk):
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
 
+        # Updates from worker threads reach the UI through the dispatcher
+        self.ui = UIDispatcher(self.after)
+
         # Initialize services
-        self.recorder = AudioRecorder(on_block_created=self._on_block_created)
+        self.manifest = BlockManifest(RECORDINGS_DIR)
+        self.recorder = AudioRecorder(
+            on_block_created=self._on_block_created,
+            manifest=self.manifest,
+        )
         self.gladia_service: Optional[GladiaService] = None
         self.gemini_service: Optional[GeminiService] = None
+        self.rolling_notes: Optional[RollingNotes] = None
+        self.search_index = TranscriptIndex()
+        self.waveforms = WaveformLoader()
+        self.player = PlaybackEngine(
+            on_finished=lambda filepath: self.ui.call(self._on_playback_finished, filepath)
+        )
+
+        # Transcription and note jobs are persisted and resumed after a restart
+        self.jobs = JobQueue(
+            JobStore(),
+            handlers={
+                JOB_TRANSCRIBE: self._run_transcribe_job,
+                JOB_NOTES: self._run_notes_job,
+            },
+            on_change=self._on_job_changed,
+        )
 
         # Log available audio devices
         print("\n=== Available Audio Input Devices ===")
@@ -284,14 +503,26 @@ class AudioTranscriberApp(ctk.CTk):
 
         # State
         self.is_recording = False
-        self.block_cards: Dict[str, BlockCard] = {}
-        self.transcripts: dict = {}
+        self.blocks = BlockListModel()
+        self.transcripts = TranscriptStore()
+        self.displayed_blocks: List[str] = []
         self.current_notes: str = ""
+        self._transcript_queue: deque = deque()
+        self._transcript_draining = False
+        self._notes_buffer: List[str] = []
+        self._notes_lock = threading.Lock()
+        self._notes_streaming = False
+        self._batch_jobs: List[int] = []
+        self._batch_cancel = threading.Event()
 
         # Build UI
         self._create_widgets()
         self._load_existing_blocks()
+        self._resume_jobs()
         self._update_timer()
+        self._update_playback()
+        self._update_ui_stats()
+        self.ui.start()
 
     def _create_widgets(self):
         """Creates all UI widgets."""
@@ -461,6 +692,18 @@ class AudioTranscriberApp(ctk.CTk):
         actions_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
         actions_frame.pack(side="right")
 
+        self.import_button = ctk.CTkButton(
+            actions_frame,
+            text="📥 İçe Aktar",
+            width=80,
+            height=24,
+            font=ctk.CTkFont(size=11),
+            fg_color="gray30",
+            hover_color="gray40",
+            command=self._import_audio,
+        )
+        self.import_button.pack(side="left", padx=2)
+
         self.select_all_button = ctk.CTkButton(
             actions_frame,
             text="Tümü",
@@ -485,22 +728,18 @@ class AudioTranscriberApp(ctk.CTk):
         )
         self.select_none_button.pack(side="left", padx=2)
 
-        # Scrollable blocks list
-        self.blocks_scroll = ctk.CTkScrollableFrame(
+        # Blocks list (only visible rows have widgets)
+        self.block_list = BlockListView(
             self.left_panel,
+            self.blocks,
+            self.player,
+            self.waveforms,
+            self.ui,
+            on_selection_change=self._update_selection_count,
+            on_delete=self._delete_block,
             fg_color="transparent",
         )
-        self.blocks_scroll.pack(fill="both", expand=True, padx=10, pady=(10, 5))
-
-        # Empty state label
-        self.empty_label = ctk.CTkLabel(
-            self.blocks_scroll,
-            text="Henüz kayıt yok.\nKayda başlayın veya\nmevcut dosyaları yükleyin.",
-            font=ctk.CTkFont(size=12),
-            text_color="gray50",
-            justify="center",
-        )
-        self.empty_label.pack(pady=30)
+        self.block_list.pack(fill="both", expand=True, padx=10, pady=(10, 5))
 
         # Bottom actions
         bottom_frame = ctk.CTkFrame(self.left_panel, fg_color="transparent")
@@ -522,6 +761,29 @@ class AudioTranscriberApp(ctk.CTk):
             font=ctk.CTkFont(size=13, weight="bold"),
         )
         self.transcribe_button.pack(side="right")
+        self._transcribe_button_color = self.transcribe_button.cget("fg_color")
+
+        # Selected blocks with a stored transcript are only uploaded again from here
+        self.retranscribe_button = ctk.CTkButton(
+            bottom_frame,
+            text="↻",
+            width=36,
+            height=36,
+            font=ctk.CTkFont(size=15, weight="bold"),
+            command=lambda: self._transcribe_selected(retranscribe=True),
+        )
+        self.retranscribe_button.pack(side="right", padx=(0, 5))
+
+        self.jobs_button = ctk.CTkButton(
+            bottom_frame,
+            text="⚙ İşler",
+            width=90,
+            height=36,
+            fg_color="gray30",
+            hover_color="gray40",
+            command=self._show_jobs,
+        )
+        self.jobs_button.pack(side="right", padx=(0, 10))
 
     def _create_transcript_panel(self):
         """Creates the transcript display panel."""
@@ -549,6 +811,15 @@ class AudioTranscriberApp(ctk.CTk):
         )
         self.clear_transcript_button.pack(side="right")
 
+        self.search_entry = ctk.CTkEntry(
+            header,
+            placeholder_text="🔍 Tüm transkriptlerde ara...",
+            width=240,
+            height=28,
+        )
+        self.search_entry.pack(side="right", padx=(0, 10))
+        self.search_entry.bind("<Return>", lambda event: self._search_transcripts())
+
         # Text area
         self.transcript_text = ctk.CTkTextbox(
             transcript_frame,
@@ -571,6 +842,38 @@ class AudioTranscriberApp(ctk.CTk):
         )
         self.generate_notes_button.pack(side="left")
 
+        self.regenerate_notes_button = ctk.CTkButton(
+            action_frame,
+            text="↻",
+            width=38,
+            height=38,
+            font=ctk.CTkFont(size=15, weight="bold"),
+            fg_color="#8e44ad",
+            hover_color="#9b59b6",
+            command=lambda: self._generate_notes(regenerate=True),
+        )
+        self.regenerate_notes_button.pack(side="left", padx=(5, 0))
+
+        self.export_transcript_button = ctk.CTkButton(
+            action_frame,
+            text="📄 SRT / VTT / JSONL",
+            command=self._export_transcripts,
+            height=38,
+            font=ctk.CTkFont(size=13, weight="bold"),
+            fg_color="gray30",
+            hover_color="gray40",
+        )
+        self.export_transcript_button.pack(side="left", padx=(10, 0))
+
+        self.rolling_notes_var = ctk.BooleanVar(value=False)
+        self.rolling_notes_checkbox = ctk.CTkCheckBox(
+            action_frame,
+            text="Canlı notlar",
+            variable=self.rolling_notes_var,
+            font=ctk.CTkFont(size=12),
+        )
+        self.rolling_notes_checkbox.pack(side="right")
+
     def _create_notes_panel(self):
         """Creates the notes display panel."""
         notes_frame = ctk.CTkFrame(self.right_panel)
@@ -604,6 +907,14 @@ class AudioTranscriberApp(ctk.CTk):
         )
         self.notes_text.pack(fill="both", expand=True, padx=10, pady=5)
 
+        self.question_entry = ctk.CTkEntry(
+            notes_frame,
+            placeholder_text="❓ Transkripte soru sor...",
+            height=32,
+        )
+        self.question_entry.pack(fill="x", padx=10, pady=(5, 0))
+        self.question_entry.bind("<Return>", lambda event: self._ask_question())
+
         # Action buttons
         action_frame = ctk.CTkFrame(notes_frame, fg_color="transparent")
         action_frame.pack(fill="x", padx=10, pady=(5, 10))
@@ -619,7 +930,27 @@ class AudioTranscriberApp(ctk.CTk):
         )
         self.export_button.pack(side="left")
 
+        self.export_usage_button = ctk.CTkButton(
+            action_frame,
+            text="📊",
+            width=38,
+            height=38,
+            font=ctk.CTkFont(size=15),
+            fg_color="gray30",
+            hover_color="gray40",
+            command=self._export_usage,
+        )
+        self.export_usage_button.pack(side="left", padx=(5, 0))
+
         # Status bar
+        self.ui_stats_label = ctk.CTkLabel(
+            action_frame,
+            text="",
+            font=ctk.CTkFont(size=10),
+            text_color="gray40",
+        )
+        self.ui_stats_label.pack(side="right", padx=(0, 10))
+
         self.status_label = ctk.CTkLabel(
             action_frame,
             text="Hazır",
@@ -698,39 +1029,42 @@ class AudioTranscriberApp(ctk.CTk):
 
     def _on_block_created(self, filepath: str):
         """Callback when a new block is created during recording."""
-        self.after(0, lambda: self._add_block_card(filepath))
-
-    def _add_block_card(self, filepath: str):
-        """Adds a block card to the list."""
-        if filepath in self.block_cards:
-            return
+        self.ui.call(self._add_block, filepath)
 
-        # Hide empty label
-        self.empty_label.pack_forget()
+    def _add_block(self, filepath: str, transcribed: Optional[bool] = None):
+        """Adds a block to the list."""
+        if transcribed is None:
+            transcribed = self.transcripts.has(filepath)
 
-        # Create card
-        card = BlockCard(
-            self.blocks_scroll,
+        info = self.manifest.get(filepath)
+        if not self.blocks.add(
             filepath,
-            on_selection_change=self._update_selection_count,
-            on_delete=self._delete_block,
-        )
-        card.pack(fill="x", pady=4)
+            status="✓ Tamamlandı" if transcribed else "",
+            duration=info.duration if info else None,
+        ):
+            return
 
-        self.block_cards[filepath] = card
+        self.block_list.refresh()
         self._update_blocks_count()
         self._update_selection_count()
 
+    def _set_block_status(self, filepath: str, status: str):
+        """Sets a block's status text."""
+        self.blocks.set_status(filepath, status)
+        self.block_list.refresh_block(filepath)
+
     def _delete_block(self, filepath: str):
         """Deletes a block."""
-        if filepath in self.block_cards:
+        if filepath in self.blocks:
             confirm = messagebox.askyesno(
                 "Blok Sil",
                 f"Bu bloğu silmek istediğinize emin misiniz?\n{os.path.basename(filepath)}"
             )
             if confirm:
-                self.block_cards[filepath].destroy()
-                del self.block_cards[filepath]
+                if self.player.filepath == filepath:
+                    self.player.stop()
+                self.blocks.remove(filepath)
+                self.block_list.refresh()
 
                 # Delete file
                 try:
@@ -738,163 +1072,815 @@ class AudioTranscriberApp(ctk.CTk):
                 except:
                     pass
 
+                self.transcripts.discard(filepath)
+                self.search_index.remove_block(filepath)
+                self.manifest.remove(filepath)
+                self.waveforms.discard(filepath)
+
                 self._update_blocks_count()
                 self._update_selection_count()
 
-                # Show empty label if no blocks
-                if not self.block_cards:
-                    self.empty_label.pack(pady=30)
-
     def _load_existing_blocks(self):
-        """Loads existing blocks from recordings directory."""
-        if not os.path.exists(RECORDINGS_DIR):
-            return
-
-        for filename in sorted(os.listdir(RECORDINGS_DIR)):
+        """
+        Shows the blocks known to the manifest and any other block files right
+        away, then checks the recordings directory in the background for new,
+        changed or deleted files.
+        """
+        # (status, duration) per file. Files missing from the manifest are
+        # listed without opening them; their durations are read when first
+        # shown and the scan fills them in
+        found: Dict[str, Tuple[str, Optional[float]]] = {}
+        try:
+            filenames = os.listdir(RECORDINGS_DIR)
+        except OSError:
+            filenames = []
+        transcribed = {name[:-len(SIDECAR_SUFFIX)] for name in filenames if name.endswith(SIDECAR_SUFFIX)}
+        for filename in filenames:
             if filename.endswith(".wav"):
-                filepath = os.path.join(RECORDINGS_DIR, filename)
-                self._add_block_card(filepath)
+                status = "✓ Tamamlandı" if filename[:-4] in transcribed else ""
+                found[os.path.join(RECORDINGS_DIR, filename)] = (status, None)
+
+        for info in self.manifest.entries():
+            found[info.filepath] = (self._block_status_text(info), info.duration)
+
+        # Added in list order, so every insert is an append; session offsets
+        # are derived from this order. Only the model is filled here; widgets
+        # exist for visible rows only
+        for filepath in sorted(found, key=block_sort_key):
+            status, duration = found[filepath]
+            self.blocks.add(filepath, status=status, duration=duration)
+
+        self.block_list.refresh()
+        self._update_blocks_count()
+        self._update_selection_count()
+
+        threading.Thread(target=self._scan_blocks_worker, daemon=True).start()
+
+    def _scan_blocks_worker(self):
+        """
+        Background worker that validates the manifest against the directory.
+        Results are applied in batches as they arrive; content hashes are
+        computed afterwards, once the list is complete.
+        """
+        try:
+            self.manifest.scan(
+                on_batch=lambda changed, removed: self.ui.call(self._apply_block_scan, changed, removed)
+            )
+            self.manifest.fill_hashes()
+        except Exception as e:
+            print(f"Manifest scan error: {e}")
+
+    def _apply_block_scan(self, changed: List[BlockInfo], removed: List[str]):
+        """Applies the results of a manifest scan to the block list."""
+        for info in changed:
+            status = self._block_status_text(info)
+            if not self.blocks.add(info.filepath, status=status, duration=info.duration):
+                self.blocks.set_duration(info.filepath, info.duration)
+                self.blocks.set_status(info.filepath, status)
+
+        for filepath in removed:
+            self.blocks.remove(filepath)
+
+        self.block_list.refresh()
+        self._update_blocks_count()
+        self._update_selection_count()
+
+    def _block_status_text(self, info: BlockInfo) -> str:
+        """Returns the block card status for a manifest entry."""
+        return "✓ Tamamlandı" if info.status == STATUS_TRANSCRIBED else ""
 
     def _select_all_blocks(self):
         """Selects all blocks."""
-        for card in self.block_cards.values():
-            card.set_selected(True)
+        self.blocks.select_all(True)
+        self.block_list.refresh()
         self._update_selection_count()
 
     def _select_no_blocks(self):
         """Deselects all blocks."""
-        for card in self.block_cards.values():
-            card.set_selected(False)
+        self.blocks.select_all(False)
+        self.block_list.refresh()
         self._update_selection_count()
 
+    def _import_audio(self):
+        """Imports external audio files as blocks."""
+        patterns = " ".join(f"*.{ext}" for ext in supported_extensions())
+        filepaths = filedialog.askopenfilenames(
+            filetypes=[("Ses dosyaları", patterns), ("Tüm dosyalar", "*.*")],
+        )
+        if not filepaths:
+            return
+
+        self.import_button.configure(state="disabled")
+        self._set_status("İçe aktarılıyor...")
+
+        thread = threading.Thread(
+            target=self._import_worker,
+            args=(list(filepaths),),
+            daemon=True,
+        )
+        thread.start()
+
+    def _import_worker(self, filepaths: List[str]):
+        """
+        Background worker that cuts imported files into blocks.
+        Files are decoded in a streaming fashion, so their length does not matter;
+        each block appears in the list as soon as it is written.
+        """
+        importer = AudioImporter(
+            RECORDINGS_DIR,
+            manifest=self.manifest,
+            on_progress=lambda msg: self.ui.post("status", self._set_status, msg),
+            on_block=lambda filepath: self.ui.call(self._add_block, filepath, False),
+        )
+
+        count = 0
+        errors = []
+        for filepath in filepaths:
+            try:
+                count += len(importer.import_file(filepath))
+            except Exception as e:
+                errors.append(f"{os.path.basename(filepath)}: {e}")
+                print(f"Import error: {errors[-1]}")
+
+        self.ui.call(lambda: self.import_button.configure(state="normal"))
+        if errors:
+            self.ui.post(
+                "status",
+                self._show_error,
+                f"{count} blok içe aktarıldı, {len(errors)} dosya aktarılamadı ({errors[0]})",
+            )
+        else:
+            self.ui.post("status", self._set_status, f"{count} blok içe aktarıldı.")
+
     def _update_blocks_count(self):
         """Updates the blocks count label."""
-        count = len(self.block_cards)
-        self.blocks_count_label.configure(text=f"({count})")
+        self.blocks_count_label.configure(text=f"({len(self.blocks)})")
 
     def _update_selection_count(self):
         """Updates the selection count label."""
-        selected = sum(1 for card in self.block_cards.values() if card.is_selected)
-        self.selected_count_label.configure(text=f"{selected} blok seçili")
+        self.selected_count_label.configure(text=f"{self.blocks.selected_count} blok seçili")
 
     def _get_selected_blocks(self) -> List[str]:
         """Returns list of selected block filepaths."""
-        return [
-            filepath
-            for filepath, card in self.block_cards.items()
-            if card.is_selected
-        ]
-
-    def _transcribe_selected(self):
-        """Transcribes selected blocks."""
+        return self.blocks.selected_paths()
+
+    def _transcribe_selected(self, retranscribe: bool = False):
+        """
+        Transcribes selected blocks. Blocks that already have a stored
+        transcript are shown from it unless `retranscribe` is set.
+        """
         selected = self._get_selected_blocks()
 
         if not selected:
             messagebox.showwarning("Uyarı", "Lütfen en az bir blok seçin!")
             return
 
-        # Initialize Gladia service
-        if self.gladia_service is None:
+        if retranscribe:
+            stored = sum(1 for filepath in selected if self.transcripts.has(filepath))
+            if stored and not messagebox.askyesno(
+                "Yeniden Çevir",
+                f"{stored} blok zaten çevrilmiş. Yeniden yüklenip ücretli olarak tekrar çevrilsin mi?",
+            ):
+                return
+
+        # Initialize Gladia service (not needed if every block is stored)
+        pending = retranscribe or any(not self.transcripts.has(filepath) for filepath in selected)
+        if pending and self.gladia_service is None:
             try:
                 self.gladia_service = GladiaService()
             except ValueError as e:
                 messagebox.showerror("Hata", str(e))
                 return
 
-        self.transcribe_button.configure(state="disabled")
+        # Rolling notes summarize each block as soon as it is transcribed
+        rolling = None
+        if self.rolling_notes_var.get() and self._ensure_gemini_service():
+            if self.rolling_notes is None:
+                self.rolling_notes = RollingNotes(self.gemini_service)
+            self.rolling_notes.reset()
+            rolling = self.rolling_notes
+
+        self._batch_cancel.clear()
+        self._set_transcribe_button(running=True)
         self._set_status("Transkripsiyon başlıyor...")
+        self._clear_transcript_text()
 
         thread = threading.Thread(
             target=self._transcribe_worker,
-            args=(selected,),
+            args=(selected, rolling, retranscribe),
             daemon=True,
         )
         thread.start()
 
-    def _transcribe_worker(self, filepaths: List[str]):
-        """Background worker for transcription."""
-        all_text = []
+    def _set_transcribe_button(self, running: bool):
+        """Turns the transcribe button into a cancel button while a batch runs."""
+        self.retranscribe_button.configure(state="disabled" if running else "normal")
+        if running:
+            self.transcribe_button.configure(
+                text="⏹ İptal Et",
+                fg_color="#c0392b",
+                command=self._cancel_transcription,
+            )
+        else:
+            self.transcribe_button.configure(
+                text="Seçilenleri Çevir →",
+                fg_color=self._transcribe_button_color,
+                command=self._transcribe_selected,
+            )
 
-        for i, filepath in enumerate(filepaths):
-            try:
-                # Update card status
-                self.after(0, lambda p=filepath: self.block_cards.get(p, None) and
-                          self.block_cards[p].set_status("Çevriliyor..."))
-                self.after(0, lambda p=filepath: self._set_status(
-                    f"Çevriliyor ({i+1}/{len(filepaths)}): {os.path.basename(p)}"
-                ))
-
-                result = self.gladia_service.transcribe_file(
-                    filepath,
-                    on_progress=lambda msg: self.after(0, lambda m=msg: self._set_status(m)),
+    def _cancel_transcription(self):
+        """Cancels the running batch; its uploads and polls stop within a second."""
+        self._batch_cancel.set()
+        for job_id in self._batch_jobs:
+            self.jobs.cancel(job_id)
+        self._set_status("Transkripsiyon iptal ediliyor...")
+
+    def _session_offsets(self, filepaths: List[str]) -> Dict[str, float]:
+        """
+        Returns each block's start within its recording session.
+        Offsets recorded by the recorder (or stored in the manifest) are used
+        as is; other blocks continue from the end of the previous block.
+        """
+        offsets = {}
+        elapsed = 0.0
+        for filepath in filepaths:
+            offset = self.recorder.block_offsets.get(filepath)
+            if offset is None:
+                info = self.manifest.get(filepath)
+                offset = info.session_offset if info and info.session_offset is not None else elapsed
+            offsets[filepath] = offset
+            elapsed = offset + self.blocks.duration(filepath)
+        return offsets
+
+    def _block_session(self, filepath: str, default: str) -> str:
+        """Returns the recording session a block belongs to."""
+        session = self.recorder.block_sessions.get(filepath)
+        if not session:
+            info = self.manifest.get(filepath)
+            session = info.session if info else ""
+        return session or default
+
+    def _transcribe_worker(
+        self,
+        filepaths: List[str],
+        rolling: Optional[RollingNotes] = None,
+        retranscribe: bool = False,
+    ):
+        """
+        Queues a transcription job per block and appends the results to the
+        transcript panel (and the rolling notes, if enabled) in block order.
+        Blocks with a stored transcript are shown from their sidecar without
+        a job unless `retranscribe` is set.
+        Jobs run on the job queue's workers, so they continue after a
+        restart even though this batch's panel output does not.
+        """
+        offsets = self._session_offsets(filepaths)
+        batch_session = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stored = {
+            filepath: None if retranscribe else self.transcripts.get(filepath)
+            for filepath in filepaths
+        }
+        jobs = {
+            filepath: self.jobs.submit(
+                JOB_TRANSCRIBE,
+                filepath=filepath,
+                session=self._block_session(filepath, batch_session),
+                session_offset=offsets[filepath],
+            )
+            for filepath in filepaths
+            if stored[filepath] is None
+        }
+        self._batch_jobs = [job.id for job in jobs.values()]
+        if self._batch_cancel.is_set():
+            for job in jobs.values():
+                self.jobs.cancel(job.id)
+
+        appended = 0
+        failed: List[Job] = []
+        for completed, filepath in enumerate(filepaths, 1):
+            if stored[filepath] is not None:
+                formatted = format_transcript(stored[filepath], include_timestamps=True)
+                text = f"--- {os.path.basename(filepath)} ---\n{formatted}"
+            else:
+                job = self.jobs.wait(jobs[filepath].id)
+                self.ui.post(
+                    "status", self._set_status, f"Çevriliyor... ({completed}/{len(filepaths)} tamamlandı)"
                 )
+                if job is not None and job.state == STATE_ERROR:
+                    failed.append(job)
+                if job is None or job.state != STATE_DONE:
+                    continue
+                text = job.result
+
+            self.displayed_blocks.append(filepath)
+            if rolling is not None:
+                rolling.add_block(filepath, self._compact_for_llm(text, [filepath]).text)
+            if appended:
+                text = f"\n\n{text}"
+            self.ui.call(self._append_transcript, text)
+            appended += 1
+
+        self._batch_jobs = []
+        self.ui.call(self._set_transcribe_button, False)
+        if self._batch_cancel.is_set():
+            self.ui.post("status", self._set_status, "Transkripsiyon iptal edildi.")
+        elif failed:
+            # Details and retry are in the jobs popup
+            names = ", ".join(os.path.basename(job.filepath) for job in failed[:3])
+            if len(failed) > 3:
+                names += f" ve {len(failed) - 3} blok daha"
+            self.ui.post(
+                "status",
+                self._show_error,
+                f"Transkripsiyon tamamlandı, {len(failed)} blok çevrilemedi ({names}). Ayrıntılar: ⚙ İşler",
+            )
+        else:
+            self.ui.post("status", self._set_status, "Transkripsiyon tamamlandı.")
+
+    def _run_transcribe_job(self, job: Job, cancel: threading.Event) -> str:
+        """
+        Job handler: transcribes a block, continuing from the upload or the
+        started transcription recorded by an earlier attempt.
+        Returns the block's formatted text for the transcript panel.
+        """
+        if self.gladia_service is None:
+            self.gladia_service = GladiaService()
 
-                formatted = format_transcript(result, include_timestamps=True)
-                self.transcripts[filepath] = formatted
-                all_text.append(f"--- {os.path.basename(filepath)} ---\n{formatted}")
-
-                # Update card status
-                self.after(0, lambda p=filepath: self.block_cards.get(p, None) and
-                          self.block_cards[p].set_status("✓ Tamamlandı"))
+        filepath = job.filepath
+        try:
+            result = self.gladia_service.transcribe_file(
+                filepath,
+                on_progress=lambda msg: self.ui.post(
+                    "status", self._set_status, f"{os.path.basename(filepath)}: {msg}"
+                ),
+                session_offset=job.session_offset,
+                audio_url=job.audio_url,
+                transcription_id=job.transcription_id,
+                on_stage=lambda stage, value: self.jobs.record_stage(job.id, stage, value),
+                cancel=cancel,
+            )
+        except TranscriptionFailed:
+            # A failed transcription cannot be polled again; retry from the upload
+            self.jobs.update(job.id, transcription_id=None)
+            raise
+
+        self.transcripts.save(filepath, result, job.session)
+        self.manifest.set_status(filepath, STATUS_TRANSCRIBED)
+        self.search_index.index_transcript(result["transcript"], job.session)
+        formatted = format_transcript(result, include_timestamps=True)
+
+        return f"--- {os.path.basename(filepath)} ---\n{formatted}"
+
+    def _resume_jobs(self):
+        """Starts the job queue; jobs left unfinished by the last run continue."""
+        unfinished = self.jobs.store.unfinished()
+        for job in unfinished:
+            self._on_job_changed(job)
+
+        self.jobs.start()
+        self._update_jobs_button()
+        if unfinished:
+            self._set_status(f"{len(unfinished)} yarım kalan iş devam ediyor...")
+
+    def _on_job_changed(self, job: Job):
+        """Shows a job's state on its block, the jobs button and the status bar."""
+        self.ui.post("jobs", self._update_jobs_button)
+
+        if job.kind == JOB_TRANSCRIBE:
+            self.ui.post(
+                ("block_status", job.filepath),
+                self._set_block_status,
+                job.filepath,
+                self._job_status_text(job),
+            )
+            # Failures are summarized once per batch; details stay in the jobs popup
+            if job.state == STATE_ERROR:
+                self.ui.post(
+                    "status",
+                    self._set_status,
+                    f"Transkripsiyon hatası ({os.path.basename(job.filepath)}): {job.error}",
+                )
 
-            except Exception as e:
-                self.after(0, lambda p=filepath: self.block_cards.get(p, None) and
-                          self.block_cards[p].set_status("✗ Hata"))
-                self.after(0, lambda e=e: messagebox.showerror(
-                    "Hata", f"Transkripsiyon hatası: {e}"
-                ))
+        elif job.kind == JOB_NOTES:
+            finished = job.finished or job.state == STATE_RETRY
+            state = "normal" if finished else "disabled"
+            self.ui.post("notes_buttons", self._set_notes_buttons_state, state)
+            if job.state == STATE_RETRY:
+                self.ui.post("status", self._set_status, f"Not oluşturma: {self._job_status_text(job)}")
+            elif job.state == STATE_ERROR:
+                self.ui.post("status", self._show_error, f"Not oluşturma hatası: {job.error}")
+
+    def _job_status_text(self, job: Job) -> str:
+        """Returns the status text shown for a job."""
+        if job.state == STATE_DONE:
+            return "✓ Tamamlandı"
+        if job.state == STATE_ERROR:
+            return "✗ Hata"
+        if job.state == STATE_CANCELLED:
+            return "⏹ İptal edildi"
+        if job.state == STATE_RETRY:
+            return f"↻ Tekrar denenecek ({job.attempts}/{self.jobs.max_attempts})"
+        if job.state == STATE_QUEUED:
+            return "Sırada"
+        if job.kind == JOB_NOTES:
+            return "Oluşturuluyor..."
+        return {
+            "started": "Çevriliyor...",
+            "uploaded": "Başlatılıyor...",
+        }.get(job.stage, "Yükleniyor...")
+
+    def _update_jobs_button(self):
+        """Shows the number of unfinished jobs on the jobs button."""
+        active = len(self.jobs.store.unfinished())
+        self.jobs_button.configure(text=f"⚙ İşler ({active})" if active else "⚙ İşler")
+
+    def _show_jobs(self):
+        """
+        Shows recent jobs in a popup. Unfinished jobs can be moved to the
+        front (📌) or cancelled; failed and cancelled jobs can be retried.
+        """
+        window = ctk.CTkToplevel(self)
+        window.title("İşler")
+        window.geometry("620x420")
+        window.transient(self)
+
+        header = ctk.CTkFrame(window, fg_color="transparent")
+        header.pack(fill="x", padx=15, pady=(10, 5))
+
+        rows = ctk.CTkScrollableFrame(window, fg_color="transparent")
+        rows.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        def fill():
+            for child in rows.winfo_children():
+                child.destroy()
+
+            for job in self.jobs.store.jobs():
+                name = os.path.basename(job.filepath) if job.kind == JOB_TRANSCRIBE else "Notlar"
+                started = datetime.fromtimestamp(job.created_at).strftime("%d.%m %H:%M")
+                pinned = "📌 " if job.priority > 0 and not job.finished else ""
+                text = f"{pinned}#{job.id}  {started}  {name}  —  {self._job_status_text(job)}"
+                if job.error and job.state != STATE_DONE:
+                    text += f"\n{job.error[:200]}"
+
+                row = ctk.CTkFrame(rows, fg_color="gray20")
+                row.pack(fill="x", pady=2)
+                ctk.CTkLabel(row, text=text, anchor="w", justify="left").pack(
+                    side="left", fill="x", expand=True, padx=10, pady=4
+                )
+                if job.state in (STATE_ERROR, STATE_CANCELLED):
+                    actions = [("↻", retry)]
+                elif job.finished:
+                    actions = []
+                else:
+                    actions = [("✕", cancel), ("📌", prioritize)]
+
+                for label, action in actions:
+                    ctk.CTkButton(
+                        row,
+                        text=label,
+                        width=32,
+                        command=lambda job_id=job.id, action=action: action(job_id),
+                    ).pack(side="right", padx=(0, 5))
+
+        def retry(job_id: int):
+            self.jobs.retry(job_id)
+            fill()
+
+        def cancel(job_id: int):
+            self.jobs.cancel(job_id)
+            # A running job finishes cancelling on its worker shortly after
+            window.after(1000, fill)
+            fill()
+
+        def prioritize(job_id: int):
+            self.jobs.prioritize(job_id)
+            fill()
+
+        def cancel_all():
+            self.jobs.cancel_all()
+            window.after(1000, fill)
+            fill()
+
+        def clear():
+            self.jobs.store.clear_finished()
+            self._update_jobs_button()
+            fill()
+
+        ctk.CTkButton(
+            header, text="Yenile", width=70, height=28,
+            fg_color="gray30", hover_color="gray40", command=fill,
+        ).pack(side="left")
+        ctk.CTkButton(
+            header, text="Bitenleri Temizle", width=120, height=28,
+            fg_color="gray30", hover_color="gray40", command=clear,
+        ).pack(side="right")
+        ctk.CTkButton(
+            header, text="Tümünü İptal Et", width=120, height=28,
+            fg_color="#c0392b", hover_color="#e74c3c", command=cancel_all,
+        ).pack(side="right", padx=(0, 10))
 
-        final_text = "\n\n".join(all_text)
-        self.after(0, lambda: self._update_transcript(final_text))
-        self.after(0, lambda: self.transcribe_button.configure(state="normal"))
-        self.after(0, lambda: self._set_status("Transkripsiyon tamamlandı."))
+        fill()
 
     def _update_transcript(self, text: str):
-        """Updates the transcript text area."""
+        """Replaces the transcript text area contents."""
+        self._clear_transcript_text()
+        self._append_transcript(text)
+
+    def _append_transcript(self, text: str):
+        """
+        Appends text to the transcript area.
+        Large texts are split into line chunks inserted on successive UI
+        ticks so the main loop never stalls on a single huge insert.
+        """
+        lines = text.splitlines(keepends=True)
+        for i in range(0, len(lines), TRANSCRIPT_CHUNK_LINES):
+            self._transcript_queue.append("".join(lines[i:i + TRANSCRIPT_CHUNK_LINES]))
+
+        if not self._transcript_draining:
+            self._transcript_draining = True
+            self.after(1, self._drain_transcript_queue)
+
+    def _drain_transcript_queue(self):
+        """Inserts one queued chunk and reschedules itself while chunks remain."""
+        if self._transcript_queue:
+            self.transcript_text.insert("end", self._transcript_queue.popleft())
+
+        if self._transcript_queue:
+            self.after(1, self._drain_transcript_queue)
+        else:
+            self._transcript_draining = False
+
+    def _clear_transcript_text(self):
+        """Clears the transcript text area and any pending inserts."""
+        self.displayed_blocks = []
+        self._transcript_queue.clear()
         self.transcript_text.delete("1.0", "end")
-        self.transcript_text.insert("1.0", text)
 
-    def _generate_notes(self):
-        """Generates notes from transcript using Gemini."""
+    def _search_transcripts(self):
+        """Searches all indexed transcripts and shows the hits."""
+        query = self.search_entry.get().strip()
+        if not query:
+            return
+
+        hits = self.search_index.search(query)
+        self._show_search_results(query, hits)
+
+    def _show_search_results(self, query: str, hits: List[SearchHit]):
+        """Shows search hits in a popup; clicking a hit jumps to its block."""
+        window = ctk.CTkToplevel(self)
+        window.title(f"Arama: {query}")
+        window.geometry("620x420")
+        window.transient(self)
+
+        ctk.CTkLabel(
+            window,
+            text=f"{len(hits)} sonuç",
+            font=ctk.CTkFont(size=12, weight="bold"),
+        ).pack(anchor="w", padx=15, pady=(10, 5))
+
+        results = ctk.CTkScrollableFrame(window, fg_color="transparent")
+        results.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        for hit in hits:
+            name = os.path.basename(hit.block_path).replace(".wav", "").replace("block_", "Blok ")
+            ctk.CTkButton(
+                results,
+                text=f"[{format_timestamp(hit.start)}] {name}\n{hit.snippet}",
+                anchor="w",
+                fg_color="gray20",
+                hover_color="gray30",
+                command=lambda h=hit, w=window: self._jump_to_hit(h, w),
+            ).pack(fill="x", pady=2)
+
+    def _jump_to_hit(self, hit: SearchHit, window):
+        """Shows the transcript of the hit's block and scrolls to the hit."""
+        window.destroy()
+
+        transcript = self.transcripts.get(hit.block_path)
+        if transcript is None:
+            transcript = self.search_index.block_transcript(hit.block_path)
+        if transcript is None:
+            return
+
+        self._update_transcript(
+            f"--- {os.path.basename(hit.block_path)} ---\n{format_transcript(transcript)}"
+        )
+        self.displayed_blocks = [hit.block_path]
+        self._scroll_transcript_to(f"[{format_timestamp(hit.start)}]")
+
+        if hit.block_path in self.blocks:
+            self.blocks.set_selected(hit.block_path, True)
+            self.block_list.scroll_to(hit.block_path)
+            self._update_selection_count()
+
+    def _scroll_transcript_to(self, marker: str):
+        """Scrolls the transcript area to `marker` once pending inserts are done."""
+        if self._transcript_draining:
+            self.after(20, lambda: self._scroll_transcript_to(marker))
+            return
+
+        index = self.transcript_text.search(marker, "1.0", stopindex="end")
+        if index:
+            self.transcript_text.see(index)
+            self.transcript_text.tag_remove("sel", "1.0", "end")
+            self.transcript_text.tag_add("sel", index, f"{index} lineend")
+
+    def _generate_notes(self, regenerate: bool = False):
+        """
+        Generates notes from transcript using Gemini.
+        Cached notes are reused unless `regenerate` is set.
+        """
         transcript = self.transcript_text.get("1.0", "end").strip()
 
         if not transcript:
             messagebox.showwarning("Uyarı", "Önce bir transkript oluşturun!")
             return
 
+        if not self._ensure_gemini_service():
+            return
+
+        # Use the rolling summary when it already covers everything shown
+        rolling = None
+        if (
+            self.rolling_notes_var.get()
+            and self.rolling_notes is not None
+            and self.rolling_notes.covers(self.displayed_blocks)
+        ):
+            rolling = self.rolling_notes
+
+        self._set_notes_buttons_state("disabled")
+        self._set_status("Notlar oluşturuluyor...")
+
+        thread = threading.Thread(
+            target=self._submit_notes_worker,
+            args=(transcript, list(self.displayed_blocks), regenerate, rolling),
+            daemon=True,
+        )
+        thread.start()
+
+    def _ensure_gemini_service(self) -> bool:
+        """Creates the Gemini service on first use; returns False on error."""
         if self.gemini_service is None:
             try:
                 self.gemini_service = GeminiService()
             except ValueError as e:
                 messagebox.showerror("Hata", str(e))
-                return
+                return False
+        return True
+
+    def _compact_for_llm(self, transcript: str, blocks: List[str]) -> CompactionResult:
+        """
+        Compacts the transcript before it is sent to Gemini.
+        Uses the stored per-block transcripts (with speakers) when all shown
+        blocks have one, otherwise the displayed text. The panel is not changed.
+        """
+        stored = [self.transcripts.get(path) for path in blocks]
+        if stored and all(t is not None for t in stored):
+            return compact_transcript(stored)
+        return compact_text(transcript)
+
+    def _submit_notes_worker(
+        self,
+        transcript: str,
+        blocks: List[str],
+        regenerate: bool = False,
+        rolling: Optional[RollingNotes] = None,
+    ):
+        """
+        Background worker that compacts the transcript and queues a notes job.
+        The compacted text is stored with the job so it can run after a restart.
+        """
+        compaction = self._compact_for_llm(transcript, blocks)
+        self.ui.post(
+            "status", self._set_status, f"Notlar oluşturuluyor... ({compaction.describe()})"
+        )
+        self.jobs.submit(
+            JOB_NOTES,
+            payload=json.dumps({
+                "text": compaction.text,
+                "blocks": blocks,
+                "regenerate": regenerate,
+                "rolling": rolling is not None,
+            }, ensure_ascii=False),
+        )
 
-        self.generate_notes_button.configure(state="disabled")
-        self._set_status("Notlar oluşturuluyor...")
+    def _run_notes_job(self, job: Job, cancel: threading.Event) -> str:
+        """
+        Job handler: generates notes and streams them into the notes panel.
+        Streamed pieces are buffered here and flushed to the panel by
+        `_flush_notes_buffer` at NOTES_REFRESH_MS intervals. The rolling
+        summary is used while it still covers the job's blocks; it is not
+        persisted, so resumed jobs use the stored transcript text instead.
+        """
+        options = json.loads(job.payload)
+        if self.gemini_service is None:
+            self.gemini_service = GeminiService()
+
+        rolling = self.rolling_notes if options["rolling"] else None
+        if rolling is not None and rolling.covers(options["blocks"]):
+            stream = rolling.finalize_stream(regenerate=options["regenerate"])
+        else:
+            stream = self.gemini_service.generate_notes_stream(
+                options["text"], regenerate=options["regenerate"]
+            )
+
+        self._notes_streaming = True
+        self.ui.call(self._begin_notes_stream)
+        try:
+            parts = []
+            for piece in stream:
+                if cancel.is_set():
+                    raise OperationCancelled("Note generation cancelled")
+                parts.append(piece)
+                with self._notes_lock:
+                    self._notes_buffer.append(piece)
+
+        except Exception:
+            # The next attempt starts over in a cleared panel
+            with self._notes_lock:
+                self._notes_buffer.clear()
+            raise
+
+        finally:
+            self._notes_streaming = False
+            self.ui.call(self._flush_notes_buffer)
+
+        self.current_notes = "".join(parts)
+        usage = self.gemini_service.usage.describe()
+        self.ui.post("status", self._set_status, f"Notlar oluşturuldu. ({usage})")
+        return self.current_notes
+
+    def _begin_notes_stream(self):
+        """Clears the notes panel and starts flushing streamed pieces into it."""
+        self.notes_text.delete("1.0", "end")
+        self.after(NOTES_REFRESH_MS, self._flush_notes_buffer)
+
+    def _set_notes_buttons_state(self, state: str):
+        """Enables or disables the note generation buttons."""
+        self.generate_notes_button.configure(state=state)
+        self.regenerate_notes_button.configure(state=state)
+
+    def _ask_question(self):
+        """Answers a question about the transcript below the current notes."""
+        question = self.question_entry.get().strip()
+        transcript = self.transcript_text.get("1.0", "end").strip()
+
+        if not question or self._notes_streaming:
+            return
+
+        if not transcript:
+            messagebox.showwarning("Uyarı", "Önce bir transkript oluşturun!")
+            return
+
+        if not self._ensure_gemini_service():
+            return
+
+        self.question_entry.delete(0, "end")
+        self._set_status("Soru yanıtlanıyor...")
+
+        prefix = "\n\n" if self.notes_text.get("1.0", "end").strip() else ""
+        self.notes_text.insert("end", f"{prefix}**Soru:** {question}\n\n")
+        self._notes_streaming = True
+        self.after(NOTES_REFRESH_MS, self._flush_notes_buffer)
 
         thread = threading.Thread(
-            target=self._generate_notes_worker,
-            args=(transcript,),
+            target=self._answer_question_worker,
+            args=(transcript, list(self.displayed_blocks), question),
             daemon=True,
         )
         thread.start()
 
-    def _generate_notes_worker(self, transcript: str):
-        """Background worker for note generation."""
+    def _answer_question_worker(self, transcript: str, blocks: List[str], question: str):
+        """Background worker that streams an answer into the notes panel."""
         try:
-            notes = self.gemini_service.generate_notes(transcript)
-            self.current_notes = notes
+            compaction = self._compact_for_llm(transcript, blocks)
+            stream = self.gemini_service.answer_question_stream(compaction.text, question)
+            for piece in stream:
+                with self._notes_lock:
+                    self._notes_buffer.append(piece)
 
-            self.after(0, lambda: self._update_notes(notes))
-            self.after(0, lambda: self._set_status("Notlar oluşturuldu."))
+            usage = self.gemini_service.usage.describe()
+            self.ui.post("status", self._set_status, f"Soru yanıtlandı. ({usage})")
 
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror(
-                "Hata", f"Not oluşturma hatası: {e}"
-            ))
+            self.ui.post("status", self._show_error, f"Soru yanıtlama hatası: {e}")
 
         finally:
-            self.after(0, lambda: self.generate_notes_button.configure(state="normal"))
+            self._notes_streaming = False
+            self.ui.call(self._flush_notes_buffer)
+
+    def _flush_notes_buffer(self):
+        """Appends buffered note pieces to the notes panel while streaming."""
+        with self._notes_lock:
+            text = "".join(self._notes_buffer)
+            self._notes_buffer.clear()
+
+        if text:
+            self.notes_text.insert("end", text)
+            self.notes_text.see("end")
+
+        if self._notes_streaming:
+            self.after(NOTES_REFRESH_MS, self._flush_notes_buffer)
 
     def _update_notes(self, notes: str):
         """Updates the notes text area."""
@@ -926,10 +1912,56 @@ class AudioTranscriberApp(ctk.CTk):
             except Exception as e:
                 messagebox.showerror("Hata", f"Kaydetme hatası: {e}")
 
+    def _export_usage(self):
+        """Exports the session's Gemini token usage as JSON or CSV."""
+        if self.gemini_service is None or not self.gemini_service.usage.requests:
+            messagebox.showwarning("Uyarı", "Henüz Gemini isteği yapılmadı!")
+            return
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")],
+            initialfile=f"usage_{timestamp}.json",
+        )
+
+        if filepath:
+            try:
+                self.gemini_service.usage.export(filepath)
+                self._set_status(f"Kullanım kaydedildi: {os.path.basename(filepath)}")
+            except Exception as e:
+                messagebox.showerror("Hata", f"Kaydetme hatası: {e}")
+
+    def _export_transcripts(self):
+        """Exports stored transcripts of the selected blocks as SRT, VTT or JSON Lines."""
+        blocks = [p for p in self._get_selected_blocks() if self.transcripts.has(p)]
+
+        if not blocks:
+            messagebox.showwarning("Uyarı", "Seçili bloklarda transkript bulunmuyor!")
+            return
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = filedialog.asksaveasfilename(
+            defaultextension=".srt",
+            filetypes=[
+                ("SubRip", "*.srt"),
+                ("WebVTT", "*.vtt"),
+                ("JSON Lines", "*.jsonl"),
+            ],
+            initialfile=f"transcript_{timestamp}.srt",
+        )
+
+        if filepath:
+            try:
+                count = export_transcripts(blocks, filepath)
+                self._set_status(f"{count} satır dışa aktarıldı: {os.path.basename(filepath)}")
+            except Exception as e:
+                messagebox.showerror("Hata", f"Dışa aktarma hatası: {e}")
+
     def _clear_transcript(self):
         """Clears the transcript text area."""
-        self.transcript_text.delete("1.0", "end")
-        self.transcripts.clear()
+        self._clear_transcript_text()
+        self.transcripts.clear_cache()
 
     def _clear_notes(self):
         """Clears the notes text area."""
@@ -938,7 +1970,23 @@ class AudioTranscriberApp(ctk.CTk):
 
     def _set_status(self, message: str):
         """Updates the status bar."""
-        self.status_label.configure(text=message)
+        self.status_label.configure(text=message, text_color="gray60")
+
+    def _show_error(self, message: str):
+        """
+        Shows an error from a worker thread in the status bar. Used instead of
+        a modal dialog, which would hold up the UI dispatcher until dismissed.
+        """
+        self.status_label.configure(text=f"⚠ {message}", text_color="#e74c3c")
+
+    def _update_ui_stats(self):
+        """Shows the UI dispatcher's queue depth next to the status bar."""
+        stats = self.ui.stats()
+        self.ui_stats_label.configure(
+            text=f"UI kuyruğu {stats['depth']} (en çok {stats['peak_depth']}, "
+            f"{stats['coalesced']}/{stats['posted']} birleştirildi)"
+        )
+        self.after(UI_STATS_INTERVAL_MS, self._update_ui_stats)
 
     def _update_timer(self):
         """Updates the recording timer display."""
@@ -959,6 +2007,18 @@ class AudioTranscriberApp(ctk.CTk):
 
         self.after(1000, self._update_timer)
 
+    def _update_playback(self):
+        """Updates the playing block's progress from the playback engine."""
+        if self.player.is_active:
+            self.block_list.update_playback()
+        self.after(100, self._update_playback)
+
+    def _on_playback_finished(self, filepath: str):
+        """Called when a block has played to the end."""
+        if self.player.filepath == filepath:
+            self.player.stop()
+        self.block_list.update_playback()
+
 
 def main():
     """Application entry point."""
@@ -5,9 +5,11 @@ import numpy as np
 import sounddevice as sd
 import soundfile as sf
 from datetime import datetime
-from typing import Callable, Optional, List, Tuple
+from typing import Callable, Optional, List, Tuple, Dict
 
 from .config import SAMPLE_RATE, BLOCK_DURATION_MINUTES, RECORDINGS_DIR
+from .manifest import BlockManifest
+from .waveform import peaks_from_array, save_peaks
 
 
 class AudioRecorder:
@@ -20,6 +22,7 @@ class AudioRecorder:
         self,
         on_block_created: Optional[Callable[[str], None]] = None,
         block_duration_minutes: int = BLOCK_DURATION_MINUTES,
+        manifest: Optional[BlockManifest] = None,
     ):
         self.sample_rate = SAMPLE_RATE
         self.block_duration = block_duration_minutes * 60  # Convert to seconds
@@ -28,6 +31,12 @@ class AudioRecorder:
         self.is_recording = False
         self.recorded_blocks: List[str] = []
 
+        # Session bookkeeping: start of each block within its recording session
+        self.session_id: Optional[str] = None
+        self.block_offsets: Dict[str, float] = {}
+        self.block_sessions: Dict[str, str] = {}
+        self._session_frames = 0
+
         self._mic_stream = None
         self._loopback_stream = None
         self._recording_thread = None
@@ -40,6 +49,7 @@ class AudioRecorder:
 
         # Ensure recordings directory exists
         os.makedirs(RECORDINGS_DIR, exist_ok=True)
+        self.manifest = manifest or BlockManifest(RECORDINGS_DIR)
 
     def _get_device_channels(self, device_id: int) -> int:
         """Returns the number of input channels for a device (max 2)."""
@@ -112,6 +122,8 @@ class AudioRecorder:
         self._start_time = time.time()
         self._current_block_start = self._start_time
         self.recorded_blocks = []
+        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._session_frames = 0
 
         self._recording_thread = threading.Thread(
             target=self._recording_loop,
@@ -236,14 +248,33 @@ class AudioRecorder:
             sf.write(filepath, mixed_audio, self.sample_rate)
 
             self.recorded_blocks.append(filepath)
+            self.block_offsets[filepath] = self._session_frames / self.sample_rate
+            self.block_sessions[filepath] = self.session_id
+            self._session_frames += len(mixed_audio)
 
             # Clear buffers
             self._mic_buffer = []
             self._loopback_buffer = []
 
-            # Notify callback
-            if self.on_block_created:
-                self.on_block_created(filepath)
+        # Outside the lock: hashing the file must not stall the audio callbacks.
+        # Waveform peaks come from the audio still in memory, not from the file.
+        try:
+            save_peaks(filepath, peaks_from_array(mixed_audio))
+        except Exception as e:
+            print(f"Waveform error: {e}")
+
+        try:
+            self.manifest.record_block(
+                filepath,
+                session=self.session_id or "",
+                session_offset=self.block_offsets[filepath],
+            )
+        except Exception as e:
+            print(f"Manifest error: {e}")
+
+        # Notify callback
+        if self.on_block_created:
+            self.on_block_created(filepath)
 
     def _mix_audio(self) -> Optional[np.ndarray]:
         """Mixes microphone and loopback audio into a single array."""
@@ -0,0 +1,142 @@
+import os
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import soundfile as sf
+
+
+@dataclass
+class BlockEntry:
+    """State of a single block in the block list."""
+
+    filepath: str
+    selected: bool = True
+    status: str = ""
+    duration: Optional[float] = None    # Read from the file on first use
+
+
+def get_duration(filepath: str) -> float:
+    """Returns the duration of an audio file in seconds (0 if unreadable)."""
+    try:
+        return sf.info(filepath).duration
+    except Exception:
+        return 0.0
+
+
+def block_sort_key(filepath: str) -> str:
+    """Returns the key blocks are listed by (their filename, as in the directory listing)."""
+    return os.path.basename(filepath)
+
+
+class BlockListModel:
+    """
+    List of blocks with their selection state, kept in filename order.
+
+    Kept separate from the widgets so a list of thousands of blocks costs no
+    more than a few dictionaries; the block and selection counts are
+    maintained incrementally instead of being recounted on every change.
+    """
+
+    def __init__(self):
+        self.entries: List[BlockEntry] = []
+        self.selected_count = 0
+        self._index: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index: int) -> BlockEntry:
+        return self.entries[index]
+
+    def __contains__(self, filepath: str) -> bool:
+        return filepath in self._index
+
+    def get(self, filepath: str) -> Optional[BlockEntry]:
+        """Returns a block's entry, or None if it is not in the list."""
+        index = self._index.get(filepath)
+        return self.entries[index] if index is not None else None
+
+    def index_of(self, filepath: str) -> Optional[int]:
+        """Returns a block's position in the list."""
+        return self._index.get(filepath)
+
+    def add(
+        self,
+        filepath: str,
+        status: str = "",
+        selected: bool = True,
+        duration: Optional[float] = None,
+    ) -> bool:
+        """Inserts a block at its sorted position; returns False if it is already listed."""
+        if filepath in self._index:
+            return False
+
+        # New blocks usually sort last, which makes this an append
+        index = bisect_right(
+            self.entries,
+            block_sort_key(filepath),
+            key=lambda entry: block_sort_key(entry.filepath),
+        )
+        self.entries.insert(index, BlockEntry(filepath, selected, status, duration))
+        for i in range(index, len(self.entries)):
+            self._index[self.entries[i].filepath] = i
+        if selected:
+            self.selected_count += 1
+        return True
+
+    def remove(self, filepath: str) -> bool:
+        """Removes a block; returns False if it is not listed."""
+        index = self._index.pop(filepath, None)
+        if index is None:
+            return False
+
+        entry = self.entries.pop(index)
+        if entry.selected:
+            self.selected_count -= 1
+        for i in range(index, len(self.entries)):
+            self._index[self.entries[i].filepath] = i
+        return True
+
+    def set_selected(self, filepath: str, selected: bool):
+        """Selects or deselects a block."""
+        entry = self.get(filepath)
+        if entry is None or entry.selected == selected:
+            return
+        entry.selected = selected
+        self.selected_count += 1 if selected else -1
+
+    def select_all(self, selected: bool = True):
+        """Selects or deselects every block."""
+        for entry in self.entries:
+            entry.selected = selected
+        self.selected_count = len(self.entries) if selected else 0
+
+    def selected_paths(self) -> List[str]:
+        """Returns the selected blocks in list order."""
+        return [entry.filepath for entry in self.entries if entry.selected]
+
+    def set_duration(self, filepath: str, duration: float):
+        """Sets a block's known duration."""
+        entry = self.get(filepath)
+        if entry is not None:
+            entry.duration = duration
+
+    def set_status(self, filepath: str, status: str):
+        """Sets the status text shown for a block."""
+        entry = self.get(filepath)
+        if entry is not None:
+            entry.status = status
+
+    def duration(self, filepath: str) -> float:
+        """Returns a block's duration, reading the file header on first use."""
+        entry = self.get(filepath)
+        if entry is None:
+            return 0.0
+
+        with self._lock:
+            if entry.duration is None:
+                entry.duration = get_duration(filepath)
+            return entry.duration
@@ -0,0 +1,150 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from .config import COMPACTION_TIMESTAMP_SECONDS
+from .token_budget import estimate_tokens
+from .transcript import Transcript
+
+# Hesitation sounds and fillers that carry no content (Turkish and English).
+# Case is spelled out per letter: with IGNORECASE the dotless "ı" would also
+# match the pronoun "I". Every form is at least two letters long, so single
+# letters are never taken for fillers.
+_FILLER_RE = re.compile(
+    r"(?<!\w)(?:ı{2,}m*|ım+|[Ee]{2,}[Hh]*|[Ee][Hh]+|[Hh]+[Mm]+|[Hh]ı+m*|[Uu]+[Mm]+|[Uu]+[Hh]+|[Aa][Hh]{2,})"
+    r"(?!\w)[,.…]*\s*"
+)
+# Words repeated three or more times ("ben ben ben" -> "ben"); exact doubles
+# are kept, as Turkish uses them grammatically ("hemen hemen", "yavaş yavaş")
+_REPEAT_RE = re.compile(r"\b(\w+)(?:[\s,]+\1\b){2,}", re.IGNORECASE)
+_SPACE_RE = re.compile(r"\s+")
+
+# Lines of the formatted transcript: "[HH:MM:SS] text" and "--- block ---"
+_LINE_RE = re.compile(r"^\[(\d+):(\d{2}):(\d{2})\]\s*(.*)$")
+_SEPARATOR_RE = re.compile(r"^---.*---$")
+
+
+@dataclass
+class CompactionResult:
+    """Compacted transcript text with its size before and after compaction."""
+
+    text: str
+    original_tokens: int
+    compacted_tokens: int
+
+    @property
+    def ratio(self) -> float:
+        """Compacted size as a fraction of the original size."""
+        if not self.original_tokens:
+            return 1.0
+        return self.compacted_tokens / self.original_tokens
+
+    def describe(self) -> str:
+        """Returns a short status-bar summary."""
+        return f"transkript %{round((1 - self.ratio) * 100)} kısaltıldı"
+
+
+def clean_text(text: str) -> str:
+    """Removes fillers and repeated words from an utterance."""
+    text = _FILLER_RE.sub("", text)
+    text = _REPEAT_RE.sub(r"\1", text)
+    return _SPACE_RE.sub(" ", text).strip(" ,")
+
+
+class _Compactor:
+    """Merges cleaned utterances into speaker turns with coarse timestamps."""
+
+    def __init__(self, timestamp_interval: float):
+        self.timestamp_interval = timestamp_interval
+        self.lines: List[str] = []
+        self._speaker: Optional[int] = None
+        self._turn: List[str] = []
+        self._turn_start = 0.0
+        self._last_stamp: Optional[float] = None
+        self._last_text = ""
+
+    def add(self, start: float, speaker: Optional[int], text: str):
+        text = clean_text(text)
+        if not text:
+            return
+
+        # Drop repeated utterances (e.g. overlapping block edges)
+        key = text.casefold()
+        if key == self._last_text:
+            return
+        self._last_text = key
+
+        if speaker is None or speaker != self._speaker or not self._turn:
+            self._flush()
+            self._speaker = speaker
+            self._turn_start = start
+        self._turn.append(text)
+
+    def _flush(self):
+        if not self._turn:
+            return
+
+        prefix = ""
+        if self._last_stamp is None or self._turn_start - self._last_stamp >= self.timestamp_interval:
+            minutes = int(self._turn_start // 60)
+            prefix = f"[{minutes // 60:02d}:{minutes % 60:02d}] "
+            self._last_stamp = self._turn_start
+
+        speaker = f"K{self._speaker + 1}: " if self._speaker is not None else ""
+        self.lines.append(f"{prefix}{speaker}{' '.join(self._turn)}")
+        self._turn = []
+
+    def text(self) -> str:
+        self._flush()
+        return "\n".join(self.lines)
+
+
+def compact_transcript(
+    transcripts: Iterable[Transcript],
+    timestamp_interval: float = COMPACTION_TIMESTAMP_SECONDS,
+) -> CompactionResult:
+    """
+    Compacts structured transcripts for submission to the language model.
+    Consecutive utterances of a speaker are merged into one turn, fillers and
+    repeats are removed and timestamps are kept at minute precision, at most
+    once per `timestamp_interval` seconds.
+    """
+    compactor = _Compactor(timestamp_interval)
+
+    # Size of the same transcripts in the displayed format
+    original = ""
+    for transcript in transcripts:
+        lines = [f"--- {transcript.block_paths[0]} ---"]
+        for utterance in transcript:
+            lines.append(f"[00:00:00] {utterance.text}")
+            compactor.add(utterance.start, utterance.speaker, utterance.text)
+        original += "\n".join(lines) + "\n\n"
+
+    text = compactor.text()
+    return CompactionResult(text, estimate_tokens(original), estimate_tokens(text))
+
+
+def compact_text(
+    text: str,
+    timestamp_interval: float = COMPACTION_TIMESTAMP_SECONDS,
+) -> CompactionResult:
+    """
+    Compacts an already formatted transcript (see `format_transcript`).
+    Used when the structured transcripts are not available; speakers are
+    unknown here, so lines are cleaned but not merged.
+    """
+    compactor = _Compactor(timestamp_interval)
+    start = 0.0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or _SEPARATOR_RE.match(line):
+            continue
+
+        match = _LINE_RE.match(line)
+        if match:
+            hours, minutes, seconds, line = match.groups()
+            start = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+        compactor.add(start, None, line)
+
+    compacted = compactor.text()
+    return CompactionResult(compacted, estimate_tokens(text), estimate_tokens(compacted))
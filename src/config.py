@@ -9,9 +9,109 @@ SAMPLE_RATE = 44100
 BLOCK_DURATION_MINUTES = 10
 RECORDINGS_DIR = "recordings"
 
+# Block metadata manifest, kept inside each recordings directory
+MANIFEST_FILENAME = "manifest.db"
+
+# Waveform thumbnails: frames per peak at the finest zoom level, and the
+# reduction between consecutive zoom levels
+WAVEFORM_BUCKET_FRAMES = 256
+WAVEFORM_ZOOM_FACTOR = 4
+
+# Full-text search index over all transcripts
+SEARCH_INDEX_PATH = os.path.join(RECORDINGS_DIR, "transcripts.db")
+
 # Gladia API settings
 GLADIA_API_URL = "https://api.gladia.io/v2/transcription"
 GLADIA_UPLOAD_URL = "https://api.gladia.io/v2/upload"
 
+# Gladia rate limits per request category: (requests per second, burst size)
+GLADIA_RATE_LIMITS = {
+    "upload": (1.0, 2),
+    "start": (1.0, 2),
+    "poll": (5.0, 10),
+}
+GLADIA_MAX_CONCURRENCY = 4
+GLADIA_MAX_RETRIES = 5
+
+# Fixed socket send buffer for upload connections (bytes), or None to keep
+# the kernel's autotuning. Cancelled uploads stop at once either way; a
+# small fixed buffer also limits upload throughput
+GLADIA_UPLOAD_SEND_BUFFER = None
+
+# Blocks transcribed in parallel
+TRANSCRIBE_CONCURRENCY = 3
+
+# Persistent job queue for transcription and note generation. Failed jobs
+# are retried after JOB_RETRY_BASE_SECONDS, doubling up to
+# JOB_RETRY_MAX_SECONDS, and given up after JOB_MAX_ATTEMPTS attempts
+JOB_QUEUE_PATH = os.path.join(RECORDINGS_DIR, "jobs.db")
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BASE_SECONDS = 5
+JOB_RETRY_MAX_SECONDS = 300
+
+# Watch-folder daemon: a new file is processed once its size and mtime have
+# been stable for WATCH_SETTLE_SECONDS; at most WATCH_QUEUE_SIZE files wait
+# for a worker before detection pauses
+WATCH_SETTLE_SECONDS = 3.0
+WATCH_POLL_SECONDS = 1.0
+WATCH_QUEUE_SIZE = 32
+
+# Importing external audio: files are decoded IMPORT_READ_FRAMES frames at a
+# time and cut into BLOCK_DURATION_MINUTES blocks, at the quietest point of the
+# preceding IMPORT_SILENCE_WINDOW_SECONDS when splitting on silence. The speech
+# profile stores blocks as IMPORT_SPEECH_SAMPLE_RATE mono, enough for
+# transcription. Blocks are encoded on IMPORT_WORKERS threads.
+IMPORT_READ_FRAMES = 65536
+IMPORT_SILENCE_WINDOW_SECONDS = 30
+IMPORT_SPLIT_ON_SILENCE = True
+IMPORT_SPEECH_PROFILE = False
+IMPORT_SPEECH_SAMPLE_RATE = 16000
+IMPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Lines inserted into the transcript panel per UI tick
+TRANSCRIPT_CHUNK_LINES = 400
+
+# Interval at which updates from worker threads are applied to the UI (ms)
+UI_FRAME_MS = 50
+
+# Refresh interval of the UI queue depth shown next to the status bar (ms)
+UI_STATS_INTERVAL_MS = 1000
+
+# Notes panel refresh interval while a response is streaming (ms)
+NOTES_REFRESH_MS = 100
+
 # Gemini settings
 GEMINI_MODEL = "gemini-2.5-flash"
+
+# Transcripts above this size are summarized map-reduce style in chunks
+GEMINI_SINGLE_PASS_TOKENS = 60000
+GEMINI_CHUNK_TOKENS = 20000
+GEMINI_MAX_CONCURRENCY = 4
+
+# Input token budget per Gemini request; larger requests are refused
+# (note generation splits them into chunks instead)
+GEMINI_MAX_INPUT_TOKENS = 800000
+GEMINI_EXACT_TOKEN_COUNT = False
+
+# Gemini pricing used for cost estimates (USD per million tokens)
+GEMINI_PRICE_INPUT_PER_MTOK = 0.30
+GEMINI_PRICE_OUTPUT_PER_MTOK = 2.50
+
+# Maximum length of the rolling summary kept while blocks are transcribed
+ROLLING_SUMMARY_WORDS = 400
+
+# Transcripts sent to Gemini keep at most one (minute precision) timestamp
+# per this many seconds
+COMPACTION_TIMESTAMP_SECONDS = 60
+
+# Question answering: transcripts are split into windows of utterance lines
+# and only the best matching windows are sent with the question
+QA_WINDOW_LINES = 8
+QA_WINDOW_OVERLAP = 2
+QA_TOP_K = 8
+QA_CONTEXT_TOKENS = 4000
+
+# Disk cache for Gemini responses
+GEMINI_CACHE_PATH = os.path.join(RECORDINGS_DIR, "gemini_cache.db")
+GEMINI_CACHE_TTL_SECONDS = 30 * 24 * 3600
+GEMINI_CACHE_MAX_BYTES = 50 * 1024 * 1024
@@ -0,0 +1,5 @@
+class InvalidInput(ValueError):
+    """
+    Raised for input or configuration that no retry can fix, e.g. a missing
+    API key or an empty transcript. Jobs failing with it are not retried.
+    """
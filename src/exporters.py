@@ -0,0 +1,106 @@
+import os
+import json
+from typing import Callable, Dict, Iterable, Iterator, TextIO, Tuple
+
+from .sidecar import load_sidecar
+from .transcript import Utterance
+
+
+def iter_block_utterances(audio_paths: Iterable[str]) -> Iterator[Tuple[str, str, Utterance]]:
+    """
+    Yields (block path, session, utterance) for every stored block in order.
+    Only one block's sidecar is held in memory at a time; blocks without a
+    transcript are skipped.
+    """
+    for audio_path in audio_paths:
+        result = load_sidecar(audio_path)
+        if result is None:
+            continue
+
+        for utterance in result["transcript"]:
+            yield audio_path, result["session"], utterance
+
+
+def speaker_label(speaker: int) -> str:
+    """Returns the display label for a speaker index."""
+    return f"Konuşmacı {speaker + 1}"
+
+
+def _format_time(seconds: float, separator: str) -> str:
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def _cue_text(text: str) -> str:
+    # A blank line ends a cue, so subtitle text must stay on one line
+    return " ".join(text.split())
+
+
+def write_srt(utterances: Iterable[Tuple[str, str, Utterance]], out: TextIO) -> int:
+    """Writes utterances as SubRip cues; returns the number of cues."""
+    count = 0
+    for _, _, utterance in utterances:
+        count += 1
+        out.write(
+            f"{count}\n"
+            f"{_format_time(utterance.start, ',')} --> {_format_time(utterance.end, ',')}\n"
+            f"[{speaker_label(utterance.speaker)}] {_cue_text(utterance.text)}\n\n"
+        )
+    return count
+
+
+def write_vtt(utterances: Iterable[Tuple[str, str, Utterance]], out: TextIO) -> int:
+    """Writes utterances as WebVTT cues with voice tags; returns the number of cues."""
+    out.write("WEBVTT\n\n")
+    count = 0
+    for _, _, utterance in utterances:
+        count += 1
+        out.write(
+            f"{_format_time(utterance.start, '.')} --> {_format_time(utterance.end, '.')}\n"
+            f"<v {speaker_label(utterance.speaker)}>{_cue_text(utterance.text)}\n\n"
+        )
+    return count
+
+
+def write_jsonl(utterances: Iterable[Tuple[str, str, Utterance]], out: TextIO) -> int:
+    """Writes one JSON object per utterance; returns the number of lines."""
+    count = 0
+    for block_path, session, utterance in utterances:
+        count += 1
+        out.write(json.dumps({
+            "block": os.path.basename(block_path),
+            "session": session,
+            "start": round(utterance.start, 3),
+            "end": round(utterance.end, 3),
+            "speaker": utterance.speaker,
+            "text": utterance.text,
+        }, ensure_ascii=False))
+        out.write("\n")
+    return count
+
+
+EXPORTERS: Dict[str, Callable[[Iterable[Tuple[str, str, Utterance]], TextIO], int]] = {
+    ".srt": write_srt,
+    ".vtt": write_vtt,
+    ".jsonl": write_jsonl,
+}
+
+
+def export_transcripts(audio_paths: Iterable[str], output_path: str) -> int:
+    """
+    Exports the stored transcripts of the given blocks to `output_path`.
+    The format is chosen by file extension (.srt, .vtt or .jsonl).
+
+    Returns:
+        Number of utterances written
+    """
+    extension = os.path.splitext(output_path)[1].lower()
+    writer = EXPORTERS.get(extension)
+    if writer is None:
+        raise ValueError(f"Unsupported export format: {extension}")
+
+    with open(output_path, "w", encoding="utf-8", newline="\n") as out:
+        return writer(iter_block_utterances(audio_paths), out)
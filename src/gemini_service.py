@@ -1,7 +1,35 @@
+import json
+import time
 from google import genai
-from typing import Optional
+from google.genai import types
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from .config import GEMINI_API_KEY, GEMINI_MODEL
+from .config import (
+    GEMINI_API_KEY,
+    GEMINI_MODEL,
+    GEMINI_SINGLE_PASS_TOKENS,
+    GEMINI_CHUNK_TOKENS,
+    GEMINI_MAX_CONCURRENCY,
+    ROLLING_SUMMARY_WORDS,
+    GEMINI_MAX_INPUT_TOKENS,
+    GEMINI_EXACT_TOKEN_COUNT,
+    QA_WINDOW_LINES,
+    QA_WINDOW_OVERLAP,
+    QA_TOP_K,
+    QA_CONTEXT_TOKENS,
+)
+from .errors import InvalidInput
+from .response_cache import ResponseCache, content_hash
+from .retrieval import BM25Index, split_windows
+from .token_budget import (
+    RequestUsage,
+    TokenBudgetExceeded,
+    UsageTracker,
+    estimate_cost,
+    estimate_tokens,
+)
 
 
 class GeminiService:
@@ -9,18 +37,179 @@ class GeminiService:
     Handles note generation from transcripts using Gemini AI.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+    ):
         self.api_key = api_key or GEMINI_API_KEY
         if self.api_key == "your-gemini-key-here":
-            raise ValueError("Please set a valid Gemini API key in config.py or environment")
+            raise InvalidInput("Please set a valid Gemini API key in config.py or environment")
 
         self.client = genai.Client(api_key=self.api_key)
         self.model = GEMINI_MODEL
+        self.cache = (cache or ResponseCache()) if use_cache else None
+        self.usage = UsageTracker()
+        self.max_input_tokens = GEMINI_MAX_INPUT_TOKENS
+        self._qa_index: Optional[Tuple[str, BM25Index]] = None
+
+    def count_tokens(self, contents: str, exact: bool = GEMINI_EXACT_TOKEN_COUNT) -> int:
+        """
+        Returns the input token count of `contents`.
+        Uses the local estimate unless `exact` is set, in which case the
+        model's count_tokens endpoint is asked (falling back to the estimate).
+        """
+        if exact:
+            try:
+                result = self.client.models.count_tokens(model=self.model, contents=contents)
+                if result.total_tokens is not None:
+                    return result.total_tokens
+            except Exception:
+                pass
+        return estimate_tokens(contents)
+
+    def _preflight(self, contents: str) -> int:
+        """Checks a request against the input budget; returns its token count."""
+        tokens = estimate_tokens(contents)
+        if GEMINI_EXACT_TOKEN_COUNT and tokens > self.max_input_tokens * 0.8:
+            tokens = self.count_tokens(contents, exact=True)
+
+        if tokens > self.max_input_tokens:
+            raise TokenBudgetExceeded(
+                f"Request needs ~{tokens} input tokens, budget is {self.max_input_tokens}"
+            )
+        return tokens
+
+    def _record_usage(
+        self,
+        kind: str,
+        input_tokens: int,
+        output_text: str,
+        started: float,
+        metadata=None,
+        cached: bool = False,
+    ):
+        """Records usage, preferring the model's reported counts over estimates."""
+        prompt_tokens = getattr(metadata, "prompt_token_count", None)
+        output_tokens = getattr(metadata, "candidates_token_count", None)
+        estimated = prompt_tokens is None or output_tokens is None
+
+        input_tokens = prompt_tokens if prompt_tokens is not None else input_tokens
+        if output_tokens is None:
+            output_tokens = estimate_tokens(output_text) if output_text else 0
+
+        self.usage.record(RequestUsage(
+            kind=kind,
+            model=self.model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            estimated=estimated,
+            cached=cached,
+            latency=time.perf_counter() - started,
+            cost=0.0 if cached else estimate_cost(input_tokens, output_tokens),
+        ))
+
+    def _generate(
+        self,
+        prompt: str,
+        transcript: str,
+        contents: str,
+        regenerate: bool = False,
+        settings: Optional[dict] = None,
+        config: Optional[types.GenerateContentConfig] = None,
+        kind: str = "notes",
+    ) -> str:
+        """
+        Sends `contents` to the model, going through the response cache.
+
+        Args:
+            prompt: Prompt template used to build `contents` (part of the cache key)
+            transcript: Transcript text embedded in `contents` (hashed into the key)
+            contents: Full request contents
+            regenerate: Skip the cache lookup and overwrite the cached entry
+            settings: Extra generation settings that affect the output
+            config: Optional generation config sent with the request
+            kind: Request label used in usage accounting
+
+        Raises:
+            TokenBudgetExceeded: If `contents` exceeds the input token budget
+        """
+        started = time.perf_counter()
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(self.model, prompt, transcript, settings)
+            if not regenerate:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    self._record_usage(kind, 0, "", started, cached=True)
+                    return cached
+
+        input_tokens = self._preflight(contents)
+
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=contents,
+            config=config,
+        )
+        text = response.text
+        self._record_usage(kind, input_tokens, text, started, getattr(response, "usage_metadata", None))
+
+        if key is not None and text:
+            self.cache.put(key, text)
+
+        return text
+
+    def _generate_stream(
+        self,
+        prompt: str,
+        transcript: str,
+        contents: str,
+        regenerate: bool = False,
+        settings: Optional[dict] = None,
+        kind: str = "notes",
+    ) -> Iterator[str]:
+        """
+        Streaming variant of `_generate`; yields text pieces as they arrive.
+        A cached response is yielded in one piece; a completed stream is cached.
+        """
+        started = time.perf_counter()
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(self.model, prompt, transcript, settings)
+            if not regenerate:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    self._record_usage(kind, 0, "", started, cached=True)
+                    yield cached
+                    return
+
+        input_tokens = self._preflight(contents)
+
+        parts = []
+        metadata = None
+        for chunk in self.client.models.generate_content_stream(
+            model=self.model,
+            contents=contents,
+        ):
+            metadata = getattr(chunk, "usage_metadata", None) or metadata
+            text = chunk.text
+            if text:
+                parts.append(text)
+                yield text
+
+        output = "".join(parts)
+        self._record_usage(kind, input_tokens, output, started, metadata)
+
+        if key is not None and parts:
+            self.cache.put(key, output)
 
     def generate_notes(
         self,
         transcript: str,
         custom_prompt: Optional[str] = None,
+        chunked: Optional[bool] = None,
+        regenerate: bool = False,
     ) -> str:
         """
         Generates structured notes from a transcript using Gemini.
@@ -28,22 +217,113 @@ class GeminiService:
         Args:
             transcript: The transcript text to summarize
             custom_prompt: Optional custom prompt to use
+            chunked: Force (True) or disable (False) map-reduce generation;
+                by default it is used when the transcript exceeds
+                GEMINI_SINGLE_PASS_TOKENS
+            regenerate: Bypass cached responses
 
         Returns:
             Generated notes as markdown string
         """
+        if custom_prompt is None:
+            return self.generate_all(transcript, chunked, regenerate).to_markdown()
+
+        request = self._notes_request(transcript, custom_prompt, chunked, regenerate)
+        return self._generate(*request, regenerate)
+
+    def generate_notes_stream(
+        self,
+        transcript: str,
+        custom_prompt: Optional[str] = None,
+        chunked: Optional[bool] = None,
+        regenerate: bool = False,
+    ) -> Iterator[str]:
+        """
+        Streaming variant of `generate_notes`; yields markdown pieces.
+        In map-reduce mode only the final merge is streamed.
+        """
+        request = self._notes_request(transcript, custom_prompt, chunked, regenerate)
+        return self._generate_stream(*request, regenerate)
+
+    def _notes_request(
+        self,
+        transcript: str,
+        custom_prompt: Optional[str],
+        chunked: Optional[bool],
+        regenerate: bool,
+    ) -> Tuple[str, str, str]:
+        """
+        Builds the (prompt, transcript, contents) of the final notes request.
+        For long transcripts this runs the map phase first.
+        """
         if not transcript or not transcript.strip():
-            raise ValueError("Transcript is empty")
+            raise InvalidInput("Transcript is empty")
+
+        if chunked is None:
+            chunked = estimate_tokens(transcript) > GEMINI_SINGLE_PASS_TOKENS
+
+        if chunked:
+            chunks = split_transcript(transcript, GEMINI_CHUNK_TOKENS)
+            if len(chunks) > 1:
+                return self._reduce_request(chunks, custom_prompt, regenerate)
 
         prompt = custom_prompt or self._get_default_prompt()
         full_prompt = f"{prompt}\n\n---\n\nTranskript:\n{transcript}"
 
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=full_prompt,
+        return prompt, transcript, full_prompt
+
+    def _reduce_request(
+        self,
+        chunks: List[str],
+        custom_prompt: Optional[str] = None,
+        regenerate: bool = False,
+    ) -> Tuple[str, str, str]:
+        """
+        Map-reduce note generation.
+        Partial notes are generated for all chunks in parallel; the returned
+        request merges them into the final notes with the regular note prompt.
+        """
+        joined = self._map_partial_notes(chunks, regenerate)
+        prompt = custom_prompt or self._get_default_prompt()
+        reduce_prompt = (
+            f"{prompt}\n\n"
+            "Transkript çok uzun olduğu için bölümler halinde işlendi. "
+            "Aşağıdaki bölüm notlarını birleştirerek tek bir bütün halinde yukarıdaki formatta notlar oluştur. "
+            "Tekrarlanan bilgileri birleştir."
         )
+        full_prompt = f"{reduce_prompt}\n\n---\n\nBölüm notları:\n{joined}"
+
+        return reduce_prompt, joined, full_prompt
 
-        return response.text
+    def _map_partial_notes(self, chunks: List[str], regenerate: bool = False) -> str:
+        """Generates partial notes for all chunks in parallel and joins them."""
+        with ThreadPoolExecutor(max_workers=GEMINI_MAX_CONCURRENCY) as pool:
+            partials = list(pool.map(
+                lambda item: self._generate_partial_notes(
+                    item[1], item[0] + 1, len(chunks), regenerate
+                ),
+                enumerate(chunks),
+            ))
+
+        return "\n\n".join(
+            f"### Bölüm {i + 1}\n{partial}" for i, partial in enumerate(partials)
+        )
+
+    def _generate_partial_notes(
+        self,
+        chunk: str,
+        index: int,
+        total: int,
+        regenerate: bool = False,
+    ) -> str:
+        """Generates intermediate notes for one chunk of a long transcript."""
+        prompt = f"""Aşağıdaki metin uzun bir transkriptin {index}/{total}. bölümüdür.
+Bu bölümdeki konuları, önemli noktaları, kararları, eylem maddelerini ve anahtar kelimeleri
+kısa maddeler halinde Türkçe olarak çıkar. Zaman damgalarını koru, yorum ekleme.
+
+Transkript bölümü:
+"""
+        return self._generate(prompt, chunk, f"{prompt}\n{chunk}", regenerate, kind="notes_partial")
 
     def _get_default_prompt(self) -> str:
         """Returns the default note generation prompt."""
@@ -71,50 +351,340 @@ Notları Türkçe olarak, açık ve anlaşılır bir şekilde yaz.
 Gereksiz detayları atla, önemli bilgilere odaklan.
 Markdown formatını kullan."""
 
-    def generate_summary(self, transcript: str) -> str:
+    def generate_all(
+        self,
+        transcript: str,
+        chunked: Optional[bool] = None,
+        regenerate: bool = False,
+    ) -> "MeetingNotes":
+        """
+        Generates notes, summary and action items in a single structured call.
+        The response is constrained to MEETING_NOTES_SCHEMA, so the transcript
+        is sent once no matter how many of the sections are needed.
+
+        Args:
+            transcript: The transcript text
+            chunked: Force (True) or disable (False) map-reduce generation
+            regenerate: Bypass cached responses
+
+        Returns:
+            MeetingNotes with all sections
+        """
+        if not transcript or not transcript.strip():
+            raise InvalidInput("Transcript is empty")
+
+        if chunked is None:
+            chunked = estimate_tokens(transcript) > GEMINI_SINGLE_PASS_TOKENS
+
+        source = transcript
+        label = "Transkript"
+        if chunked:
+            chunks = split_transcript(transcript, GEMINI_CHUNK_TOKENS)
+            if len(chunks) > 1:
+                source = self._map_partial_notes(chunks, regenerate)
+                label = "Bölüm notları"
+
+        prompt = self._get_structured_prompt()
+        full_prompt = f"{prompt}\n\n---\n\n{label}:\n{source}"
+
+        text = self._generate(
+            prompt,
+            source,
+            full_prompt,
+            regenerate,
+            settings={"response_schema": MEETING_NOTES_SCHEMA_VERSION},
+            kind="structured_notes",
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                response_schema=MEETING_NOTES_SCHEMA,
+            ),
+        )
+
+        return MeetingNotes.from_dict(json.loads(text))
+
+    def _get_structured_prompt(self) -> str:
+        """Returns the prompt for the combined structured request."""
+        return """Sen bir toplantı/ders notu çıkarma asistanısın.
+Aşağıdaki içeriği analiz et ve istenen JSON alanlarını doldur:
+
+- summary: 2-3 cümlelik genel özet
+- main_topics: Tartışılan ana konular
+- key_points: Dikkat çeken önemli bilgiler, kararlar, fikirler
+- action_items: Yapılması gereken işler, görevler (yoksa boş liste)
+- keywords: İçerikle ilgili anahtar kelimeler
+
+Tüm alanları Türkçe olarak, açık ve anlaşılır bir şekilde yaz.
+Gereksiz detayları atla, önemli bilgilere odaklan."""
+
+    def update_rolling_summary(
+        self,
+        summary: str,
+        block_text: str,
+        regenerate: bool = False,
+    ) -> str:
+        """
+        Folds a newly transcribed block into a compact rolling summary.
+
+        Args:
+            summary: Current rolling summary (empty for the first block)
+            block_text: Transcript of the new block
+            regenerate: Bypass cached responses
+
+        Returns:
+            Updated rolling summary
+        """
+        prompt = f"""Sen bir toplantı/ders notu çıkarma asistanısın.
+Uzun bir kaydın notlarını bölüm bölüm güncelliyorsun.
+Aşağıda şimdiye kadarki kompakt özet ve yeni transkript bölümü var.
+Yeni bölümdeki konuları, önemli noktaları, kararları ve eylem maddelerini özete ekleyerek
+güncellenmiş özeti yaz. Tekrarları birleştir, en fazla {ROLLING_SUMMARY_WORDS} kelime kullan.
+Sadece güncellenmiş özeti madde madde Türkçe olarak yaz."""
+        source = f"{summary or '(henüz özet yok)'}\n\n---\n\n{block_text}"
+        full_prompt = (
+            f"{prompt}\n\n---\n\nMevcut özet:\n{summary or '(henüz özet yok)'}"
+            f"\n\n---\n\nYeni bölüm:\n{block_text}"
+        )
+        return self._generate(prompt, source, full_prompt, regenerate, kind="rolling_summary")
+
+    def notes_from_rolling_summary(self, summary: str, regenerate: bool = False) -> str:
+        """Builds the final structured notes from a rolling summary."""
+        return self._generate(*self._rolling_notes_request(summary), regenerate, kind="rolling_notes")
+
+    def notes_from_rolling_summary_stream(self, summary: str, regenerate: bool = False) -> Iterator[str]:
+        """Streaming variant of `notes_from_rolling_summary`."""
+        return self._generate_stream(*self._rolling_notes_request(summary), regenerate, kind="rolling_notes")
+
+    def _rolling_notes_request(self, summary: str) -> Tuple[str, str, str]:
+        if not summary or not summary.strip():
+            raise InvalidInput("Rolling summary is empty")
+
+        prompt = (
+            f"{self._get_default_prompt()}\n\n"
+            "Transkript bölüm bölüm işlendi ve aşağıdaki özet notlara dönüştürüldü. "
+            "Bu notlardan yukarıdaki formatta son notları oluştur."
+        )
+        return prompt, summary, f"{prompt}\n\n---\n\nÖzet notlar:\n{summary}"
+
+    def answer_question(
+        self,
+        transcript: str,
+        question: str,
+        top_k: int = QA_TOP_K,
+        max_tokens: int = QA_CONTEXT_TOKENS,
+        regenerate: bool = False,
+    ) -> str:
+        """
+        Answers a question about the transcript.
+        Only the transcript windows most relevant to the question (ranked
+        with BM25) are sent, so follow-up questions stay cheap on long meetings.
+
+        Args:
+            transcript: The transcript text
+            question: Question to answer
+            top_k: Maximum number of windows to send
+            max_tokens: Token budget for the sent windows
+            regenerate: Bypass cached responses
+
+        Returns:
+            Answer as markdown string
+        """
+        request = self._question_request(transcript, question, top_k, max_tokens)
+        if request is None:
+            return NO_RELEVANT_PASSAGES
+        return self._generate(*request, regenerate, kind="question")
+
+    def answer_question_stream(
+        self,
+        transcript: str,
+        question: str,
+        top_k: int = QA_TOP_K,
+        max_tokens: int = QA_CONTEXT_TOKENS,
+        regenerate: bool = False,
+    ) -> Iterator[str]:
+        """Streaming variant of `answer_question`."""
+        request = self._question_request(transcript, question, top_k, max_tokens)
+        if request is None:
+            return iter([NO_RELEVANT_PASSAGES])
+        return self._generate_stream(*request, regenerate, kind="question")
+
+    def _question_request(
+        self,
+        transcript: str,
+        question: str,
+        top_k: int,
+        max_tokens: int,
+    ) -> Optional[Tuple[str, str, str]]:
+        """
+        Builds the (prompt, context, contents) of a question request, or None
+        if no part of the transcript matches the question.
+        """
+        if not transcript or not transcript.strip():
+            raise InvalidInput("Transcript is empty")
+        if not question or not question.strip():
+            raise InvalidInput("Question is empty")
+
+        # Short transcripts are sent whole
+        if estimate_tokens(transcript) <= max_tokens:
+            context = transcript
+        else:
+            passages = self._question_index(transcript).select(question, top_k, max_tokens)
+            if not passages:
+                return None
+            context = "\n...\n".join(passages)
+
+        prompt = f"""Aşağıda bir toplantı transkriptinden soruyla ilgili bölümler var.
+Soruyu yalnızca bu bölümlere dayanarak, Türkçe ve kısa olarak cevapla.
+Mümkünse ilgili zaman damgalarını belirt. Cevap bölümlerde yoksa bunu açıkça söyle.
+
+Soru: {question.strip()}
+
+Bölümler:
+"""
+        return prompt, context, f"{prompt}\n{context}"
+
+    def _question_index(self, transcript: str) -> BM25Index:
+        """Returns the BM25 index of a transcript, reusing it for follow-up questions."""
+        key = content_hash(transcript)
+        cached = self._qa_index
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        index = BM25Index(split_windows(transcript, QA_WINDOW_LINES, QA_WINDOW_OVERLAP))
+        self._qa_index = (key, index)
+        return index
+
+    def generate_summary(self, transcript: str, regenerate: bool = False) -> str:
         """
         Generates a brief summary of the transcript.
 
         Args:
             transcript: The transcript text
+            regenerate: Bypass cached responses
 
         Returns:
             Brief summary string
         """
-        prompt = """Aşağıdaki transkriptin kısa bir özetini yaz (maksimum 3-4 cümle).
-Sadece en önemli noktaları içer.
+        return self.generate_all(transcript, regenerate=regenerate).summary
 
-Transkript:
-"""
-        full_prompt = f"{prompt}\n{transcript}"
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=full_prompt,
-        )
-        return response.text
+    def generate_summary_stream(self, transcript: str, regenerate: bool = False) -> Iterator[str]:
+        """
+        Streaming variant of `generate_summary`. The summary comes from the
+        structured `generate_all` call (shared with the action items through
+        the response cache), so it is yielded as one piece.
+        """
+        yield self.generate_summary(transcript, regenerate)
 
-    def extract_action_items(self, transcript: str) -> str:
+    def extract_action_items(self, transcript: str, regenerate: bool = False) -> str:
         """
         Extracts action items from the transcript.
 
         Args:
             transcript: The transcript text
+            regenerate: Bypass cached responses
 
         Returns:
             List of action items as string
         """
-        prompt = """Aşağıdaki transkriptten yapılması gereken işleri (action items) çıkar.
-Her maddeyi "- [ ]" formatında listele.
-Eğer yapılacak iş yoksa "Yapılacak iş bulunamadı." yaz.
+        return self.generate_all(transcript, regenerate=regenerate).format_action_items()
 
-Transkript:
-"""
-        full_prompt = f"{prompt}\n{transcript}"
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=full_prompt,
+    def extract_action_items_stream(self, transcript: str, regenerate: bool = False) -> Iterator[str]:
+        """
+        Streaming variant of `extract_action_items`. Like
+        `generate_summary_stream` it is served by the structured call and
+        yields the formatted list as one piece.
+        """
+        yield self.extract_action_items(transcript, regenerate)
+
+
+NO_RELEVANT_PASSAGES = "Transkriptte bu soruyla ilgili bir bölüm bulunamadı."
+
+MEETING_NOTES_SCHEMA_VERSION = 1
+
+_STRING_LIST = types.Schema(type=types.Type.ARRAY, items=types.Schema(type=types.Type.STRING))
+
+MEETING_NOTES_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "summary": types.Schema(type=types.Type.STRING),
+        "main_topics": _STRING_LIST,
+        "key_points": _STRING_LIST,
+        "action_items": _STRING_LIST,
+        "keywords": _STRING_LIST,
+    },
+    required=["summary", "main_topics", "key_points", "action_items", "keywords"],
+)
+
+
+@dataclass
+class MeetingNotes:
+    """Structured result of `GeminiService.generate_all`."""
+
+    summary: str = ""
+    main_topics: List[str] = field(default_factory=list)
+    key_points: List[str] = field(default_factory=list)
+    action_items: List[str] = field(default_factory=list)
+    keywords: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MeetingNotes":
+        return cls(
+            summary=data.get("summary", ""),
+            main_topics=list(data.get("main_topics", [])),
+            key_points=list(data.get("key_points", [])),
+            action_items=list(data.get("action_items", [])),
+            keywords=list(data.get("keywords", [])),
+        )
+
+    def format_action_items(self) -> str:
+        """Formats action items as a markdown checklist."""
+        if not self.action_items:
+            return "Yapılacak iş bulunamadı."
+        return "\n".join(f"- [ ] {item}" for item in self.action_items)
+
+    def to_markdown(self) -> str:
+        """Renders the notes in the default note format."""
+        def bullets(items: List[str]) -> str:
+            return "\n".join(f"- {item}" for item in items) or "-"
+
+        return (
+            f"## Özet\n{self.summary}\n\n"
+            f"## Ana Konular\n{bullets(self.main_topics)}\n\n"
+            f"## Önemli Noktalar\n{bullets(self.key_points)}\n\n"
+            f"## Eylem Maddeleri\n{self.format_action_items()}\n\n"
+            f"## Anahtar Kelimeler\n{', '.join(self.keywords) or '-'}\n"
         )
-        return response.text
+
+
+def split_transcript(transcript: str, max_tokens: int) -> List[str]:
+    """
+    Splits a transcript into chunks of at most `max_tokens` (estimated).
+    Splits happen on line (utterance) boundaries; a single line longer than
+    the budget is cut into pieces.
+    """
+    max_chars = max_tokens * 4
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+
+    for line in transcript.splitlines():
+        while len(line) > max_chars:
+            if current:
+                chunks.append("\n".join(current))
+                current, current_len = [], 0
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+
+        if current and current_len + len(line) + 1 > max_chars:
+            chunks.append("\n".join(current))
+            current, current_len = [], 0
+
+        current.append(line)
+        current_len += len(line) + 1
+
+    if current:
+        chunks.append("\n".join(current))
+
+    return [chunk for chunk in chunks if chunk.strip()]
 
 
 def save_notes_to_markdown(notes: str, output_path: str) -> None:
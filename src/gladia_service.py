@@ -1,9 +1,142 @@
+import io
 import os
 import time
+import uuid
+import socket
+import threading
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from typing import Optional, Dict, Any, Callable, Union
+
+from .config import (
+    GLADIA_API_KEY,
+    GLADIA_API_URL,
+    GLADIA_UPLOAD_URL,
+    GLADIA_MAX_RETRIES,
+    GLADIA_UPLOAD_SEND_BUFFER,
+)
+from .errors import InvalidInput
+from .rate_limiter import (
+    OperationCancelled,
+    RateLimiter,
+    check_cancelled,
+    get_shared_limiter,
+    parse_retry_after,
+)
+from .transcript import Transcript, format_timestamp
+
+
+class TranscriptionFailed(Exception):
+    """Raised when Gladia reports a transcription as failed; its ID cannot be polled again."""
+
+
+class _MultipartUpload:
+    """
+    Multipart/form-data body for a single file, read from disk in small pieces
+    while it is sent. Setting `cancel` aborts the upload at the next read, or,
+    while the connection is blocked sending, by shutting down its socket.
+    """
+
+    def __init__(self, file_path: str, field: str, mime_type: str, cancel: Optional[threading.Event]):
+        boundary = uuid.uuid4().hex
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{os.path.basename(file_path)}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode("utf-8")
+        tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.cancel = cancel
+        self._length = len(head) + os.path.getsize(file_path) + len(tail)
+        self._file = open(file_path, "rb")
+        self._parts = [io.BytesIO(head), self._file, io.BytesIO(tail)]
+
+        # Set by the upload connection when it starts sending this body
+        self.connection: Optional[HTTPConnection] = None
+        self._done = threading.Event()
+        if cancel is not None:
+            threading.Thread(target=self._watch_cancel, daemon=True).start()
+
+    def __len__(self) -> int:
+        # Lets requests send a Content-Length instead of a chunked body
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        check_cancelled(self.cancel)
+        data = b""
+        while self._parts and (size < 0 or len(data) < size):
+            piece = self._parts[0].read(-1 if size < 0 else size - len(data))
+            if piece:
+                data += piece
+            else:
+                self._parts.pop(0)
+        return data
+
+    def _watch_cancel(self):
+        # The body is only read when the kernel send buffer has room, which
+        # can take seconds on a slow link; shutting the socket down wakes
+        # the blocked send at once
+        while not self._done.wait(0.1):
+            if self.cancel.is_set():
+                sock = getattr(self.connection, "sock", None)
+                if sock is not None:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+                return
+
+    def close(self):
+        self._done.set()
+        self._file.close()
+
+
+class _UploadConnectionMixin:
+    """Hands the connection to a _MultipartUpload body so a cancel can shut its socket."""
+
+    def request(self, method, url, body=None, headers=None, **kwargs):
+        if isinstance(body, _MultipartUpload):
+            body.connection = self
+        return super().request(method, url, body=body, headers=headers, **kwargs)
 
-from .config import GLADIA_API_KEY, GLADIA_API_URL, GLADIA_UPLOAD_URL
+
+class _UploadHTTPConnection(_UploadConnectionMixin, HTTPConnection):
+    pass
+
+
+class _UploadHTTPSConnection(_UploadConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _UploadHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UploadHTTPConnection
+
+
+class _UploadHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _UploadHTTPSConnection
+
+
+class _UploadAdapter(HTTPAdapter):
+    """
+    Transport for uploads: its connections can be shut down from another
+    thread when an upload is cancelled. The socket send buffer is only
+    limited when GLADIA_UPLOAD_SEND_BUFFER is set, as a fixed size disables
+    the kernel's buffer autotuning and caps throughput.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        if GLADIA_UPLOAD_SEND_BUFFER:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_SNDBUF, GLADIA_UPLOAD_SEND_BUFFER),
+            ]
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _UploadHTTPConnectionPool,
+            "https": _UploadHTTPSConnectionPool,
+        }
 
 
 class GladiaService:
@@ -12,20 +145,43 @@ class GladiaService:
     Supports uploading audio files and retrieving transcriptions.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        api_url: str = GLADIA_API_URL,
+        upload_url: str = GLADIA_UPLOAD_URL,
+        poll_interval: float = 2,
+    ):
         self.api_key = api_key or GLADIA_API_KEY
         if self.api_key == "your-gladia-key-here":
-            raise ValueError("Please set a valid Gladia API key in config.py or environment")
+            raise InvalidInput("Please set a valid Gladia API key in config.py or environment")
 
         self.headers = {
             "x-gladia-key": self.api_key,
         }
 
+        self.api_url = api_url
+        self.upload_url = upload_url
+        self.poll_interval = poll_interval
+
+        self._upload_session = requests.Session()
+        self._upload_session.mount("http://", _UploadAdapter())
+        self._upload_session.mount("https://", _UploadAdapter())
+
+        # Shared across services so concurrent transcriptions respect one budget
+        self.rate_limiter = rate_limiter or get_shared_limiter()
+
     def transcribe_file(
         self,
         file_path: str,
         language: str = "tr",
         on_progress: Optional[callable] = None,
+        session_offset: float = 0.0,
+        audio_url: Optional[str] = None,
+        transcription_id: Optional[str] = None,
+        on_stage: Optional[Callable[[str, str], None]] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> Dict[str, Any]:
         """
         Transcribes an audio file using Gladia API.
@@ -34,40 +190,99 @@ class GladiaService:
             file_path: Path to the audio file
             language: Language code (default: 'tr' for Turkish)
             on_progress: Optional callback for progress updates
+            session_offset: Start of this block within its recording session (seconds)
+            audio_url: URL of an earlier upload of the file; skips the upload
+            transcription_id: ID of an already started transcription; only polls it
+            on_stage: Called with ("uploaded", audio_url) and ("started", transcription_id)
+                as soon as each stage completes, so an interrupted job can be resumed
+            cancel: Event that aborts the upload mid-stream and stops waiting or polling
 
         Returns:
             Dictionary containing transcription result
+
+        Raises:
+            TranscriptionFailed: If Gladia reports the transcription as failed
+            OperationCancelled: If `cancel` is set before the result arrives
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Audio file not found: {file_path}")
 
-        # Step 1: Upload the audio file
-        if on_progress:
-            on_progress("Dosya yükleniyor...")
+        if transcription_id is None:
+            # Step 1: Upload the audio file
+            if audio_url is None:
+                if on_progress:
+                    on_progress("Dosya yükleniyor...")
 
-        audio_url = self._upload_file(file_path)
+                audio_url = self._upload_file(file_path, cancel)
+                if on_stage:
+                    on_stage("uploaded", audio_url)
 
-        # Step 2: Start transcription
-        if on_progress:
-            on_progress("Transkripsiyon başlatılıyor...")
+            # Step 2: Start transcription
+            if on_progress:
+                on_progress("Transkripsiyon başlatılıyor...")
 
-        transcription_id = self._start_transcription(audio_url, language)
+            transcription_id = self._start_transcription(audio_url, language, cancel)
+            if on_stage:
+                on_stage("started", transcription_id)
 
         # Step 3: Poll for results
-        result = self._poll_for_result(transcription_id, on_progress)
+        result = self._poll_for_result(transcription_id, on_progress, cancel=cancel)
+        result["transcript"].set_block(file_path, session_offset)
 
         return result
 
-    def _upload_file(self, file_path: str) -> str:
-        """Uploads audio file to Gladia and returns the audio URL."""
-        with open(file_path, "rb") as audio_file:
-            files = {"audio": (os.path.basename(file_path), audio_file, "audio/wav")}
+    def _send(
+        self,
+        category: str,
+        send: Callable[[], requests.Response],
+        cancel: Optional[threading.Event] = None,
+    ) -> requests.Response:
+        """
+        Sends a request through the shared rate limiter.
+        Retries 429 responses after the server's Retry-After delay
+        (or exponential backoff when the header is missing).
+        2xx responses let the shared concurrency limit grow, 5xx responses
+        shrink it and other responses leave it unchanged.
+        """
+        for attempt in range(GLADIA_MAX_RETRIES + 1):
+            with self.rate_limiter.slot(category, cancel):
+                check_cancelled(cancel)
+                response = send()
+
+            # Only 2xx responses let the concurrency limit grow; 5xx shrink it
+            if response.status_code != 429:
+                if 200 <= response.status_code < 300:
+                    self.rate_limiter.on_success(category)
+                elif response.status_code >= 500:
+                    self.rate_limiter.on_server_error(category)
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                retry_after = min(2 ** attempt, 60)
 
-            response = requests.post(
-                GLADIA_UPLOAD_URL,
-                headers=self.headers,
-                files=files,
-            )
+            self.rate_limiter.on_throttle(category, retry_after)
+
+        return response
+
+    def _upload_file(self, file_path: str, cancel: Optional[threading.Event] = None) -> str:
+        """Uploads audio file to Gladia and returns the audio URL."""
+        def send():
+            body = _MultipartUpload(file_path, "audio", "audio/wav", cancel)
+            try:
+                return self._upload_session.post(
+                    self.upload_url,
+                    headers={**self.headers, "Content-Type": body.content_type},
+                    data=body,
+                )
+            except requests.exceptions.ConnectionError:
+                # A cancel shuts the socket down, which surfaces as a broken connection
+                check_cancelled(cancel)
+                raise
+            finally:
+                body.close()
+
+        response = self._send("upload", send, cancel)
 
         if response.status_code != 200 and response.status_code != 201:
             raise Exception(f"Upload failed: {response.status_code} - {response.text}")
@@ -75,7 +290,12 @@ class GladiaService:
         data = response.json()
         return data.get("audio_url")
 
-    def _start_transcription(self, audio_url: str, language: str) -> str:
+    def _start_transcription(
+        self,
+        audio_url: str,
+        language: str,
+        cancel: Optional[threading.Event] = None,
+    ) -> str:
         """Starts a transcription job and returns the transcription ID."""
         payload = {
             "audio_url": audio_url,
@@ -88,11 +308,11 @@ class GladiaService:
             "Content-Type": "application/json",
         }
 
-        response = requests.post(
-            GLADIA_API_URL,
+        response = self._send("start", lambda: requests.post(
+            self.api_url,
             headers=headers,
             json=payload,
-        )
+        ), cancel)
 
         if response.status_code != 200 and response.status_code != 201:
             raise Exception(f"Transcription start failed: {response.status_code} - {response.text}")
@@ -105,14 +325,16 @@ class GladiaService:
         transcription_id: str,
         on_progress: Optional[callable] = None,
         max_wait_seconds: int = 600,
-        poll_interval: int = 2,
+        poll_interval: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> Dict[str, Any]:
-        """Polls for transcription result until complete or timeout."""
-        result_url = f"{GLADIA_API_URL}/{transcription_id}"
+        """Polls for transcription result until complete, timeout or cancellation."""
+        result_url = f"{self.api_url}/{transcription_id}"
+        poll_interval = poll_interval or self.poll_interval
         start_time = time.time()
 
         while time.time() - start_time < max_wait_seconds:
-            response = requests.get(result_url, headers=self.headers)
+            response = self._send("poll", lambda: requests.get(result_url, headers=self.headers), cancel)
 
             if response.status_code != 200:
                 raise Exception(f"Poll failed: {response.status_code} - {response.text}")
@@ -124,13 +346,16 @@ class GladiaService:
                 return self._parse_result(data)
 
             if status == "error":
-                raise Exception(f"Transcription failed: {data.get('error_message', 'Unknown error')}")
+                raise TranscriptionFailed(f"Transcription failed: {data.get('error_message', 'Unknown error')}")
 
             if on_progress:
                 elapsed = int(time.time() - start_time)
                 on_progress(f"İşleniyor... ({elapsed}s)")
 
-            time.sleep(poll_interval)
+            if cancel is None:
+                time.sleep(poll_interval)
+            elif cancel.wait(poll_interval):
+                raise OperationCancelled("Transcription cancelled")
 
         raise TimeoutError("Transcription timed out")
 
@@ -143,43 +368,46 @@ class GladiaService:
         full_text = transcription.get("full_transcript", "")
 
         # Extract utterances with timestamps
-        utterances = []
-        for utterance in transcription.get("utterances", []):
-            utterances.append({
-                "start": utterance.get("start", 0),
-                "end": utterance.get("end", 0),
-                "text": utterance.get("text", ""),
-                "speaker": utterance.get("speaker", 0),
-            })
+        transcript = Transcript.from_utterances(transcription.get("utterances", []))
 
         return {
             "full_text": full_text,
-            "utterances": utterances,
+            "transcript": transcript,
             "language": transcription.get("language", "tr"),
             "duration": result.get("metadata", {}).get("audio_duration", 0),
         }
 
 
-def format_transcript(result: Dict[str, Any], include_timestamps: bool = True) -> str:
+def format_transcript(
+    result: Union[Dict[str, Any], Transcript],
+    include_timestamps: bool = True,
+) -> str:
     """
     Formats transcription result as readable text.
 
     Args:
-        result: Transcription result dictionary
-        include_timestamps: Whether to include timestamps
+        result: Transcription result dictionary or Transcript
+        include_timestamps: Whether to include session-absolute timestamps
 
     Returns:
         Formatted transcript string
     """
-    if not include_timestamps:
-        return result.get("full_text", "")
+    transcript = result if isinstance(result, Transcript) else result.get("transcript")
+
+    # Results from before the Transcript type carry a list of utterance dicts
+    if transcript is None:
+        utterances = result.get("utterances", [])
+        if not include_timestamps:
+            return result.get("full_text") or " ".join(u.get("text", "").strip() for u in utterances)
+        return "\n".join(
+            f"[{format_timestamp(u.get('start', 0))}] {u.get('text', '').strip()}"
+            for u in utterances
+        )
 
-    lines = []
-    for utterance in result.get("utterances", []):
-        start = utterance["start"]
-        minutes = int(start // 60)
-        seconds = int(start % 60)
-        timestamp = f"[{minutes:02d}:{seconds:02d}]"
-        lines.append(f"{timestamp} {utterance['text']}")
+    if not include_timestamps:
+        return transcript.full_text
 
-    return "\n".join(lines)
+    return "\n".join(
+        f"[{format_timestamp(utterance.start)}] {utterance.text}"
+        for utterance in transcript
+    )
@@ -0,0 +1,362 @@
+import os
+import queue
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from math import gcd
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from .config import (
+    BLOCK_DURATION_MINUTES,
+    RECORDINGS_DIR,
+    IMPORT_READ_FRAMES,
+    IMPORT_SILENCE_WINDOW_SECONDS,
+    IMPORT_SPLIT_ON_SILENCE,
+    IMPORT_SPEECH_PROFILE,
+    IMPORT_SPEECH_SAMPLE_RATE,
+    IMPORT_WORKERS,
+)
+from .manifest import BlockManifest
+from .waveform import peaks_from_file, save_peaks
+
+# Pieces waiting per block encoder; bounds memory when encoders fall behind
+_QUEUE_PIECES = 4
+
+# Input samples resampled per step; bounds the filter's working memory
+_RESAMPLE_SLICE = 65536
+
+
+# File extensions of the libsndfile formats that hold ordinary audio
+_FORMAT_EXTENSIONS = {
+    "WAV": ("wav",),
+    "WAVEX": ("wav",),
+    "AIFF": ("aif", "aiff", "aifc"),
+    "FLAC": ("flac",),
+    "OGG": ("ogg", "oga", "opus"),
+    "MP3": ("mp3",),
+    "AU": ("au", "snd"),
+    "CAF": ("caf",),
+    "W64": ("w64",),
+    "RF64": ("rf64",),
+}
+
+
+def supported_extensions() -> List[str]:
+    """Returns the file extensions soundfile can decode (lowercase, without dot)."""
+    formats = sf.available_formats()
+    return sorted({
+        ext
+        for fmt, extensions in _FORMAT_EXTENSIONS.items()
+        if fmt in formats
+        for ext in extensions
+    })
+
+
+def quietest_frame(audio: np.ndarray, start: int, end: int, frame: int) -> int:
+    """
+    Returns the middle of the quietest `frame`-sample window of audio[start:end],
+    the least disruptive place to cut a block. Of windows that are (nearly)
+    equally quiet the latest one wins, so audio without pauses is cut close
+    to `end` instead of at the start of the search range.
+    """
+    mono = audio[start:end].mean(axis=1)
+    count = len(mono) // frame
+    if count == 0:
+        return end
+
+    energy = np.square(mono[:count * frame]).reshape(count, frame).mean(axis=1)
+    quiet = np.flatnonzero(energy <= energy.min() * 1.1 + 1e-12)
+    return start + int(quiet[-1]) * frame + frame // 2
+
+
+class StreamResampler:
+    """
+    Windowed-sinc resampler for audio that arrives in pieces.
+    Keeps only the few input samples the filter still needs between calls,
+    so memory does not depend on the length of the stream.
+    """
+
+    def __init__(self, rate_in: int, rate_out: int, half_taps: int = 32):
+        divisor = gcd(rate_in, rate_out)
+        self.up = rate_out // divisor
+        self.down = rate_in // divisor
+        self.half_taps = half_taps
+
+        # One filter per output phase; low-pass below the lower Nyquist rate
+        cutoff = 0.95 * min(1.0, rate_out / rate_in)
+        self.offsets = np.arange(-half_taps + 1, half_taps + 1)
+        t = self.offsets[None, :] - (np.arange(self.up) / self.up)[:, None]
+        window = 0.42 + 0.5 * np.cos(np.pi * t / half_taps) + 0.08 * np.cos(2 * np.pi * t / half_taps)
+        bank = cutoff * np.sinc(cutoff * t) * window
+        self.bank = (bank / bank.sum(axis=1, keepdims=True)).astype(np.float32)
+
+        self._buffer = np.zeros(half_taps, dtype=np.float32)
+        self._start = -half_taps    # Input index of self._buffer[0]
+        self._next = 0              # Index of the next output sample
+        self._consumed = 0
+
+    def process(self, samples: np.ndarray, final: bool = False) -> np.ndarray:
+        """Resamples the next piece of a mono stream; `final` flushes the tail."""
+        # The filter gathers a (outputs x taps) matrix, so long pieces go in slices
+        if len(samples) > _RESAMPLE_SLICE:
+            parts = [
+                self._process(samples[i:i + _RESAMPLE_SLICE])
+                for i in range(0, len(samples) - _RESAMPLE_SLICE, _RESAMPLE_SLICE)
+            ]
+            rest = samples[len(parts) * _RESAMPLE_SLICE:]
+            return np.concatenate(parts + [self._process(rest, final)])
+        return self._process(samples, final)
+
+    def _process(self, samples: np.ndarray, final: bool = False) -> np.ndarray:
+        self._consumed += len(samples)
+        parts = [self._buffer, samples.astype(np.float32)]
+        if final:
+            parts.append(np.zeros(self.half_taps, dtype=np.float32))
+        buffer = np.concatenate(parts)
+
+        # Outputs whose filter window lies entirely inside the buffer
+        last_base = self._start + len(buffer) - 1 - self.half_taps
+        end = -(-(last_base + 1) * self.up // self.down)
+        if final:
+            end = min(end, -(-self._consumed * self.up // self.down))
+
+        n = np.arange(self._next, max(end, self._next), dtype=np.int64)
+        position = n * self.down
+        base = position // self.up
+        rows = (base - self._start)[:, None] + self.offsets[None, :]
+        output = np.einsum("ij,ij->i", buffer[rows], self.bank[position % self.up])
+        self._next = max(end, self._next)
+
+        keep_from = (self._next * self.down) // self.up - self.half_taps + 1 - self._start
+        keep_from = max(0, min(keep_from, len(buffer)))
+        self._buffer = buffer[keep_from:]
+        self._start += keep_from
+        return output.astype(np.float32)
+
+
+class _BlockEncoder:
+    """Writes the pieces of one block to disk as they arrive (runs on a pool thread)."""
+
+    def __init__(self, filepath: str, samplerate: int, channels: int, speech_profile: bool):
+        self.filepath = filepath
+        self.samplerate = samplerate
+        self.channels = channels
+        self.speech_profile = speech_profile
+        self.pieces: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=_QUEUE_PIECES)
+
+    def run(self) -> str:
+        resampler = None
+        samplerate, channels = self.samplerate, self.channels
+        if self.speech_profile:
+            channels = 1
+            if samplerate != IMPORT_SPEECH_SAMPLE_RATE:
+                resampler = StreamResampler(samplerate, IMPORT_SPEECH_SAMPLE_RATE)
+            samplerate = IMPORT_SPEECH_SAMPLE_RATE
+
+        # Written under a temporary name so a half-written block is never listed
+        tmp_path = f"{self.filepath}.part"
+        try:
+            with sf.SoundFile(
+                tmp_path, "w", samplerate, channels, subtype="PCM_16", format="WAV"
+            ) as out:
+                while True:
+                    piece = self.pieces.get()
+                    if piece is None:
+                        if resampler is not None:
+                            out.write(resampler.process(np.zeros(0, dtype=np.float32), final=True))
+                        break
+
+                    if self.speech_profile:
+                        piece = piece.mean(axis=1)
+                        if resampler is not None:
+                            piece = resampler.process(piece)
+                    out.write(piece)
+
+            os.replace(tmp_path, self.filepath)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        save_peaks(self.filepath, peaks_from_file(self.filepath))
+        return self.filepath
+
+
+class AudioImporter:
+    """
+    Imports external audio files of any length as standard blocks.
+
+    The source is decoded in pieces of IMPORT_READ_FRAMES frames and cut into
+    blocks of `block_seconds`; with `split_on_silence` each cut is moved to
+    the quietest point of the preceding IMPORT_SILENCE_WINDOW_SECONDS so no
+    word is split between blocks. Blocks are encoded (and, with
+    `speech_profile`, down-mixed and resampled to 16 kHz) on `workers`
+    threads while decoding continues, and only a bounded number of pieces is
+    ever held in memory, so memory use does not depend on the file length.
+    """
+
+    def __init__(
+        self,
+        directory: str = RECORDINGS_DIR,
+        manifest: Optional[BlockManifest] = None,
+        block_seconds: float = BLOCK_DURATION_MINUTES * 60,
+        split_on_silence: bool = IMPORT_SPLIT_ON_SILENCE,
+        speech_profile: bool = IMPORT_SPEECH_PROFILE,
+        workers: int = IMPORT_WORKERS,
+        on_progress: Optional[Callable[[str], None]] = None,
+        on_block: Optional[Callable[[str], None]] = None,
+    ):
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.manifest = manifest
+        self.block_seconds = block_seconds
+        self.split_on_silence = split_on_silence
+        self.speech_profile = speech_profile
+        self.workers = workers
+        self.on_progress = on_progress
+        self.on_block = on_block
+
+        self._lock = threading.Lock()
+
+    def progress(self, message: str):
+        """Reports a progress message to `on_progress`."""
+        if self.on_progress:
+            self.on_progress(message)
+
+    def import_file(self, source: str) -> List[str]:
+        """
+        Imports one audio file and returns the paths of the created blocks.
+        Blocks of one file form one recording session; `on_block` is called
+        with each block, in order, as soon as it and all earlier ones are done.
+
+        Raises:
+            RuntimeError: If soundfile cannot decode the file
+        """
+        info = sf.info(source)
+        name = os.path.basename(source)
+        stem = "".join(c if c.isalnum() else "_" for c in os.path.splitext(name)[0])[:40]
+        # The random part keeps two imports within one second from sharing names
+        session = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+        samplerate = info.samplerate
+        block_frames = max(1, int(self.block_seconds * samplerate))
+        window = int(IMPORT_SILENCE_WINDOW_SECONDS * samplerate) if self.split_on_silence else 0
+        window = min(window, block_frames // 2)
+        silence_frame = max(1, samplerate // 10)
+
+        blocks: List[Tuple[_BlockEncoder, Future, float]] = []
+        reported = [0]
+
+        def report(_future=None):
+            # Hands finished blocks over in order
+            with self._lock:
+                while reported[0] < len(blocks) and blocks[reported[0]][1].done():
+                    encoder, future, offset = blocks[reported[0]]
+                    reported[0] += 1
+                    if future.exception() is None:
+                        self._finish_block(encoder.filepath, session, offset)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            encoder: Optional[_BlockEncoder] = None
+            encoder_frames = 0
+            offset_frames = 0
+            pending: List[np.ndarray] = []
+            pending_frames = 0
+            read_frames = 0
+
+            def open_block():
+                nonlocal encoder, encoder_frames
+                filename = f"block_{len(blocks) + 1:03d}_{session}_{stem}.wav"
+                encoder = _BlockEncoder(
+                    os.path.join(self.directory, filename),
+                    samplerate,
+                    info.channels,
+                    self.speech_profile,
+                )
+                encoder_frames = 0
+                future = pool.submit(encoder.run)
+                with self._lock:
+                    blocks.append((encoder, future, offset_frames / samplerate))
+                future.add_done_callback(report)
+
+            def feed(audio: np.ndarray):
+                nonlocal encoder_frames, offset_frames
+                if len(audio):
+                    if encoder is None:
+                        open_block()
+                    self._put(encoder, blocks[-1][1], audio)
+                    encoder_frames += len(audio)
+                    offset_frames += len(audio)
+
+            def close_block():
+                nonlocal encoder, encoder_frames
+                if encoder is not None:
+                    self._put(encoder, blocks[-1][1], None)
+                    encoder = None
+                    encoder_frames = 0
+
+            try:
+                for chunk in sf.blocks(
+                    source, blocksize=IMPORT_READ_FRAMES, dtype="float32", always_2d=True
+                ):
+                    pending.append(chunk)
+                    pending_frames += len(chunk)
+                    read_frames += len(chunk)
+
+                    # Cut blocks once the pending audio reaches the block limit
+                    while encoder_frames + pending_frames >= block_frames:
+                        audio = np.concatenate(pending)
+                        limit = block_frames - encoder_frames
+                        cut = limit
+                        if window:
+                            cut = quietest_frame(audio, max(0, limit - window), limit, silence_frame)
+                        feed(audio[:cut])
+                        close_block()
+                        pending = [audio[cut:]]
+                        pending_frames = len(pending[0])
+
+                    # Only the silence search window has to stay in memory
+                    if pending_frames > window + IMPORT_READ_FRAMES:
+                        audio = np.concatenate(pending)
+                        feed(audio[:len(audio) - window])
+                        pending = [audio[len(audio) - window:]]
+                        pending_frames = window
+
+                    if info.frames > 0:
+                        self.progress(f"{name}: %{100 * read_frames // info.frames} içe aktarıldı")
+
+                if pending_frames:
+                    feed(np.concatenate(pending))
+            finally:
+                # Also on decode errors: the encoders must not wait forever
+                close_block()
+
+        errors = [future.exception() for _, future, _ in blocks if future.exception()]
+        if errors:
+            raise errors[0]
+
+        return [encoder.filepath for encoder, _, _ in blocks]
+
+    def _put(self, encoder: _BlockEncoder, future: Future, piece: Optional[np.ndarray]):
+        # Waits while the encoder is behind; stops waiting if it failed
+        while True:
+            try:
+                encoder.pieces.put(piece, timeout=0.5)
+                return
+            except queue.Full:
+                if future.done():
+                    return
+
+    def _finish_block(self, filepath: str, session: str, session_offset: float):
+        if self.manifest is not None:
+            try:
+                self.manifest.record_block(filepath, session=session, session_offset=session_offset)
+            except Exception as e:
+                print(f"Manifest error: {e}")
+        if self.on_block:
+            self.on_block(filepath)
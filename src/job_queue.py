@@ -0,0 +1,407 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from .config import (
+    JOB_QUEUE_PATH,
+    JOB_MAX_ATTEMPTS,
+    JOB_RETRY_BASE_SECONDS,
+    JOB_RETRY_MAX_SECONDS,
+    TRANSCRIBE_CONCURRENCY,
+)
+from .errors import InvalidInput
+
+JOB_TRANSCRIBE = "transcribe"
+JOB_NOTES = "notes"
+
+STATE_QUEUED = "queued"
+STATE_RUNNING = "running"
+STATE_RETRY = "retry"
+STATE_DONE = "done"
+STATE_ERROR = "error"
+STATE_CANCELLED = "cancelled"
+
+FINISHED_STATES = (STATE_DONE, STATE_ERROR, STATE_CANCELLED)
+
+# Stages reported by GladiaService.transcribe_file and the column each one fills
+STAGE_COLUMNS = {
+    "uploaded": "audio_url",
+    "started": "transcription_id",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    filepath TEXT NOT NULL DEFAULT '',
+    session TEXT NOT NULL DEFAULT '',
+    session_offset REAL NOT NULL DEFAULT 0,
+    payload TEXT NOT NULL DEFAULT '',
+    state TEXT NOT NULL,
+    audio_url TEXT,
+    transcription_id TEXT,
+    result TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    error TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_COLUMNS = (
+    "id, kind, filepath, session, session_offset, payload, state, audio_url, "
+    "transcription_id, result, attempts, next_attempt_at, error, created_at, updated_at, priority"
+)
+
+_UPDATABLE = {
+    "state", "audio_url", "transcription_id", "result",
+    "attempts", "next_attempt_at", "error", "priority",
+}
+
+
+class Job(NamedTuple):
+    """A persisted unit of background work and the stages it has completed."""
+
+    id: int
+    kind: str
+    filepath: str
+    session: str
+    session_offset: float
+    payload: str
+    state: str
+    audio_url: Optional[str]
+    transcription_id: Optional[str]
+    result: Optional[str]
+    attempts: int
+    next_attempt_at: float
+    error: str
+    created_at: float
+    updated_at: float
+    priority: int
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    @property
+    def stage(self) -> str:
+        """Furthest completed stage: "result", "started", "uploaded" or ""."""
+        if self.result is not None:
+            return "result"
+        if self.transcription_id:
+            return "started"
+        if self.audio_url:
+            return "uploaded"
+        return ""
+
+
+def retry_delay(
+    attempts: int,
+    base: float = JOB_RETRY_BASE_SECONDS,
+    maximum: float = JOB_RETRY_MAX_SECONDS,
+) -> float:
+    """Returns the backoff before retrying a job that has failed `attempts` times."""
+    return min(base * 2 ** max(attempts - 1, 0), maximum)
+
+
+class JobStore:
+    """
+    SQLite table of transcription and note jobs.
+    Every completed stage is written as soon as it happens, so the jobs that
+    were in progress when the app closed can be resumed from where they stopped.
+    """
+
+    def __init__(self, db_path: str = JOB_QUEUE_PATH):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+        # Queues created before priorities existed
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "priority" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+
+    def add(
+        self,
+        kind: str,
+        filepath: str = "",
+        session: str = "",
+        session_offset: float = 0.0,
+        payload: str = "",
+        priority: int = 0,
+    ) -> Job:
+        """Stores a new queued job and returns it."""
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (kind, filepath, session, session_offset, payload, state, "
+                "created_at, updated_at, priority) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, filepath, session, session_offset, payload, STATE_QUEUED, now, now, priority),
+            )
+            job_id = cursor.lastrowid
+        return self.get(job_id)
+
+    def get(self, job_id: int) -> Optional[Job]:
+        """Returns a job, or None if it does not exist."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return Job(*row) if row else None
+
+    def jobs(self, limit: int = 200) -> List[Job]:
+        """Returns the most recent jobs, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [Job(*row) for row in rows]
+
+    def unfinished(self) -> List[Job]:
+        """Returns jobs that are not finished, in run order (highest priority, then oldest first)."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE state NOT IN (?, ?, ?) "
+                "ORDER BY priority DESC, id",
+                FINISHED_STATES,
+            ).fetchall()
+        return [Job(*row) for row in rows]
+
+    def max_priority(self) -> int:
+        """Returns the highest priority of the unfinished jobs (0 if there are none)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(priority) FROM jobs WHERE state NOT IN (?, ?, ?)", FINISHED_STATES
+            ).fetchone()
+        return row[0] or 0
+
+    def update(self, job_id: int, **fields) -> Optional[Job]:
+        """Updates a job's state or stage columns and returns the updated job."""
+        unknown = set(fields) - _UPDATABLE
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(sorted(unknown))}")
+
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ?",
+                (*fields.values(), time.time(), job_id),
+            )
+        return self.get(job_id)
+
+    def clear_finished(self) -> int:
+        """Deletes finished jobs and returns how many were deleted."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE state IN (?, ?, ?)", FINISHED_STATES
+            )
+        return cursor.rowcount
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueue:
+    """
+    Runs the jobs of a JobStore on a fixed number of worker threads,
+    highest priority first.
+
+    `handlers` maps a job kind to a function called with the job and a cancel
+    event that performs the job and returns its result text; it may record
+    intermediate stages with `record_stage`. Handlers stop cooperatively: once
+    the event is set they should raise as soon as possible, which frees the
+    worker for the next job. A failing job is retried with exponential
+    backoff up to `max_attempts` times; FileNotFoundError and InvalidInput
+    are not retried (a plain ValueError may be a transient bad response,
+    e.g. a gateway error page that is not JSON). Jobs left unfinished by a previous run are picked up again
+    on `start`. `on_change` is called with every updated job.
+    """
+
+    # Errors that another attempt cannot fix
+    PERMANENT_ERRORS = (FileNotFoundError, InvalidInput)
+
+    def __init__(
+        self,
+        store: JobStore,
+        handlers: Dict[str, Callable[[Job, threading.Event], Optional[str]]],
+        workers: int = TRANSCRIBE_CONCURRENCY,
+        on_change: Optional[Callable[[Job], None]] = None,
+        max_attempts: int = JOB_MAX_ATTEMPTS,
+    ):
+        self.store = store
+        self.handlers = handlers
+        self.workers = workers
+        self.on_change = on_change
+        self.max_attempts = max_attempts
+
+        # Cancel events of the jobs currently being run, by job ID
+        self._running: Dict[int, threading.Event] = {}
+        self._finished: Dict[int, threading.Event] = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._threads: List[threading.Thread] = []
+
+    def submit(
+        self,
+        kind: str,
+        filepath: str = "",
+        session: str = "",
+        session_offset: float = 0.0,
+        payload: str = "",
+        priority: int = 0,
+    ) -> Job:
+        """Stores a new job and wakes a worker for it."""
+        job = self.store.add(kind, filepath, session, session_offset, payload, priority)
+        with self._condition:
+            self._finished[job.id] = threading.Event()
+            self._condition.notify()
+        self._notify(job)
+        return job
+
+    def update(self, job_id: int, **fields) -> Optional[Job]:
+        """Updates a job in the store and reports the change."""
+        job = self.store.update(job_id, **fields)
+        if job is not None:
+            self._notify(job)
+        return job
+
+    def record_stage(self, job_id: int, stage: str, value: str):
+        """Stores a completed stage (see STAGE_COLUMNS) of a running job."""
+        self.update(job_id, **{STAGE_COLUMNS[stage]: value})
+
+    def prioritize(self, job_id: int) -> Optional[Job]:
+        """Moves a waiting job ahead of all other unfinished jobs."""
+        with self._condition:
+            job = self.update(job_id, priority=self.store.max_priority() + 1)
+            self._condition.notify()
+        return job
+
+    def cancel(self, job_id: int) -> Optional[Job]:
+        """
+        Cancels a job. A waiting job is cancelled at once; a running job is
+        signalled through its cancel event and finishes when its handler stops.
+        """
+        with self._condition:
+            cancel = self._running.get(job_id)
+            if cancel is not None:
+                cancel.set()
+                return self.store.get(job_id)
+
+            job = self.store.get(job_id)
+            if job is None or job.finished:
+                return job
+            job = self.update(job_id, state=STATE_CANCELLED)
+            self._finished.setdefault(job_id, threading.Event()).set()
+            return job
+
+    def cancel_all(self):
+        """Cancels every unfinished job."""
+        for job in self.store.unfinished():
+            self.cancel(job.id)
+
+    def retry(self, job_id: int) -> Optional[Job]:
+        """Queues a failed or cancelled job again with a fresh attempt count."""
+        job = self.update(job_id, state=STATE_QUEUED, attempts=0, next_attempt_at=0, error="")
+        with self._condition:
+            self._finished.setdefault(job_id, threading.Event()).clear()
+            self._condition.notify()
+        return job
+
+    def wait(self, job_id: int, timeout: Optional[float] = None) -> Optional[Job]:
+        """Blocks until a job is done or given up and returns it."""
+        with self._condition:
+            event = self._finished.setdefault(job_id, threading.Event())
+            job = self.store.get(job_id)
+            if job is None or job.finished:
+                event.set()
+        event.wait(timeout)
+        return self.store.get(job_id)
+
+    def _notify(self, job: Job):
+        if self.on_change:
+            try:
+                self.on_change(job)
+            except Exception as e:
+                print(f"Job callback error: {e}")
+
+    def _next_job(self) -> Optional[Job]:
+        """Claims the first due job in run order, waiting until one is available."""
+        with self._condition:
+            while not self._stopped:
+                now = time.time()
+                wake_at = None
+                for job in self.store.unfinished():
+                    if job.id in self._running:
+                        continue
+                    if job.next_attempt_at <= now:
+                        self._running[job.id] = threading.Event()
+                        return job
+                    wake_at = min(wake_at or job.next_attempt_at, job.next_attempt_at)
+
+                self._condition.wait(None if wake_at is None else wake_at - now)
+        return None
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            cancel = self._running[job.id]
+            job = self.update(job.id, state=STATE_RUNNING)
+            try:
+                handler = self.handlers.get(job.kind)
+                if handler is None:
+                    raise ValueError(f"No handler for job kind: {job.kind}")
+                result = handler(job, cancel)
+                job = self.update(job.id, state=STATE_DONE, result=result or "", error="")
+
+            except Exception as e:
+                attempts = job.attempts + 1
+                if cancel.is_set():
+                    job = self.update(job.id, state=STATE_CANCELLED)
+                elif isinstance(e, self.PERMANENT_ERRORS) or attempts >= self.max_attempts:
+                    job = self.update(job.id, state=STATE_ERROR, attempts=attempts, error=str(e))
+                else:
+                    job = self.update(
+                        job.id,
+                        state=STATE_RETRY,
+                        attempts=attempts,
+                        next_attempt_at=time.time() + retry_delay(attempts),
+                        error=str(e),
+                    )
+
+            with self._condition:
+                self._running.pop(job.id, None)
+                if job.finished:
+                    self._finished.setdefault(job.id, threading.Event()).set()
+                # A retry may now be the earliest due job
+                self._condition.notify_all()
+
+    def start(self) -> "JobQueue":
+        """Starts the workers; unfinished jobs from earlier runs are resumed."""
+        for _ in range(max(1, self.workers)):
+            worker = threading.Thread(target=self._worker, daemon=True)
+            worker.start()
+            self._threads.append(worker)
+        return self
+
+    def stop(self):
+        """Stops the workers after their current jobs."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        for worker in self._threads:
+            worker.join()
@@ -0,0 +1,249 @@
+import os
+import sqlite3
+import hashlib
+import threading
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import soundfile as sf
+
+from .config import RECORDINGS_DIR, MANIFEST_FILENAME
+from .sidecar import SIDECAR_SUFFIX
+
+STATUS_NEW = "new"
+STATUS_TRANSCRIBED = "transcribed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    filename TEXT PRIMARY KEY,
+    duration REAL NOT NULL,
+    sample_rate INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    session TEXT NOT NULL DEFAULT '',
+    session_offset REAL,
+    status TEXT NOT NULL DEFAULT 'new'
+);
+"""
+
+_COLUMNS = "filename, duration, sample_rate, size, mtime, content_hash, session, session_offset, status"
+
+
+class BlockInfo(NamedTuple):
+    """Manifest metadata of a block file."""
+
+    filepath: str
+    duration: float
+    sample_rate: int
+    size: int
+    mtime: float
+    content_hash: str           # Empty until computed (see fill_hashes)
+    session: str
+    session_offset: Optional[float]
+    status: str
+
+
+def file_hash(filepath: str, chunk_size: int = 1 << 20) -> str:
+    """Returns the BLAKE2b hash of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlockManifest:
+    """
+    Metadata of the blocks in a recordings directory, kept in a SQLite file
+    inside that directory. Lets the block list be shown without opening any
+    audio file; `scan` brings it up to date with the files on disk.
+    """
+
+    def __init__(self, directory: str = RECORDINGS_DIR):
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(directory, MANIFEST_FILENAME), check_same_thread=False
+        )
+        self._conn.executescript(_SCHEMA)
+
+    def _row_to_info(self, row) -> BlockInfo:
+        return BlockInfo(os.path.join(self.directory, row[0]), *row[1:])
+
+    def entries(self) -> List[BlockInfo]:
+        """Returns all known blocks ordered by filename."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM blocks ORDER BY filename"
+            ).fetchall()
+        return [self._row_to_info(row) for row in rows]
+
+    def get(self, filepath: str) -> Optional[BlockInfo]:
+        """Returns a block's metadata, or None if it is not in the manifest."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM blocks WHERE filename = ?",
+                (os.path.basename(filepath),),
+            ).fetchone()
+        return self._row_to_info(row) if row else None
+
+    def record_block(
+        self,
+        filepath: str,
+        session: str = "",
+        session_offset: Optional[float] = None,
+        status: Optional[str] = None,
+        compute_hash: bool = True,
+    ) -> BlockInfo:
+        """
+        Reads a block file's metadata and stores it.
+        Session details and status are kept from the existing entry unless given.
+        With `compute_hash=False` only the header is read and the content hash
+        is left empty for `fill_hashes`.
+        """
+        previous = self.get(filepath)
+        if previous is not None:
+            session = session or previous.session
+            if session_offset is None:
+                session_offset = previous.session_offset
+            status = status or previous.status
+
+        stat = os.stat(filepath)
+        info = sf.info(filepath)
+        block = BlockInfo(
+            filepath=filepath,
+            duration=info.duration,
+            sample_rate=info.samplerate,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            content_hash=file_hash(filepath) if compute_hash else "",
+            session=session,
+            session_offset=session_offset,
+            status=status or STATUS_NEW,
+        )
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO blocks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (os.path.basename(filepath), *block[1:]),
+            )
+        return block
+
+    def set_status(self, filepath: str, status: str):
+        """Updates a block's transcription status."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE blocks SET status = ? WHERE filename = ?",
+                (status, os.path.basename(filepath)),
+            )
+
+    def remove(self, filepath: str):
+        """Removes a block from the manifest."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM blocks WHERE filename = ?", (os.path.basename(filepath),)
+            )
+
+    def scan(
+        self,
+        on_batch: Optional[Callable[[List[BlockInfo], List[str]], None]] = None,
+        batch_size: int = 64,
+    ) -> Tuple[List[BlockInfo], List[str]]:
+        """
+        Validates the manifest against the directory.
+        Files that are new or whose size or mtime changed are re-read (header
+        only; content hashes are left to `fill_hashes`), entries of missing
+        files are dropped and statuses follow the transcript sidecars.
+
+        Args:
+            on_batch: Called with (changed blocks, removed paths) every
+                `batch_size` changes, so results can be shown as they arrive
+
+        Returns:
+            (new or changed blocks, paths of removed blocks)
+        """
+        filenames = sorted(os.listdir(self.directory))
+        transcribed = {
+            filename[:-len(SIDECAR_SUFFIX)]
+            for filename in filenames
+            if filename.endswith(SIDECAR_SUFFIX)
+        }
+        known = {os.path.basename(info.filepath): info for info in self.entries()}
+        on_disk = {filename for filename in filenames if filename.endswith(".wav")}
+
+        # Removals need no file access, so they go out with the first batch
+        removed = []
+        for filename in sorted(set(known) - on_disk):
+            info = known.pop(filename)
+            self.remove(info.filepath)
+            removed.append(info.filepath)
+
+        changed: List[BlockInfo] = []
+        batch: List[BlockInfo] = []
+        batch_removed = list(removed)
+        for filename in sorted(on_disk):
+            filepath = os.path.join(self.directory, filename)
+            status = STATUS_TRANSCRIBED if filename[:-4] in transcribed else STATUS_NEW
+            previous = known.get(filename)
+            try:
+                stat = os.stat(filepath)
+                if (
+                    previous is None
+                    or previous.size != stat.st_size
+                    or previous.mtime != stat.st_mtime
+                ):
+                    batch.append(self.record_block(filepath, status=status, compute_hash=False))
+                elif previous.status != status:
+                    self.set_status(filepath, status)
+                    batch.append(previous._replace(status=status))
+            except (OSError, RuntimeError):
+                # Unreadable or still being written; picked up by the next scan
+                continue
+
+            if len(batch) >= batch_size:
+                changed.extend(batch)
+                if on_batch:
+                    on_batch(batch, batch_removed)
+                batch, batch_removed = [], []
+
+        changed.extend(batch)
+        if on_batch and (batch or batch_removed):
+            on_batch(batch, batch_removed)
+
+        return changed, removed
+
+    def fill_hashes(self) -> int:
+        """
+        Computes the content hashes that `scan` left empty.
+
+        Returns:
+            Number of hashes computed
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT filename, size, mtime FROM blocks WHERE content_hash = '' ORDER BY filename"
+            ).fetchall()
+
+        count = 0
+        for filename, size, mtime in rows:
+            filepath = os.path.join(self.directory, filename)
+            try:
+                digest = file_hash(filepath)
+            except OSError:
+                continue
+
+            # Only stored if the file was not replaced in the meantime
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE blocks SET content_hash = ? WHERE filename = ? AND size = ? AND mtime = ?",
+                    (digest, filename, size, mtime),
+                )
+            count += 1
+        return count
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._conn.close()
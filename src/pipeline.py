@@ -0,0 +1,352 @@
+import os
+import json
+import time
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import soundfile as sf
+
+from .config import TRANSCRIBE_CONCURRENCY, WATCH_QUEUE_SIZE
+from .compaction import compact_transcript
+from .gladia_service import GladiaService, format_transcript
+from .sidecar import save_sidecar, sidecar_path
+from .transcript import Transcript
+from .watcher import FolderWatcher
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".ogg", ".mp3", ".m4a")
+
+
+def collect_audio_files(inputs: Iterable[str]) -> List[str]:
+    """Expands files and directories into a sorted list of audio files."""
+    files = []
+    for path in inputs:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if name.lower().endswith(AUDIO_EXTENSIONS)
+            )
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            raise FileNotFoundError(f"Input not found: {path}")
+    return files
+
+
+def output_names(paths: List[str]) -> List[str]:
+    """
+    Returns the file name each input's outputs are named after. Inputs that
+    share a file name get their directory's name as a prefix ("a/x.wav" and
+    "b/x.wav" become "a_x.wav" and "b_x.wav"), plus a counter if that is
+    still ambiguous, so no output overwrites another.
+    """
+    counts = Counter(os.path.basename(path) for path in paths)
+    names: List[str] = []
+    used = set()
+    for path in paths:
+        name = os.path.basename(path)
+        if counts[name] > 1:
+            parent = os.path.basename(os.path.dirname(os.path.abspath(path))) or "root"
+            name = f"{parent}_{name}"
+
+        stem, extension = os.path.splitext(name)
+        candidate, number = name, 2
+        while candidate in used:
+            candidate = f"{stem}_{number}{extension}"
+            number += 1
+        used.add(candidate)
+        names.append(candidate)
+    return names
+
+
+def audio_duration(path: str) -> float:
+    """Returns an audio file's duration in seconds (0 if it cannot be read)."""
+    try:
+        return sf.info(path).duration
+    except Exception:
+        return 0.0
+
+
+@dataclass
+class FileResult:
+    """Outcome of transcribing one file."""
+
+    path: str
+    ok: bool
+    seconds: float
+    duration: float = 0.0
+    session_offset: float = 0.0
+    utterances: int = 0
+    transcript_path: str = ""
+    error: str = ""
+
+
+class BatchPipeline:
+    """
+    Headless version of the GUI's transcription flow, for servers.
+    Must not import tkinter or sounddevice (directly or through other modules).
+
+    Transcribes audio files in parallel and writes the results to a directory:
+    one `<name>.txt` and `<name>.transcript.json` per file (see
+    `output_names` for inputs sharing a name), a combined `transcript.txt`,
+    optional `notes.md` and a `summary.json` with timings.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        gladia_service: Optional[GladiaService] = None,
+        concurrency: int = TRANSCRIBE_CONCURRENCY,
+        language: str = "tr",
+        on_progress: Optional[Callable[[str], None]] = None,
+    ):
+        os.makedirs(output_dir, exist_ok=True)
+
+        self.output_dir = output_dir
+        self.gladia_service = gladia_service or GladiaService()
+        self.concurrency = concurrency
+        self.language = language
+        self.on_progress = on_progress
+
+    def progress(self, message: str):
+        """Reports a progress message to `on_progress`."""
+        if self.on_progress:
+            self.on_progress(message)
+
+    def transcribe_file(
+        self,
+        path: str,
+        session_offset: float = 0.0,
+        session: str = "",
+        output_name: Optional[str] = None,
+    ) -> Tuple[FileResult, Optional[Transcript]]:
+        """
+        Transcribes one file and writes its outputs, named after `output_name`
+        (default: the input's file name); errors are returned, not raised.
+        """
+        name = os.path.basename(path)
+        output_name = output_name or name
+        started = time.perf_counter()
+        try:
+            result = self.gladia_service.transcribe_file(
+                path,
+                language=self.language,
+                on_progress=lambda message: self.progress(f"{name}: {message}"),
+                session_offset=session_offset,
+            )
+
+            stem = os.path.splitext(output_name)[0]
+            transcript_path = os.path.join(self.output_dir, f"{stem}.txt")
+            with open(transcript_path, "w", encoding="utf-8") as f:
+                f.write(format_transcript(result))
+            save_sidecar(os.path.join(self.output_dir, output_name), result, session)
+
+            transcript = result["transcript"]
+            return FileResult(
+                path=path,
+                ok=True,
+                seconds=round(time.perf_counter() - started, 3),
+                duration=result.get("duration", 0.0),
+                session_offset=session_offset,
+                utterances=len(transcript),
+                transcript_path=transcript_path,
+            ), transcript
+
+        except Exception as e:
+            return FileResult(
+                path=path,
+                ok=False,
+                seconds=round(time.perf_counter() - started, 3),
+                session_offset=session_offset,
+                error=str(e),
+            ), None
+
+    def run(self, audio_files: List[str], notes: bool = False) -> Dict[str, Any]:
+        """
+        Runs the pipeline over `audio_files` (treated as one session, in order).
+
+        Returns:
+            Summary dictionary, also written to summary.json
+        """
+        session = datetime.now().strftime("%Y%m%d_%H%M%S")
+        started = time.perf_counter()
+
+        # Files continue each other within the session
+        offsets = []
+        elapsed = 0.0
+        for path in audio_files:
+            offsets.append(elapsed)
+            elapsed += audio_duration(path)
+
+        names = output_names(audio_files)
+        results: List[Optional[FileResult]] = [None] * len(audio_files)
+        transcripts: List[Optional[Transcript]] = [None] * len(audio_files)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as pool:
+            futures = {
+                pool.submit(self.transcribe_file, path, offsets[i], session, names[i]): i
+                for i, path in enumerate(audio_files)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                results[i], transcripts[i] = future.result()
+                state = "ok" if results[i].ok else f"error: {results[i].error}"
+                self.progress(f"[{done}/{len(audio_files)}] {names[i]}: {state}")
+
+        transcribe_seconds = time.perf_counter() - started
+        completed = [t for t in transcripts if t is not None]
+
+        combined_path = os.path.join(self.output_dir, "transcript.txt")
+        with open(combined_path, "w", encoding="utf-8") as f:
+            f.write("\n\n".join(
+                f"--- {name} ---\n{format_transcript(transcript)}"
+                for name, transcript in zip(names, transcripts)
+                if transcript is not None
+            ))
+
+        summary: Dict[str, Any] = {
+            "session": session,
+            "output_dir": self.output_dir,
+            "files": [asdict(result) for result in results],
+            "succeeded": len(completed),
+            "failed": len(audio_files) - len(completed),
+            "audio_seconds": round(elapsed, 3),
+            "transcribe_seconds": round(transcribe_seconds, 3),
+            "concurrency": self.concurrency,
+            "transcript_path": combined_path,
+        }
+
+        if notes and completed:
+            summary["notes"] = self.write_notes(completed)
+
+        summary["total_seconds"] = round(time.perf_counter() - started, 3)
+        with open(os.path.join(self.output_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        return summary
+
+    def write_notes(self, transcripts: List[Transcript], filename: str = "notes.md") -> Dict[str, Any]:
+        """Generates notes from the compacted transcripts; errors are returned, not raised."""
+        self.progress("Generating notes...")
+        started = time.perf_counter()
+        try:
+            # Imported here so transcription works without the Gemini client installed
+            from .gemini_service import GeminiService, save_notes_to_markdown
+
+            service = GeminiService()
+            compaction = compact_transcript(transcripts)
+            notes_path = os.path.join(self.output_dir, filename)
+            save_notes_to_markdown(service.generate_notes(compaction.text), notes_path)
+        except Exception as e:
+            return {"ok": False, "error": str(e), "seconds": round(time.perf_counter() - started, 3)}
+
+        return {
+            "ok": True,
+            "path": notes_path,
+            "seconds": round(time.perf_counter() - started, 3),
+            "compaction_ratio": round(compaction.ratio, 3),
+            "usage": service.usage.totals(),
+        }
+
+
+class WatchDaemon:
+    """
+    Continuously processes audio files dropped into a directory.
+
+    Ready files go into a bounded queue served by a fixed number of workers
+    (the pipeline's concurrency). When the queue is full the watcher waits,
+    so a burst of hundreds of files never creates more threads or requests.
+    Files that already have outputs are skipped. Each processed file is
+    appended to `summary.jsonl` in the output directory.
+    """
+
+    def __init__(
+        self,
+        pipeline: BatchPipeline,
+        directory: str,
+        notes: bool = False,
+        queue_size: int = WATCH_QUEUE_SIZE,
+    ):
+        self.pipeline = pipeline
+        self.notes = notes
+        self.queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=queue_size)
+        self.watcher = FolderWatcher(directory, self._enqueue, accept=self._accept)
+        self.processed = 0
+        self.failed = 0
+
+        self._workers: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._log_lock = threading.Lock()
+
+    def _accept(self, path: str) -> bool:
+        if not path.lower().endswith(AUDIO_EXTENSIONS):
+            return False
+        output = os.path.join(self.pipeline.output_dir, os.path.basename(path))
+        return not os.path.exists(sidecar_path(output))
+
+    def _enqueue(self, path: str):
+        # Blocks while the queue is full; that is the backpressure on the watcher
+        while not self._stop.is_set():
+            try:
+                self.queue.put(path, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _worker(self):
+        while True:
+            path = self.queue.get()
+            if path is None:
+                return
+
+            name = os.path.basename(path)
+            stem = os.path.splitext(name)[0]
+            result, transcript = self.pipeline.transcribe_file(path, session=stem)
+            record: Dict[str, Any] = asdict(result)
+            if self.notes and transcript is not None:
+                record["notes"] = self.pipeline.write_notes([transcript], f"{stem}.notes.md")
+
+            with self._log_lock:
+                if result.ok:
+                    self.processed += 1
+                else:
+                    self.failed += 1
+                with open(os.path.join(self.pipeline.output_dir, "summary.jsonl"), "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            state = "ok" if result.ok else f"error: {result.error}"
+            self.pipeline.progress(f"{name}: {state} ({self.queue.qsize()} waiting)")
+
+    def start(self) -> "WatchDaemon":
+        """Starts the workers and the folder watcher."""
+        for _ in range(max(1, self.pipeline.concurrency)):
+            worker = threading.Thread(target=self._worker, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        self.watcher.start()
+        return self
+
+    def stop(self):
+        """Stops watching and waits for the files already queued."""
+        self._stop.set()
+        self.watcher.stop()
+        for _ in self._workers:
+            self.queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
+    def run_forever(self):
+        """Runs until interrupted (Ctrl+C)."""
+        self.start()
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            self.pipeline.progress("Stopping...")
+        finally:
+            self.stop()
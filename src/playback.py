@@ -0,0 +1,144 @@
+import threading
+from typing import Callable, Optional
+
+import sounddevice as sd
+import soundfile as sf
+
+
+class PlaybackEngine:
+    """
+    Shared audio player for block files.
+
+    Audio is streamed from disk in the output stream's callback, so playback
+    starts immediately and memory use does not depend on the file length.
+    The position is counted in frames actually handed to the device.
+    Only one file plays at a time; starting another one stops the current one.
+    """
+
+    def __init__(self, on_finished: Optional[Callable[[str], None]] = None):
+        self.on_finished = on_finished
+        self.filepath: Optional[str] = None
+        self.paused = False
+
+        self._file: Optional[sf.SoundFile] = None
+        self._stream: Optional[sd.OutputStream] = None
+        self._position = 0
+        self._frames = 0
+        self._samplerate = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        """True while a file is loaded (playing or paused)."""
+        return self._stream is not None
+
+    @property
+    def position(self) -> float:
+        """Current position in seconds."""
+        with self._lock:
+            return self._position / self._samplerate if self._samplerate else 0.0
+
+    @property
+    def duration(self) -> float:
+        """Length of the current file in seconds."""
+        return self._frames / self._samplerate if self._samplerate else 0.0
+
+    @property
+    def progress(self) -> float:
+        """Current position as a fraction of the file length."""
+        with self._lock:
+            return self._position / self._frames if self._frames else 0.0
+
+    def play(self, filepath: str, start: float = 0.0):
+        """
+        Starts playing a file from `start` seconds.
+
+        Raises:
+            RuntimeError: If the file or the output device cannot be opened
+        """
+        self.stop()
+
+        audio_file = sf.SoundFile(filepath)
+        try:
+            stream = sd.OutputStream(
+                samplerate=audio_file.samplerate,
+                channels=audio_file.channels,
+                dtype="float32",
+                callback=self._callback,
+                finished_callback=self._on_stream_finished,
+            )
+        except Exception:
+            audio_file.close()
+            raise
+
+        with self._lock:
+            self._file = audio_file
+            self._stream = stream
+            self._frames = audio_file.frames
+            self._samplerate = audio_file.samplerate
+            self._position = 0
+            self.filepath = filepath
+            self.paused = False
+
+        if start > 0:
+            self.seek(start / self.duration if self.duration else 0.0)
+        stream.start()
+
+    def _callback(self, outdata, frames, time_info, status):
+        with self._lock:
+            if self.paused or self._file is None:
+                outdata.fill(0)
+                return
+
+            data = self._file.read(frames, dtype="float32", always_2d=True)
+            count = len(data)
+            outdata[:count] = data
+            self._position += count
+
+        if count < frames:
+            outdata[count:] = 0
+            raise sd.CallbackStop()
+
+    def _on_stream_finished(self):
+        with self._lock:
+            filepath = self.filepath
+            finished = self._frames and self._position >= self._frames
+        if finished and self.on_finished:
+            self.on_finished(filepath)
+
+    def seek(self, fraction: float):
+        """Moves the position to `fraction` (0-1) of the file."""
+        with self._lock:
+            if self._file is None:
+                return
+            frame = int(max(0.0, min(fraction, 1.0)) * self._frames)
+            self._position = self._file.seek(frame)
+
+    def pause(self):
+        """Pauses playback; the stream keeps running and outputs silence."""
+        self.paused = True
+
+    def resume(self):
+        """Resumes paused playback."""
+        self.paused = False
+
+    def toggle_pause(self):
+        """Pauses or resumes playback."""
+        self.paused = not self.paused
+
+    def stop(self):
+        """Stops playback and releases the file and the stream."""
+        with self._lock:
+            stream, audio_file = self._stream, self._file
+            self._stream = None
+            self._file = None
+            self.filepath = None
+            self.paused = False
+            self._position = 0
+            self._frames = 0
+
+        if stream is not None:
+            stream.abort()
+            stream.close()
+        if audio_file is not None:
+            audio_file.close()
@@ -0,0 +1,216 @@
+import time
+import threading
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from .config import GLADIA_RATE_LIMITS, GLADIA_MAX_CONCURRENCY
+
+
+class OperationCancelled(Exception):
+    """Raised when a wait or request is abandoned because its cancel event was set."""
+
+
+def check_cancelled(cancel: Optional[threading.Event]):
+    """Raises OperationCancelled if `cancel` is set."""
+    if cancel is not None and cancel.is_set():
+        raise OperationCancelled("Operation cancelled")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    Refills at `rate` tokens per second up to `capacity` and can be paused
+    entirely when the server asks us to back off.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def acquire(self, tokens: float = 1.0, cancel: Optional[threading.Event] = None):
+        """
+        Blocks until `tokens` are available, then consumes them.
+
+        Raises:
+            OperationCancelled: If `cancel` is set while waiting
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                else:
+                    wait = (tokens - self._tokens) / self.rate
+
+            if cancel is None:
+                time.sleep(wait)
+            elif cancel.wait(wait):
+                raise OperationCancelled("Operation cancelled")
+
+    def pause(self, seconds: float):
+        """Blocks all acquisitions for the given number of seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = 0.0
+            self._last_refill = now
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit with additive increase / multiplicative decrease.
+    The limit halves on every throttle signal and grows back by one slot
+    after `increase_after` consecutive successes.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        increase_after: int = 5,
+    ):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.increase_after = increase_after
+        self.limit = maximum
+        self.in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, cancel: Optional[threading.Event] = None):
+        """
+        Blocks until a slot is free under the current limit.
+
+        Raises:
+            OperationCancelled: If `cancel` is set while waiting
+        """
+        with self._cond:
+            while self.in_flight >= self.limit:
+                check_cancelled(cancel)
+                # Without a notification the cancel event is checked a few times a second
+                self._cond.wait(None if cancel is None else 0.2)
+            self.in_flight += 1
+
+    def release(self):
+        """Returns a slot."""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self):
+        """Records a successful request, growing the limit when due."""
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.increase_after and self.limit < self.maximum:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def on_throttle(self):
+        """Records a throttled request, shrinking the limit."""
+        with self._cond:
+            self.limit = max(self.minimum, self.limit // 2)
+            self._successes = 0
+
+
+class RateLimiter:
+    """
+    Shared client-side limiter for API calls.
+    Keeps a separate token bucket per request category (e.g. upload, start,
+    poll) and a single adaptive concurrency limit across all of them.
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, Tuple[float, float]]] = None,
+        max_concurrency: int = GLADIA_MAX_CONCURRENCY,
+    ):
+        budgets = budgets or GLADIA_RATE_LIMITS
+        self.buckets = {
+            category: TokenBucket(rate, burst)
+            for category, (rate, burst) in budgets.items()
+        }
+        self.concurrency = AdaptiveConcurrency(max_concurrency)
+
+    @contextmanager
+    def slot(self, category: str, cancel: Optional[threading.Event] = None) -> Iterator[None]:
+        """
+        Waits for a token in `category` and a free concurrency slot.
+
+        Raises:
+            OperationCancelled: If `cancel` is set while waiting
+        """
+        bucket = self.buckets.get(category)
+        if bucket:
+            bucket.acquire(cancel=cancel)
+
+        self.concurrency.acquire(cancel)
+        try:
+            yield
+        finally:
+            self.concurrency.release()
+
+    def on_success(self, category: str):
+        """Reports a successful (2xx) response."""
+        self.concurrency.on_success()
+
+    def on_server_error(self, category: str):
+        """
+        Reports a 5xx response. Shrinks the concurrency limit like a throttle,
+        as a failing server should get fewer requests, but does not pause
+        the category since no Retry-After was given.
+        """
+        self.concurrency.on_throttle()
+
+    def on_throttle(self, category: str, retry_after: float):
+        """Reports a 429 response; pauses the category for `retry_after` seconds."""
+        self.concurrency.on_throttle()
+        bucket = self.buckets.get(category)
+        if bucket:
+            bucket.pause(retry_after)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter() -> RateLimiter:
+    """Returns the process-wide limiter used by default by all services."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
@@ -0,0 +1,92 @@
+import re
+import math
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from .token_budget import estimate_tokens
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercases, strips diacritics and splits a text into word tokens."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return [word for word in _WORD_RE.findall(text) if len(word) > 1]
+
+
+def split_windows(transcript: str, window_lines: int, overlap: int) -> List[str]:
+    """
+    Splits a transcript into overlapping windows of consecutive lines.
+    Each transcript line is one utterance, so a window keeps a short stretch
+    of conversation together.
+    """
+    lines = [line for line in transcript.splitlines() if line.strip()]
+    step = max(1, window_lines - overlap)
+
+    windows = []
+    for start in range(0, len(lines), step):
+        windows.append("\n".join(lines[start:start + window_lines]))
+        if start + window_lines >= len(lines):
+            break
+    return windows
+
+
+class BM25Index:
+    """Okapi BM25 ranking over a fixed list of passages."""
+
+    def __init__(self, passages: List[str], k1: float = 1.5, b: float = 0.75):
+        self.passages = passages
+        self.k1 = k1
+        self.b = b
+
+        # term -> [(passage index, term frequency)]
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+
+        for index, passage in enumerate(passages):
+            terms = Counter(tokenize(passage))
+            self._lengths.append(sum(terms.values()))
+            for term, frequency in terms.items():
+                self._postings.setdefault(term, []).append((index, frequency))
+
+        self._average_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+
+    def _idf(self, term: str) -> float:
+        matches = len(self._postings.get(term, ()))
+        return math.log(1 + (len(self.passages) - matches + 0.5) / (matches + 0.5))
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """Returns (passage index, score) pairs for the best matching passages."""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+
+            idf = self._idf(term)
+            for index, frequency in postings:
+                norm = 1 - self.b + self.b * self._lengths[index] / self._average_length
+                scores[index] = scores.get(index, 0.0) + idf * (
+                    frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
+
+    def select(self, query: str, limit: int, max_tokens: int) -> List[str]:
+        """
+        Returns the best matching passages that fit in `max_tokens`,
+        in their original (transcript) order.
+        """
+        chosen = []
+        used = 0
+        for index, _ in self.search(query, limit):
+            tokens = estimate_tokens(self.passages[index])
+            if used + tokens > max_tokens:
+                continue
+            chosen.append(index)
+            used += tokens
+
+        return [self.passages[index] for index in sorted(chosen)]
@@ -0,0 +1,95 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional
+
+from .gemini_service import GeminiService
+
+
+class RollingNotes:
+    """
+    Incrementally maintained notes for a session.
+
+    Each transcribed block is folded into a compact rolling summary as soon as
+    it is added, so producing the final notes only needs one cheap merge over
+    that summary instead of a pass over the whole transcript. Updates run on a
+    single background worker, in the order blocks are added.
+    """
+
+    def __init__(self, service: GeminiService):
+        self.service = service
+        self.summary = ""
+        self.queued: List[str] = []
+        self.blocks: List[str] = []
+        self.failed: List[str] = []
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._generation = 0
+
+    def add_block(self, block_id: str, text: str) -> Future:
+        """Queues a block's transcript to be folded into the summary."""
+        with self._lock:
+            generation = self._generation
+            self.queued.append(block_id)
+            future = self._executor.submit(self._update, generation, block_id, text)
+            self._pending.append(future)
+            return future
+
+    def _update(self, generation: int, block_id: str, text: str):
+        try:
+            summary = self.service.update_rolling_summary(self.summary, text)
+        except Exception:
+            with self._lock:
+                if generation == self._generation:
+                    self.failed.append(block_id)
+            raise
+
+        with self._lock:
+            # Ignore updates that finish after a reset
+            if generation == self._generation:
+                self.summary = summary
+                self.blocks.append(block_id)
+
+    def wait(self, timeout: Optional[float] = None):
+        """Waits until all queued blocks have been folded in."""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result(timeout)
+            except Exception:
+                pass
+        with self._lock:
+            self._pending = [f for f in self._pending if not f.done()]
+
+    def covers(self, block_ids: Iterable[str]) -> bool:
+        """
+        Returns True if the summary holds exactly the given blocks (folded in or
+        being folded in without errors); a summary of more blocks would put
+        other blocks' content into the notes.
+        """
+        block_ids = set(block_ids)
+        with self._lock:
+            if self.failed or not block_ids:
+                return False
+            return block_ids == set(self.queued)
+
+    def finalize(self, regenerate: bool = False) -> str:
+        """Waits for pending updates and returns the final notes."""
+        self.wait()
+        return self.service.notes_from_rolling_summary(self.summary, regenerate)
+
+    def finalize_stream(self, regenerate: bool = False) -> Iterator[str]:
+        """Streaming variant of `finalize`."""
+        self.wait()
+        return self.service.notes_from_rolling_summary_stream(self.summary, regenerate)
+
+    def reset(self):
+        """Discards the current summary; in-flight updates are ignored."""
+        with self._lock:
+            self._generation += 1
+            self.summary = ""
+            self.queued = []
+            self.blocks = []
+            self.failed = []
+            self._pending = []
@@ -0,0 +1,153 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import List, NamedTuple, Optional
+
+from .config import SEARCH_INDEX_PATH
+from .transcript import Transcript
+
+
+class SearchHit(NamedTuple):
+    """A single utterance matching a search query."""
+
+    block_path: str
+    session: str
+    start: float
+    end: float
+    speaker: int
+    snippet: str
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    path TEXT PRIMARY KEY,
+    session TEXT NOT NULL,
+    session_offset REAL NOT NULL,
+    indexed_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS utterances (
+    id INTEGER PRIMARY KEY,
+    block_path TEXT NOT NULL,
+    session TEXT NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    speaker INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS utterances_block ON utterances(block_path, start);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS utterances_fts USING fts5(
+    text,
+    content='utterances',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS utterances_ai AFTER INSERT ON utterances BEGIN
+    INSERT INTO utterances_fts(rowid, text) VALUES (new.id, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS utterances_ad AFTER DELETE ON utterances BEGIN
+    INSERT INTO utterances_fts(utterances_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+class TranscriptIndex:
+    """
+    Full-text index over all transcribed blocks, backed by SQLite FTS5.
+    Blocks are (re)indexed individually as they finish, never rebuilt as a whole.
+    """
+
+    def __init__(self, db_path: str = SEARCH_INDEX_PATH):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def index_transcript(self, transcript: Transcript, session: str = ""):
+        """Indexes every block of `transcript`, replacing earlier entries for those blocks."""
+        with self._lock, self._conn:
+            for path, offset, first, last in transcript.blocks():
+                self._conn.execute("DELETE FROM utterances WHERE block_path = ?", (path,))
+                self._conn.executemany(
+                    "INSERT INTO utterances (block_path, session, start, end, speaker, text) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        (path, session, u.start, u.end, u.speaker, u.text)
+                        for u in transcript.iter_range(first, last)
+                    ),
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO blocks (path, session, session_offset, indexed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (path, session, offset, time.time()),
+                )
+
+    def remove_block(self, path: str):
+        """Removes a block from the index."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM utterances WHERE block_path = ?", (path,))
+            self._conn.execute("DELETE FROM blocks WHERE path = ?", (path,))
+
+    def search(self, query: str, limit: int = 50) -> List[SearchHit]:
+        """Returns the best matching utterances for a free-text query."""
+        match = _build_match_query(query)
+        if not match:
+            return []
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT u.block_path, u.session, u.start, u.end, u.speaker, "
+                "snippet(utterances_fts, 0, '[', ']', '…', 12) "
+                "FROM utterances_fts JOIN utterances u ON u.id = utterances_fts.rowid "
+                "WHERE utterances_fts MATCH ? ORDER BY rank LIMIT ?",
+                (match, limit),
+            ).fetchall()
+
+        return [SearchHit(*row) for row in rows]
+
+    def block_transcript(self, path: str) -> Optional[Transcript]:
+        """Rebuilds the transcript of an indexed block, or None if it is not indexed."""
+        with self._lock:
+            block = self._conn.execute(
+                "SELECT session_offset FROM blocks WHERE path = ?", (path,)
+            ).fetchone()
+            if block is None:
+                return None
+
+            rows = self._conn.execute(
+                "SELECT start, end, speaker, text FROM utterances "
+                "WHERE block_path = ? ORDER BY start",
+                (path,),
+            ).fetchall()
+
+        offset = block[0]
+        transcript = Transcript(path, offset)
+        for start, end, speaker, text in rows:
+            transcript.append(start - offset, end - offset, speaker, text)
+        return transcript
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _build_match_query(text: str) -> str:
+    """Turns free text into an FTS5 query: all terms required, last one as prefix."""
+    terms = re.findall(r"\w+", text)
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
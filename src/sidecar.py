@@ -0,0 +1,111 @@
+import os
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from .transcript import Transcript
+
+SIDECAR_SUFFIX = ".transcript.json"
+SIDECAR_VERSION = 1
+
+
+def sidecar_path(audio_path: str) -> str:
+    """Returns the sidecar path for an audio block (block.wav -> block.transcript.json)."""
+    return os.path.splitext(audio_path)[0] + SIDECAR_SUFFIX
+
+
+def save_sidecar(audio_path: str, result: Dict[str, Any], session: str = "") -> str:
+    """
+    Persists a parsed transcription result next to its audio file.
+    Written to a temporary file first so a crash never leaves a partial sidecar.
+    """
+    path = sidecar_path(audio_path)
+    data = {
+        "version": SIDECAR_VERSION,
+        "language": result.get("language", ""),
+        "duration": result.get("duration", 0),
+        "session": session,
+        "transcript": result["transcript"].to_dict(),
+    }
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+    return path
+
+
+def load_sidecar(audio_path: str) -> Optional[Dict[str, Any]]:
+    """Loads a sidecar as a result dictionary, or None if missing or unreadable."""
+    try:
+        with open(sidecar_path(audio_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("version") != SIDECAR_VERSION:
+        return None
+
+    transcript = Transcript.from_dict(data["transcript"])
+    transcript.set_block(audio_path, transcript.block_offsets[0])
+    return {
+        "full_text": transcript.full_text,
+        "transcript": transcript,
+        "language": data.get("language", ""),
+        "duration": data.get("duration", 0),
+        "session": data.get("session", ""),
+    }
+
+
+class TranscriptStore:
+    """
+    Per-block transcripts persisted as sidecars.
+    Transcripts are read from disk only on first access and cached afterwards.
+    """
+
+    def __init__(self):
+        self._cache: Dict[str, Transcript] = {}
+        self._lock = threading.Lock()
+
+    def save(self, audio_path: str, result: Dict[str, Any], session: str = ""):
+        """Stores a block's result in memory and on disk."""
+        save_sidecar(audio_path, result, session)
+        with self._lock:
+            self._cache[audio_path] = result["transcript"]
+
+    def get(self, audio_path: str) -> Optional[Transcript]:
+        """Returns a block's transcript, loading its sidecar if needed."""
+        with self._lock:
+            transcript = self._cache.get(audio_path)
+        if transcript is not None:
+            return transcript
+
+        result = load_sidecar(audio_path)
+        if result is None:
+            return None
+
+        with self._lock:
+            self._cache[audio_path] = result["transcript"]
+        return result["transcript"]
+
+    def has(self, audio_path: str) -> bool:
+        """Returns True if the block has a transcript, without loading it."""
+        with self._lock:
+            if audio_path in self._cache:
+                return True
+        return os.path.exists(sidecar_path(audio_path))
+
+    def discard(self, audio_path: str):
+        """Forgets a block's transcript and deletes its sidecar."""
+        with self._lock:
+            self._cache.pop(audio_path, None)
+        try:
+            os.remove(sidecar_path(audio_path))
+        except OSError:
+            pass
+
+    def clear_cache(self):
+        """Drops all loaded transcripts from memory (sidecars are kept)."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,96 @@
+import csv
+import json
+import time
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List
+
+from .config import GEMINI_PRICE_INPUT_PER_MTOK, GEMINI_PRICE_OUTPUT_PER_MTOK
+from .errors import InvalidInput
+
+
+class TokenBudgetExceeded(InvalidInput):
+    """Raised when a request is larger than the configured input budget."""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+def estimate_cost(input_tokens: int, output_tokens: int) -> float:
+    """Returns the estimated request cost in USD."""
+    return (
+        input_tokens * GEMINI_PRICE_INPUT_PER_MTOK
+        + output_tokens * GEMINI_PRICE_OUTPUT_PER_MTOK
+    ) / 1_000_000
+
+
+@dataclass
+class RequestUsage:
+    """Token usage, cost and latency of a single model request."""
+
+    kind: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    estimated: bool = False     # True when counts are local estimates
+    cached: bool = False        # True when served from the response cache
+    latency: float = 0.0
+    cost: float = 0.0
+    timestamp: float = field(default_factory=time.time)
+
+
+class UsageTracker:
+    """Aggregates request usage over a session."""
+
+    def __init__(self):
+        self.requests: List[RequestUsage] = []
+        self._lock = threading.Lock()
+
+    def record(self, usage: RequestUsage):
+        """Adds a request to the session totals."""
+        with self._lock:
+            self.requests.append(usage)
+
+    def totals(self) -> Dict[str, Any]:
+        """Returns aggregated counts for the session."""
+        with self._lock:
+            requests = list(self.requests)
+
+        sent = [r for r in requests if not r.cached]
+        return {
+            "requests": len(sent),
+            "cached_requests": len(requests) - len(sent),
+            "input_tokens": sum(r.input_tokens for r in sent),
+            "output_tokens": sum(r.output_tokens for r in sent),
+            "cost": round(sum(r.cost for r in sent), 6),
+            "latency": round(sum(r.latency for r in sent), 3),
+        }
+
+    def describe(self) -> str:
+        """Returns a short status-bar summary."""
+        totals = self.totals()
+        return (
+            f"{_short(totals['input_tokens'])} giriş / {_short(totals['output_tokens'])} çıkış token, "
+            f"~${totals['cost']:.4f}"
+        )
+
+    def export(self, output_path: str):
+        """Writes per-request usage and totals as JSON (or CSV for .csv paths)."""
+        with self._lock:
+            rows = [asdict(r) for r in self.requests]
+
+        if output_path.lower().endswith(".csv"):
+            with open(output_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(RequestUsage.__dataclass_fields__))
+                writer.writeheader()
+                writer.writerows(rows)
+            return
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump({"totals": self.totals(), "requests": rows}, f, indent=2)
+
+
+def _short(count: int) -> str:
+    return f"{count / 1000:.1f}k" if count >= 1000 else str(count)
@@ -0,0 +1,227 @@
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Utterance(NamedTuple):
+    """A single utterance with its session-absolute start and end times."""
+
+    start: float
+    end: float
+    speaker: int
+    text: str
+
+
+class Transcript:
+    """
+    Compact, columnar transcript.
+
+    Utterance times, speakers and text offsets live in flat typed arrays and
+    all utterance texts share one string buffer. Times are stored relative to
+    the block they came from; each block carries its offset within the
+    recording session, so merging blocks never rewrites the time columns.
+    """
+
+    __slots__ = (
+        "starts",
+        "ends",
+        "speakers",
+        "text_offsets",
+        "block_starts",
+        "block_offsets",
+        "block_paths",
+        "_parts",
+        "_buffer",
+        "_length",
+    )
+
+    def __init__(self, path: str = "", offset: float = 0.0):
+        self.starts = array("d")
+        self.ends = array("d")
+        self.speakers = array("i")
+        self.text_offsets = array("q", [0])
+
+        # Block table: first utterance index, session offset and file per block
+        self.block_starts = array("q", [0])
+        self.block_offsets = array("d", [offset])
+        self.block_paths: List[str] = [path]
+
+        self._parts: List[str] = []
+        self._buffer: Optional[str] = ""
+        self._length = 0
+
+    @classmethod
+    def from_utterances(
+        cls,
+        utterances: Iterable[Dict[str, Any]],
+        path: str = "",
+        offset: float = 0.0,
+    ) -> "Transcript":
+        """Builds a single-block transcript from Gladia-style utterance dicts."""
+        transcript = cls(path, offset)
+        for utterance in utterances:
+            transcript.append(
+                utterance.get("start", 0),
+                utterance.get("end", 0),
+                utterance.get("speaker", 0) or 0,
+                utterance.get("text", ""),
+            )
+        return transcript
+
+    @classmethod
+    def merge(cls, transcripts: Iterable["Transcript"]) -> "Transcript":
+        """Concatenates transcripts (in the given order) into a new one."""
+        merged = cls()
+        first = True
+        for transcript in transcripts:
+            if first:
+                merged.block_paths = []
+                merged.block_offsets = array("d")
+                merged.block_starts = array("q")
+                first = False
+            merged._extend(transcript)
+        return merged
+
+    def append(self, start: float, end: float, speaker: int, text: str):
+        """Appends an utterance (times relative to the last block)."""
+        text = text.strip()
+        self.starts.append(start)
+        self.ends.append(end)
+        self.speakers.append(int(speaker))
+        self._parts.append(text)
+        self._parts.append("\n")
+        self._length += len(text) + 1
+        self.text_offsets.append(self._length)
+        self._buffer = None
+
+    def _extend(self, other: "Transcript"):
+        """Appends all blocks of `other`."""
+        base_index = len(self.starts)
+        base_offset = self._length
+
+        for start, offset, path in zip(other.block_starts, other.block_offsets, other.block_paths):
+            self.block_starts.append(start + base_index)
+            self.block_offsets.append(offset)
+            self.block_paths.append(path)
+
+        self.starts.extend(other.starts)
+        self.ends.extend(other.ends)
+        self.speakers.extend(other.speakers)
+        self.text_offsets.extend(offset + base_offset for offset in other.text_offsets[1:])
+
+        self._parts.append(other.buffer)
+        self._length += len(other.buffer)
+        self._buffer = None
+
+    def set_block(self, path: str, offset: float):
+        """Sets the path and session offset of a single-block transcript."""
+        if len(self.block_paths) != 1:
+            raise ValueError("set_block is only valid for single-block transcripts")
+        self.block_paths[0] = path
+        self.block_offsets[0] = offset
+
+    @property
+    def buffer(self) -> str:
+        """All utterance texts, newline-terminated, in one string."""
+        if self._buffer is None:
+            self._buffer = "".join(self._parts)
+            self._parts = [self._buffer]
+        return self._buffer
+
+    @property
+    def full_text(self) -> str:
+        """All utterance texts joined by spaces."""
+        return self.buffer.replace("\n", " ").strip()
+
+    @property
+    def duration(self) -> float:
+        """Session-absolute end time of the last utterance."""
+        if not self.starts:
+            return 0.0
+        # Trailing blocks may be empty; use the block that owns the last utterance
+        return self.ends[-1] + self.block_offsets[self._block_of(len(self.starts) - 1)]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _block_of(self, index: int) -> int:
+        return bisect_right(self.block_starts, index) - 1
+
+    def text_at(self, index: int) -> str:
+        """Returns the text of utterance `index`."""
+        buffer = self.buffer
+        return buffer[self.text_offsets[index]:self.text_offsets[index + 1] - 1]
+
+    def __getitem__(self, index: int) -> Utterance:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("utterance index out of range")
+
+        offset = self.block_offsets[self._block_of(index)]
+        return Utterance(
+            self.starts[index] + offset,
+            self.ends[index] + offset,
+            self.speakers[index],
+            self.text_at(index),
+        )
+
+    def __iter__(self) -> Iterator[Utterance]:
+        for _, _, first, last in self.blocks():
+            yield from self.iter_range(first, last)
+
+    def iter_range(self, first: int, last: int) -> Iterator[Utterance]:
+        """Yields utterances `first`..`last` (exclusive) of a single block."""
+        buffer = self.buffer
+        offsets = self.text_offsets
+        offset = self.block_offsets[self._block_of(first)] if first < last else 0.0
+        for i in range(first, last):
+            yield Utterance(
+                self.starts[i] + offset,
+                self.ends[i] + offset,
+                self.speakers[i],
+                buffer[offsets[i]:offsets[i + 1] - 1],
+            )
+
+    def blocks(self) -> Iterator[Tuple[str, float, int, int]]:
+        """Yields (path, session offset, first index, end index) per block."""
+        count = len(self.block_starts)
+        for b in range(count):
+            last = self.block_starts[b + 1] if b + 1 < count else len(self)
+            yield self.block_paths[b], self.block_offsets[b], self.block_starts[b], last
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes a single-block transcript into compact columnar form."""
+        return {
+            "path": self.block_paths[0],
+            "offset": self.block_offsets[0],
+            "starts": [round(t, 3) for t in self.starts],
+            "ends": [round(t, 3) for t in self.ends],
+            "speakers": self.speakers.tolist(),
+            "text_offsets": self.text_offsets.tolist(),
+            "text": self.buffer,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Transcript":
+        """Rebuilds a single-block transcript produced by `to_dict`."""
+        transcript = cls(data.get("path", ""), data.get("offset", 0.0))
+        transcript.starts = array("d", data["starts"])
+        transcript.ends = array("d", data["ends"])
+        transcript.speakers = array("i", data["speakers"])
+        transcript.text_offsets = array("q", data["text_offsets"])
+        transcript._buffer = data["text"]
+        transcript._parts = [transcript._buffer]
+        transcript._length = len(transcript._buffer)
+        return transcript
+
+    def iter_blocks(self) -> Iterator[Tuple[str, Iterator[Utterance]]]:
+        """Yields (path, utterances) per block."""
+        for path, _, first, last in self.blocks():
+            yield path, self.iter_range(first, last)
+
+
+def format_timestamp(seconds: float) -> str:
+    """Formats seconds as HH:MM:SS."""
+    total = int(seconds)
+    return f"{total // 3600:02d}:{(total % 3600) // 60:02d}:{total % 60:02d}"
@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from .config import UI_FRAME_MS
+
+
+class UIDispatcher:
+    """
+    Hands UI updates from worker threads to the UI thread once per frame.
+
+    Updates posted with a key replace any pending update with the same key
+    (last value wins, applied in the position of the last post), so a burst
+    of progress messages costs one redraw per frame. Calls made with `call`
+    are never dropped. Everything runs in the order it was posted.
+    `schedule` is the toolkit's timer function, e.g. a Tk widget's `after`.
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        interval_ms: int = UI_FRAME_MS,
+    ):
+        self.schedule = schedule
+        self.interval_ms = interval_ms
+        self.peak_depth = 0
+        self.posted = 0
+        self.coalesced = 0
+
+        # Calls get a unique key, so keyed updates and calls share one order
+        self._pending: "OrderedDict[Hashable, Tuple[Callable, tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._running = False
+
+    @property
+    def depth(self) -> int:
+        """Number of updates waiting for the next frame."""
+        with self._lock:
+            return len(self._pending)
+
+    def post(self, key: Hashable, callback: Callable, *args):
+        """Schedules `callback(*args)`, replacing a pending update with the same key."""
+        with self._lock:
+            self.posted += 1
+            if self._pending.pop(key, None) is not None:
+                self.coalesced += 1
+            self._pending[key] = (callback, args)
+            self._track_depth()
+
+    def call(self, callback: Callable, *args):
+        """Schedules `callback(*args)` without coalescing."""
+        with self._lock:
+            self.posted += 1
+            self._pending[object()] = (callback, args)
+            self._track_depth()
+
+    def _track_depth(self):
+        if len(self._pending) > self.peak_depth:
+            self.peak_depth = len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns queue depth and coalescing counters."""
+        with self._lock:
+            return {
+                "depth": len(self._pending),
+                "peak_depth": self.peak_depth,
+                "posted": self.posted,
+                "coalesced": self.coalesced,
+            }
+
+    def start(self):
+        """Starts draining; must be called on the UI thread."""
+        if not self._running:
+            self._running = True
+            self.schedule(self.interval_ms, self._drain)
+
+    def stop(self):
+        """Stops draining after the current frame."""
+        self._running = False
+
+    def _drain(self):
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+
+        for callback, args in pending.values():
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"UI update error: {e}")
+
+        if self._running:
+            self.schedule(self.interval_ms, self._drain)
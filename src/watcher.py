@@ -0,0 +1,137 @@
+import os
+import time
+import threading
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from .config import WATCH_POLL_SECONDS, WATCH_SETTLE_SECONDS
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # Optional; without it the directory is polled
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "FolderWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.watcher.touch(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher.touch(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.watcher.touch(event.dest_path)
+
+
+class FolderWatcher:
+    """
+    Reports files that appear in a directory once they are fully written.
+
+    File system events (via the optional `watchdog` package) or periodic
+    directory listings mark candidate files; a candidate is reported when its
+    size and mtime have not changed for `settle_seconds`. `on_ready` is called
+    from the watcher thread and may block, which pauses detection (backpressure)
+    without losing files.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        on_ready: Callable[[str], None],
+        accept: Callable[[str], bool] = lambda path: True,
+        settle_seconds: float = WATCH_SETTLE_SECONDS,
+        poll_interval: float = WATCH_POLL_SECONDS,
+        use_events: bool = True,
+    ):
+        self.directory = directory
+        self.on_ready = on_ready
+        self.accept = accept
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self.use_events = use_events and Observer is not None
+
+        # path -> (size, mtime, time the file was last seen changing)
+        self._candidates: Dict[str, Tuple[int, float, float]] = {}
+        self._reported: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+
+    def touch(self, path: str):
+        """Marks a file as possibly new; files already reported are ignored."""
+        if not self.accept(path):
+            return
+        with self._lock:
+            if path not in self._candidates and path not in self._reported:
+                self._candidates[path] = (-1, 0.0, time.monotonic())
+
+    def _scan(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            self.touch(os.path.join(self.directory, name))
+
+    def _settled(self) -> list:
+        """Returns candidates whose size and mtime stopped changing."""
+        now = time.monotonic()
+        ready = []
+        with self._lock:
+            for path, (size, mtime, changed_at) in list(self._candidates.items()):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    del self._candidates[path]
+                    continue
+
+                if (stat.st_size, stat.st_mtime) != (size, mtime):
+                    self._candidates[path] = (stat.st_size, stat.st_mtime, now)
+                elif stat.st_size > 0 and now - changed_at >= self.settle_seconds:
+                    del self._candidates[path]
+                    self._reported.add(path)
+                    ready.append(path)
+        return sorted(ready)
+
+    def _run(self):
+        self._scan()
+        while not self._stop.wait(self.poll_interval):
+            if not self.use_events:
+                self._scan()
+
+            for path in self._settled():
+                if self._stop.is_set():
+                    return
+                self.on_ready(path)
+
+    def start(self) -> "FolderWatcher":
+        """Starts watching in the background."""
+        os.makedirs(self.directory, exist_ok=True)
+
+        if self.use_events:
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self), self.directory, recursive=False)
+            self._observer.start()
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops watching."""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        if self._thread is not None:
+            self._thread.join()
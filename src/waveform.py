@@ -0,0 +1,198 @@
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+import numpy as np
+import soundfile as sf
+
+from .config import WAVEFORM_BUCKET_FRAMES, WAVEFORM_ZOOM_FACTOR
+
+PEAKS_SUFFIX = ".peaks.npy"
+
+
+def peaks_path(audio_path: str) -> str:
+    """Returns the peaks file of an audio block (block.wav -> block.peaks.npy)."""
+    return os.path.splitext(audio_path)[0] + PEAKS_SUFFIX
+
+
+def level_lengths(base_length: int, factor: int = WAVEFORM_ZOOM_FACTOR) -> List[int]:
+    """Returns the number of buckets per zoom level, finest first."""
+    lengths = [base_length]
+    while lengths[-1] > 1:
+        lengths.append(-(-lengths[-1] // factor))
+    return lengths
+
+
+def _bucket_peaks(mono: np.ndarray, bucket: int) -> np.ndarray:
+    """Returns (min, max) pairs of consecutive `bucket`-sample groups."""
+    starts = np.arange(0, len(mono), bucket)
+    return np.stack(
+        [np.minimum.reduceat(mono, starts), np.maximum.reduceat(mono, starts)],
+        axis=1,
+    )
+
+
+def _reduce(peaks: np.ndarray, factor: int) -> np.ndarray:
+    starts = np.arange(0, len(peaks), factor)
+    return np.stack(
+        [np.minimum.reduceat(peaks[:, 0], starts), np.maximum.reduceat(peaks[:, 1], starts)],
+        axis=1,
+    )
+
+
+def _to_mono(audio: np.ndarray) -> np.ndarray:
+    return audio.mean(axis=1) if audio.ndim > 1 else audio
+
+
+def build_pyramid(base: np.ndarray, factor: int = WAVEFORM_ZOOM_FACTOR) -> np.ndarray:
+    """
+    Builds all zoom levels from the finest (min, max) level and returns them
+    concatenated, finest first, quantized to int8.
+    """
+    levels = [base]
+    while len(levels[-1]) > 1:
+        levels.append(_reduce(levels[-1], factor))
+    pyramid = np.concatenate(levels) if len(base) else np.zeros((0, 2))
+    return np.clip(np.round(pyramid * 127), -127, 127).astype(np.int8)
+
+
+def peaks_from_array(audio: np.ndarray, bucket: int = WAVEFORM_BUCKET_FRAMES) -> np.ndarray:
+    """Computes the peak pyramid of audio already in memory (e.g. while recording)."""
+    return build_pyramid(_bucket_peaks(_to_mono(audio).astype(np.float32), bucket))
+
+
+def peaks_from_file(audio_path: str, bucket: int = WAVEFORM_BUCKET_FRAMES) -> np.ndarray:
+    """Computes the peak pyramid of an audio file in one streaming pass."""
+    parts = []
+    # Block size is a multiple of the bucket so buckets never straddle reads
+    for chunk in sf.blocks(audio_path, blocksize=bucket * 1024, dtype="float32", always_2d=True):
+        parts.append(_bucket_peaks(_to_mono(chunk), bucket))
+    base = np.concatenate(parts) if parts else np.zeros((0, 2), dtype=np.float32)
+    return build_pyramid(base)
+
+
+def save_peaks(audio_path: str, pyramid: np.ndarray) -> str:
+    """Writes a peak pyramid next to its audio file."""
+    path = peaks_path(audio_path)
+    tmp_path = f"{path}.tmp.npy"
+    np.save(tmp_path, pyramid)
+    os.replace(tmp_path, path)
+    return path
+
+
+class WaveformPeaks:
+    """Memory-mapped peak pyramid of one block."""
+
+    def __init__(self, pyramid: np.ndarray):
+        self.pyramid = pyramid
+        self.levels: List[np.ndarray] = []
+
+        # Level sizes follow from the finest level's length; find it from the total
+        low, high = 0, len(pyramid)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if sum(level_lengths(middle)) <= len(pyramid):
+                low = middle
+            else:
+                high = middle - 1
+
+        offset = 0
+        for length in level_lengths(low) if low else []:
+            self.levels.append(pyramid[offset:offset + length])
+            offset += length
+
+    @classmethod
+    def load(cls, audio_path: str) -> Optional["WaveformPeaks"]:
+        """Opens a block's peaks file, or returns None if it is missing or unreadable."""
+        try:
+            return cls(np.load(peaks_path(audio_path), mmap_mode="r"))
+        except (OSError, ValueError):
+            return None
+
+    def strip(self, width: int) -> np.ndarray:
+        """
+        Returns `width` (min, max) pairs in -1..1 covering the whole block,
+        read from the coarsest level that still has enough detail.
+        """
+        if not self.levels or width <= 0:
+            return np.zeros((0, 2), dtype=np.float32)
+
+        level = self.levels[0]
+        for candidate in self.levels:
+            if len(candidate) < width:
+                break
+            level = candidate
+
+        level = np.asarray(level, dtype=np.float32) / 127
+        if len(level) <= width:
+            return level
+
+        starts = (np.arange(width) * len(level)) // width
+        return np.stack(
+            [np.minimum.reduceat(level[:, 0], starts), np.maximum.reduceat(level[:, 1], starts)],
+            axis=1,
+        )
+
+
+class WaveformLoader:
+    """
+    Loads (and computes, when missing) block peaks on a background thread.
+    Callbacks run on the loader thread with (audio path, peaks or None).
+    """
+
+    def __init__(self, max_cached: int = 256):
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, WaveformPeaks]" = OrderedDict()
+        self._callbacks = {}
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._lock = threading.Lock()
+        threading.Thread(target=self._worker, daemon=True).start()
+
+    def get(self, audio_path: str) -> Optional[WaveformPeaks]:
+        """Returns already loaded peaks without blocking."""
+        with self._lock:
+            peaks = self._cache.get(audio_path)
+            if peaks is not None:
+                self._cache.move_to_end(audio_path)
+            return peaks
+
+    def request(self, audio_path: str, callback: Callable[[str, Optional[WaveformPeaks]], None]):
+        """Queues a block's peaks to be loaded; `callback` is called when done."""
+        with self._lock:
+            pending = audio_path in self._callbacks
+            self._callbacks.setdefault(audio_path, []).append(callback)
+        if not pending:
+            self._queue.put(audio_path)
+
+    def discard(self, audio_path: str):
+        """Forgets a block's peaks and deletes its peaks file."""
+        with self._lock:
+            self._cache.pop(audio_path, None)
+        try:
+            os.remove(peaks_path(audio_path))
+        except OSError:
+            pass
+
+    def _worker(self):
+        while True:
+            audio_path = self._queue.get()
+
+            peaks = WaveformPeaks.load(audio_path)
+            if peaks is None:
+                try:
+                    save_peaks(audio_path, peaks_from_file(audio_path))
+                    peaks = WaveformPeaks.load(audio_path)
+                except Exception as e:
+                    print(f"Waveform error: {e}")
+
+            with self._lock:
+                if peaks is not None:
+                    self._cache[audio_path] = peaks
+                    while len(self._cache) > self.max_cached:
+                        self._cache.popitem(last=False)
+                callbacks = self._callbacks.pop(audio_path, [])
+
+            for callback in callbacks:
+                callback(audio_path, peaks)